@@ -0,0 +1,227 @@
+# PXstats • aggregates.py • v5.1
+# Incrementele rolling-window tellers voor /summary.
+#
+# - Ring buffer met één bucket per minuut (default 24h = 1440 buckets)
+# - add() werkt de bucket + lopende totalen bij in O(1)
+# - verlopen buckets worden afgetrokken zodra de tijd vooruit gaat
+# - totals() kost O(verlopen minuten), onafhankelijk van de historiek
+# - totals(minutes=N) / latest(minutes=N): korter venster, O(N) buckets
+# - Snapshot: bevroren totals/latest, onder utils._LOCK genomen, zodat
+#   een render in een worker-thread de live tellers niet leest
+
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+# Tellers die build_embed nodig heeft (vaste volgorde = index in bucket)
+KEYS = (
+    "wild", "incense", "lure",           # Encounter per source
+    "quest", "raid", "rocket", "max", "fled",
+    "hatch", "catches", "shinies", "perfect",
+)
+_IDX = {k: i for i, k in enumerate(KEYS)}
+
+_TYPE_KEY = {
+    "Quest": "quest",
+    "Raid": "raid",
+    "Rocket": "rocket",
+    "MaxBattle": "max",
+    "Fled": "fled",
+    "Hatch": "hatch",
+    "Catch": "catches",
+}
+_SOURCE_KEY = {"wild": "wild", "incense": "incense", "lure": "lure"}
+
+
+def is_perfect(iv) -> bool:
+    return bool(iv) and len(iv) == 3 and iv[0] == 15 and iv[1] == 15 and iv[2] == 15
+
+
+def event_keys(e: Dict[str, Any]) -> List[int]:
+    """Bucket-indexen die dit event ophoogt."""
+    etype = e.get("type")
+    out: List[int] = []
+    if etype == "Encounter":
+        k = _SOURCE_KEY.get(e.get("source"))
+        if k:
+            out.append(_IDX[k])
+    elif etype in _TYPE_KEY:
+        out.append(_IDX[_TYPE_KEY[etype]])
+
+    if etype == "Catch":
+        if e.get("shiny"):
+            out.append(_IDX["shinies"])
+        if is_perfect(e.get("iv")):
+            out.append(_IDX["perfect"])
+    return out
+
+
+class RollingAggregator:
+    """Per-minuut tellers over een glijdend venster."""
+
+    def __init__(self, window_minutes: int = 24 * 60, latest: int = 32):
+        self.window = window_minutes
+        self._latest_n = latest
+        self.reset()
+
+    def reset(self):
+        window_minutes, latest = self.window, self._latest_n
+        self._minute = [-1] * window_minutes          # welke minuut zit in slot i
+        self._buckets = [[0] * len(KEYS) for _ in range(window_minutes)]
+        self._totals = [0] * len(KEYS)
+        self._head: Optional[int] = None              # laatst verwerkte minuut
+
+        # laatste catches / shinies / 100 IV (invoegvolgorde)
+        self.latest_catches: Deque[Dict[str, Any]] = deque(maxlen=latest)
+        self.latest_shinies: Deque[Dict[str, Any]] = deque(maxlen=latest)
+        self.latest_perfect: Deque[Dict[str, Any]] = deque(maxlen=latest)
+
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _minute_of(ts) -> int:
+        if isinstance(ts, datetime):
+            ts = ts.timestamp()
+        return int(ts // 60)
+
+    def _expire(self, now_min: int):
+        """Schuif het venster op tot now_min en trek verlopen buckets af."""
+        if self._head is not None and now_min <= self._head:
+            return
+        start = now_min - self.window + 1
+        if self._head is not None:
+            # enkel slots die sinds de vorige head opnieuw gebruikt worden
+            first = max(self._head + 1, now_min - self.window + 1)
+            minutes = range(first, now_min + 1)
+        else:
+            minutes = range(start, now_min + 1)
+        for m in minutes:
+            slot = m % self.window
+            old = self._minute[slot]
+            if old != -1 and old < start:
+                bucket = self._buckets[slot]
+                for i, v in enumerate(bucket):
+                    if v:
+                        self._totals[i] -= v
+                        bucket[i] = 0
+                self._minute[slot] = -1
+        self._head = now_min
+
+    def _cutoff_min(self, now_min: int) -> int:
+        return now_min - self.window + 1
+
+    # ---------------------------------------------------------
+
+    def add(self, e: Dict[str, Any], now: Optional[float] = None):
+        ts = e.get("timestamp")
+        if ts is None:
+            return
+        now_min = self._minute_of(now if now is not None else datetime.now().timestamp())
+        self._expire(now_min)
+
+        m = self._minute_of(ts)
+        if m < self._cutoff_min(now_min):
+            return                      # al buiten het venster
+        m = min(m, now_min)             # klok-scheefheid: toekomst = nu
+
+        slot = m % self.window
+        if self._minute[slot] != m:
+            self._minute[slot] = m
+        bucket = self._buckets[slot]
+        for i in event_keys(e):
+            bucket[i] += 1
+            self._totals[i] += 1
+
+        if e.get("type") == "Catch":
+            self.latest_catches.append(e)
+            if e.get("shiny"):
+                self.latest_shinies.append(e)
+            if is_perfect(e.get("iv")):
+                self.latest_perfect.append(e)
+
+    def remove(self, e: Dict[str, Any], now: Optional[float] = None):
+        """Event terug aftrekken (bvb. bij een ge-edit embed)."""
+        ts = e.get("timestamp")
+        if ts is None:
+            return
+        now_min = self._minute_of(now if now is not None else datetime.now().timestamp())
+        self._expire(now_min)
+
+        m = min(self._minute_of(ts), now_min)
+        slot = m % self.window
+        if m < self._cutoff_min(now_min) or self._minute[slot] != m:
+            return
+        bucket = self._buckets[slot]
+        for i in event_keys(e):
+            if bucket[i] > 0:
+                bucket[i] -= 1
+                self._totals[i] -= 1
+
+        key = e.get("key")
+        for dq in (self.latest_catches, self.latest_shinies, self.latest_perfect):
+            for x in list(dq):
+                if x is e or (key is not None and x.get("key") == key):
+                    dq.remove(x)
+
+    def totals(self, now: Optional[float] = None, minutes: Optional[int] = None) -> Dict[str, int]:
+        """Tellers over het hele venster, of enkel de laatste `minutes` minuten."""
+        now_min = self._minute_of(now if now is not None else datetime.now().timestamp())
+        self._expire(now_min)
+        if minutes is None or minutes >= self.window:
+            return dict(zip(KEYS, self._totals))
+
+        out = [0] * len(KEYS)
+        for m in range(now_min - max(minutes, 0) + 1, now_min + 1):
+            slot = m % self.window
+            if self._minute[slot] == m:
+                for i, v in enumerate(self._buckets[slot]):
+                    out[i] += v
+        return dict(zip(KEYS, out))
+
+    def latest(
+        self,
+        which: str,
+        n: int = 5,
+        now: Optional[float] = None,
+        minutes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Laatste n events uit 'catches' / 'shinies' / 'perfect' binnen het venster."""
+        now_min = self._minute_of(now if now is not None else datetime.now().timestamp())
+        cutoff = self._cutoff_min(now_min)
+        if minutes is not None:
+            cutoff = max(cutoff, now_min - minutes + 1)
+        src = getattr(self, f"latest_{which}")
+        return [e for e in src if self._minute_of(e["timestamp"]) >= cutoff][-n:]
+
+
+LATEST = ("catches", "shinies", "perfect")
+
+
+class Snapshot:
+    """
+    Kopie van totals() + latest() van een aggregator (zelfde interface).
+    totals() en latest() van de live aggregators muteren (_expire) of
+    itereren deques: enkel onder de lock lezen, daarna deze kopie.
+    """
+
+    def __init__(self, totals: Dict[str, int], latest: Dict[str, List[Dict[str, Any]]]):
+        self._totals = totals
+        self._latest = latest
+
+    @classmethod
+    def of(cls, agg, n: int = 5, now: Optional[float] = None) -> "Snapshot":
+        return cls(agg.totals(now), {w: list(agg.latest(w, n, now=now)) for w in LATEST})
+
+    def totals(self, now: Optional[float] = None) -> Dict[str, int]:
+        return dict(self._totals)
+
+    def latest(self, which: str, n: int = 5, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        return self._latest[which][-n:]
+
+
+def aggregate(events, now: Optional[float] = None) -> RollingAggregator:
+    """Eenmalig een aggregator opbouwen uit een lijst events."""
+    agg = RollingAggregator()
+    for e in events:
+        agg.add(e, now=now)
+    return agg
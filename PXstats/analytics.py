@@ -0,0 +1,366 @@
+# PXstats • analytics.py • v6.0
+# Gevectoriseerde IV- en vangst-analyses voor /ivstats (NumPy).
+#
+# Kolommen, één keer gematerialiseerd en daarna incrementeel aangevuld:
+#   ts     float64     epoch-seconden
+#   type   uint8       code uit columnar.TYPES
+#   kind   uint8       encounter-soort (KINDS), 0 = geen encounter
+#   name   uint32      species-code (enkel gelijkheid telt)
+#   iv     int8 (n,3)  atk/def/sta, -1 = geen IV
+#   shiny  bool
+#
+# - nieuwe rijen achteraan (live ingest) → enkel die rijen omzetten en
+#   achter de bestaande arrays plakken; al het andere (laat event, edit,
+#   retentie, load) verhoogt utils.rewrite_version() → volledige rebuild
+# - columnar layout: rebuild = np.frombuffer op de kolommen (memcpy)
+# - per query: searchsorted op ts, daarna bincount/percentile/argsort
+#   over het venster, geen Python-loop per event
+#
+# Analyses:
+#   IV-som histogram (0..45) en percentielen van IV% (gevangen, met IV)
+#   vangstratio per encounter-soort: een Catch/Fled telt voor de laatste
+#   encounter van dezelfde species binnen PAIR_WINDOW seconden
+#   heatmap weekdag × uur (lokale tijd) van encounters en catches
+#
+# NumPy is optioneel: zonder numpy rekent ivstats_py() hetzelfde uit met een
+# gewone loop (ook de referentie in benchmarks/bench_analytics.py).
+
+import os
+import threading
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optioneel: zonder numpy valt /ivstats terug op ivstats_py
+    np = None
+
+HAVE_NUMPY = np is not None
+
+from PXstats.columnar import TYPES, ColumnarEvents
+
+KINDS = (None, "wild", "incense", "lure", "quest", "raid", "rocket", "max")
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+PAIR_WINDOW = float(os.getenv("PX_ANALYTICS_PAIR_S", "1800"))
+
+_TYPE_CODE = {t: i for i, t in enumerate(TYPES) if t}
+_CATCH = _TYPE_CODE["Catch"]
+_FLED = _TYPE_CODE["Fled"]
+_KIND_OF_TYPE = {"Quest": 4, "Raid": 5, "Rocket": 6, "MaxBattle": 7}
+_KIND_OF_SOURCE = {"wild": 1, "incense": 2, "lure": 3}
+
+
+def _kind(etype: Optional[str], source: Optional[str]) -> int:
+    if etype == "Encounter":
+        return _KIND_OF_SOURCE.get(source, 1)     # parser: default wild
+    return _KIND_OF_TYPE.get(etype, 0)
+
+
+def _percentile(sorted_vals: List[float], p: float) -> float:
+    """Lineaire interpolatie, zelfde definitie als np.percentile (default)."""
+    pos = p / 100 * (len(sorted_vals) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+
+class IVStats:
+    """Resultaat van een /ivstats-query."""
+
+    def __init__(self):
+        self.events = 0
+        self.catches = 0
+        self.with_iv = 0            # catches met IV
+        self.shinies = 0            # shiny catches
+        self.perfect = 0            # 15/15/15
+        self.hist = [0] * 46        # catches per IV-som
+        self.mean: Optional[float] = None
+        self.percentiles: Dict[int, float] = {}
+        # soort → [encounters, gevangen, gevlucht] (gekoppeld via PAIR_WINDOW)
+        self.kinds: Dict[str, List[int]] = {k: [0, 0, 0] for k in KINDS[1:]}
+        self.heat_enc = [[0] * 24 for _ in range(7)]     # [weekdag][uur], maandag = 0
+        self.heat_catch = [[0] * 24 for _ in range(7)]
+
+    def catch_rate(self, kind: str) -> Optional[float]:
+        enc, caught, _ = self.kinds[kind]
+        return caught / enc if enc else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "events": self.events,
+            "catches": self.catches,
+            "with_iv": self.with_iv,
+            "shinies": self.shinies,
+            "perfect": self.perfect,
+            "hist": self.hist,
+            "mean": self.mean,
+            "percentiles": self.percentiles,
+            "kinds": self.kinds,
+            "heat_enc": self.heat_enc,
+            "heat_catch": self.heat_catch,
+        }
+
+
+# =========================================================
+# Pure Python (fallback + benchmark-referentie)
+# =========================================================
+
+def ivstats_py(events: Iterable[Any], tz) -> IVStats:
+    """Zelfde analyses met één loop over chronologische event-dicts."""
+    out = IVStats()
+    sums: List[int] = []
+    last: Dict[Any, Tuple[int, float]] = {}
+    for e in events:
+        ts = e.get("timestamp")
+        if not isinstance(ts, datetime):
+            continue
+        t = ts.timestamp()
+        etype = e.get("type")
+        name = e.get("name")
+        out.events += 1
+        k = _kind(etype, e.get("source"))
+        local = datetime.fromtimestamp(t, tz)
+        if k:
+            out.kinds[KINDS[k]][0] += 1
+            out.heat_enc[local.weekday()][local.hour] += 1
+            last[name] = (k, t)
+        elif etype == "Catch" or etype == "Fled":
+            prev = last.pop(name, None)
+            if prev is not None and t - prev[1] <= PAIR_WINDOW:
+                out.kinds[KINDS[prev[0]]][1 if etype == "Catch" else 2] += 1
+        if etype != "Catch":
+            continue
+        out.catches += 1
+        out.heat_catch[local.weekday()][local.hour] += 1
+        if e.get("shiny"):
+            out.shinies += 1
+        iv = e.get("iv")
+        if iv and len(iv) == 3:
+            s = iv[0] + iv[1] + iv[2]
+            sums.append(s)
+            out.hist[s] += 1
+            if s == 45:
+                out.perfect += 1
+    out.with_iv = len(sums)
+    if sums:
+        pct = sorted(100.0 * s / 45 for s in sums)
+        out.mean = sum(pct) / len(pct)
+        out.percentiles = {p: _percentile(pct, p) for p in PERCENTILES}
+    return out
+
+
+# =========================================================
+# NumPy
+# =========================================================
+
+class Columns:
+    """Vaste kolommen (numpy) voor een chronologische reeks events."""
+
+    __slots__ = ("ts", "type", "kind", "name", "iv", "shiny")
+
+    def __init__(self, ts, type, kind, name, iv, shiny):
+        self.ts, self.type, self.kind, self.name, self.iv, self.shiny = ts, type, kind, name, iv, shiny
+
+    def __len__(self):
+        return len(self.ts)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Any], names: Optional[Dict[Any, int]] = None) -> "Columns":
+        """Event-dicts (of EventRows) → kolommen; `names` = gedeelde species-codes."""
+        names = {} if names is None else names
+        ts, ty, kd, nm = array("d"), array("B"), array("B"), array("I")
+        iv, sh = array("b"), bytearray()
+        for e in events:
+            t = e.get("timestamp")
+            if not isinstance(t, datetime):
+                continue
+            etype = e.get("type")
+            ts.append(t.timestamp())
+            ty.append(_TYPE_CODE.get(etype, 0))
+            kd.append(_kind(etype, e.get("source")))
+            n = e.get("name")
+            c = names.get(n)
+            if c is None:
+                c = names[n] = len(names)
+            nm.append(c)
+            v = e.get("iv")
+            iv.extend(v if v and len(v) == 3 else (-1, -1, -1))
+            sh.append(1 if e.get("shiny") else 0)
+        return cls(
+            np.array(ts, np.float64), np.array(ty, np.uint8), np.array(kd, np.uint8),
+            np.array(nm, np.uint32), np.array(iv, np.int8).reshape(-1, 3),
+            np.frombuffer(bytes(sh), np.uint8).astype(bool),
+        )
+
+    @classmethod
+    def from_columnar(cls, c: ColumnarEvents) -> "Columns":
+        """Rechtstreeks uit de kolommen van (een bevroren kopie van) ColumnarEvents."""
+        n = len(c)
+        # .copy(): geen numpy-view op array('d') laten staan (blokkeert resize)
+        ts = np.frombuffer(c._ts, np.float64, n).copy() if n else np.empty(0, np.float64)
+        type_map = np.array([_TYPE_CODE.get(v, 0) for v in c._types.values], np.uint8)
+        raw_type = np.frombuffer(c._type, np.uint8, n).copy() if n else np.empty(0, np.uint8)
+        # kind hangt af van (type, source): tabel over alle combinaties
+        kind_map = np.array([[_kind(t, s) for s in c._sources.values] for t in c._types.values], np.uint8)
+        raw_src = np.frombuffer(c._source, np.uint8, n).copy() if n else np.empty(0, np.uint8)
+        name = np.frombuffer(c._name, np.uint32, n).copy() if n else np.empty(0, np.uint32)
+        iv = np.frombuffer(bytes(c._iv[:3 * n]), np.uint8).reshape(-1, 3).astype(np.int8)   # 255 → -1
+        shiny = np.unpackbits(np.frombuffer(bytes(c._shiny), np.uint8), bitorder="little")[:n].astype(bool)
+        keep = np.isfinite(ts)
+        cols = cls(ts, type_map[raw_type], kind_map[raw_type, raw_src], name, iv, shiny)
+        return cols if keep.all() else cols.take(keep)
+
+    def take(self, sel) -> "Columns":
+        return Columns(self.ts[sel], self.type[sel], self.kind[sel], self.name[sel], self.iv[sel], self.shiny[sel])
+
+    def concat(self, other: "Columns") -> "Columns":
+        if not len(other):
+            return self
+        return Columns(*(np.concatenate((getattr(self, f), getattr(other, f))) for f in Columns.__slots__))
+
+    def window(self, start: Optional[float] = None, end: Optional[float] = None) -> "Columns":
+        lo = 0 if start is None else int(np.searchsorted(self.ts, start, "left"))
+        hi = len(self.ts) if end is None else int(np.searchsorted(self.ts, end, "left"))
+        return self.take(slice(lo, hi))
+
+
+def _local_parts(ts, tz) -> Tuple[Any, Any]:
+    """Chronologische epochs → (weekdag, uur) in lokale tijd; utcoffset één keer per uur."""
+    hours = np.floor(ts / 3600).astype(np.int64)
+    # ts is gesorteerd: uren vormen aaneengesloten runs (goedkoper dan np.unique)
+    starts = np.flatnonzero(np.diff(hours)) + 1
+    firsts = hours[np.concatenate(([0], starts))]
+    offs = np.array([datetime.fromtimestamp(int(h) * 3600, tz).utcoffset().total_seconds()
+                     for h in firsts], np.float64)
+    local = np.floor(ts + np.repeat(offs, np.diff(np.concatenate(([0], starts, [len(ts)]))))).astype(np.int64)
+    return (local // 86400 + 3) % 7, (local // 3600) % 24      # 1970-01-01 = donderdag
+
+
+def _hist_percentiles(hist, n: int) -> Dict[int, float]:
+    """np.percentile (lineair) op IV% rechtstreeks uit het histogram: geen sort nodig."""
+    cum = np.cumsum(hist)
+    out = {}
+    for p in PERCENTILES:
+        pos = p / 100 * (n - 1)
+        lo = int(pos)
+        a = int(np.searchsorted(cum, lo, "right"))          # IV-som op gesorteerde positie lo
+        b = int(np.searchsorted(cum, min(lo + 1, n - 1), "right"))
+        va, vb = 100.0 * a / 45, 100.0 * b / 45
+        out[p] = va + (vb - va) * (pos - lo)
+    return out
+
+
+def ivstats_np(cols: "Columns", tz) -> IVStats:
+    """Alle /ivstats-analyses over `cols` (al op het venster gesneden)."""
+    out = IVStats()
+    n = len(cols)
+    out.events = n
+    if not n:
+        return out
+    ty, kind = cols.type, cols.kind
+    catch = ty == _CATCH
+    wd, hr = _local_parts(cols.ts, tz)
+    cell = wd * 24 + hr
+
+    # IV's van catches
+    out.catches = int(catch.sum())
+    out.shinies = int((catch & cols.shiny).sum())
+    ivc = cols.iv[catch]
+    ivc = ivc[ivc[:, 0] >= 0].astype(np.int64)
+    sums = ivc.sum(axis=1)
+    out.with_iv = len(sums)
+    if len(sums):
+        hist = np.bincount(sums, minlength=46)[:46]
+        out.hist = hist.tolist()
+        out.perfect = out.hist[45]
+        out.mean = float(100.0 * (hist * np.arange(46)).sum() / 45 / len(sums))
+        out.percentiles = _hist_percentiles(hist, len(sums))
+
+    # heatmaps
+    enc = kind > 0
+    out.heat_enc = np.bincount(cell[enc], minlength=168).reshape(7, 24).tolist()
+    out.heat_catch = np.bincount(cell[catch], minlength=168).reshape(7, 24).tolist()
+
+    # vangstratio per soort: per species in tijdsvolgorde (stabiele sort
+    # behoudt de chronologie), Catch/Fled → laatste encounter ervoor, als er
+    # sindsdien geen andere Catch/Fled van die species was
+    names = cols.name
+    if len(names) and names.max() < 1 << 16:
+        names = names.astype(np.uint16)      # stabiele sort van 16-bit ints = radix sort
+    order = np.argsort(names, kind="stable")
+    nm, t, k, tys = cols.name[order], cols.ts[order], kind[order], ty[order]
+    idx = np.arange(n)
+    first = np.ones(n, bool)
+    first[1:] = nm[1:] != nm[:-1]
+    group = np.maximum.accumulate(np.where(first, idx, 0))
+    last_enc = np.maximum.accumulate(np.where(k > 0, idx, -1))
+    resolve = (tys == _CATCH) | (tys == _FLED)
+    last_res = np.maximum.accumulate(np.where(resolve, idx, -1))
+    prev_res = np.empty(n, np.int64)
+    prev_res[0] = -1
+    prev_res[1:] = last_res[:-1]
+    e = np.maximum(last_enc, 0)
+    paired = resolve & (last_enc >= group) & (last_enc > prev_res) & (t - t[e] <= PAIR_WINDOW)
+    nk = len(KINDS)
+    encs = np.bincount(kind, minlength=nk)
+    caught = np.bincount(k[e[paired & (tys == _CATCH)]], minlength=nk)
+    fled = np.bincount(k[e[paired & (tys == _FLED)]], minlength=nk)
+    for i, name in enumerate(KINDS[1:], start=1):
+        out.kinds[name] = [int(encs[i]), int(caught[i]), int(fled[i])]
+    return out
+
+
+class IVAnalytics:
+    """
+    Gematerialiseerde kolommen van de hot store (utils.EVENTS).
+    utils geeft per refresh de nieuwe rijen + de rewrite-versie door.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cols: Optional[Columns] = None
+        self._rows = 0                 # aantal EVENTS-rijen verwerkt (incl. zonder timestamp)
+        self._gen = -1
+        self._names: Dict[Any, int] = {}
+        self.rebuilds = 0
+        self.appends = 0
+
+    def base(self, gen: int, n: int) -> int:
+        """Vanaf welke EVENTS-rij nieuwe rijen nodig zijn (0 = volledige rebuild)."""
+        with self._lock:
+            if self._cols is None or gen != self._gen or self._rows > n:
+                return 0
+            return self._rows
+
+    def update(self, rows: Any, base: int, gen: int) -> Columns:
+        """rows = EVENTS[base:] (lijst of bevroren ColumnarEvents), genomen bij versie `gen`."""
+        with self._lock:
+            if gen < self._gen:
+                return self._cols                      # trage thread: nieuwere kolommen staan er al
+            if gen == self._gen and self._cols is not None and base <= self._rows:
+                skip = self._rows - base               # al door een andere thread toegevoegd
+                if skip < len(rows):
+                    self._cols = self._cols.concat(self._convert(rows, skip))
+                    self._rows = base + len(rows)
+                    self.appends += 1
+                return self._cols
+            if base != 0:
+                raise ValueError("rebuild vereist alle rijen (base=0)")
+            self._names = {}
+            self._cols = self._convert(rows, 0)
+            self._rows = len(rows)
+            self._gen = gen
+            self.rebuilds += 1
+            return self._cols
+
+    def _convert(self, rows: Any, skip: int) -> Columns:
+        if isinstance(rows, ColumnarEvents):
+            return Columns.from_columnar(rows.slice(skip, len(rows)) if skip else rows)
+        return Columns.from_events(rows[skip:] if skip else rows, self._names)
+
+    def clear(self):
+        with self._lock:
+            self._cols = None
+            self._rows = 0
+            self._gen = -1
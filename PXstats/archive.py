@@ -0,0 +1,222 @@
+# PXstats • archive.py • v5.4
+# Koude opslag: oude events in onveranderlijke, gecomprimeerde
+# maand-segmenten (JSONL, gzip of zstd) met een kleine index.
+#
+#   archive/events-2025-10-000.jsonl.gz
+#   archive/index.json    [{file, month, start, end, count, types, ...}]
+#
+# - segmenten worden één keer geschreven en nooit aangepast; een laat
+#   binnengekomen event voor een al gearchiveerde maand → extra deel (-001)
+# - queries openen enkel segmenten waarvan [start, end] het bereik raakt
+#   en streamen die, samengevoegd op timestamp (heapq.merge)
+#
+# Herstelprotocol (zie utils.apply_retention):
+#   1. segment → .tmp + fsync → os.replace
+#   2. index bijwerken met purged=false (atomisch)
+#   3. events uit de hot store verwijderen en persisteren
+#   4. purged=true in de index
+# Crash tussen 2 en 4: bij het laden worden de events van segmenten met
+# purged=false alsnog uit de hot store gehaald (geen duplicaten).
+
+import gzip
+import heapq
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from zoneinfo import ZoneInfo
+
+try:
+    import zstandard
+except ImportError:  # optioneel: enkel nodig voor PX_ARCHIVE_CODEC=zstd
+    zstandard = None
+
+_EXT = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def _epoch(ts: Any) -> float:
+    if isinstance(ts, datetime):
+        return ts.timestamp()
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    return float("-inf")
+
+
+class Archive:
+    """Maand-segmenten + index.json in één directory."""
+
+    def __init__(self, directory: str = "archive", codec: str = "gzip", tz: Optional[ZoneInfo] = None):
+        if codec == "zstd" and zstandard is None:
+            print("[ARCHIVE] zstandard niet geïnstalleerd, val terug op gzip")
+            codec = "gzip"
+        if codec not in _EXT:
+            raise ValueError(f"onbekende archive-codec: {codec}")
+        self.dir = directory
+        self.codec = codec
+        self.tz = tz
+        self.index_path = os.path.join(directory, "index.json")
+        self._segments: Optional[List[Dict[str, Any]]] = None
+
+    # ---------------------------------------------------------
+    # Index
+    # ---------------------------------------------------------
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        if self._segments is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._segments = json.load(f)
+            except FileNotFoundError:
+                self._segments = []
+        return self._segments
+
+    def _write_index(self, segments: List[Dict[str, Any]]):
+        os.makedirs(self.dir, exist_ok=True)
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(segments, f, ensure_ascii=False, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.index_path)
+        self._segments = segments
+
+    def total(self) -> int:
+        return sum(s["count"] for s in self.segments)
+
+    def start(self) -> Optional[float]:
+        """Oudste gearchiveerde timestamp (None als het archief leeg is)."""
+        return min((s["start"] for s in self.segments), default=None)
+
+    def overlapping(self, start: Optional[float] = None, end: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Segmenten met events in [start, end)."""
+        return [
+            s for s in self.segments
+            if (start is None or s["end"] >= start) and (end is None or s["start"] < end)
+        ]
+
+    def unpurged(self) -> List[Dict[str, Any]]:
+        return [s for s in self.segments if not s.get("purged")]
+
+    def commit(self, entries: List[Dict[str, Any]]):
+        """Stap 2: nieuwe segmenten zichtbaar maken (nog niet gepurged)."""
+        if entries:
+            self._write_index(self.segments + entries)
+
+    def mark_purged(self, entries: List[Dict[str, Any]]):
+        """Stap 4: hot store is opgeschoond."""
+        files = {e["file"] for e in entries}
+        if files:
+            self._write_index([dict(s, purged=True) if s["file"] in files else s for s in self.segments])
+
+    # ---------------------------------------------------------
+    # Schrijven
+    # ---------------------------------------------------------
+
+    def _month(self, t: float) -> str:
+        return datetime.fromtimestamp(t, self.tz).strftime("%Y-%m")
+
+    def _open_write(self, path: str):
+        if self.codec == "zstd":
+            raw = open(path, "wb")
+            return io.TextIOWrapper(zstandard.ZstdCompressor(level=10).stream_writer(raw), encoding="utf-8")
+        return io.TextIOWrapper(gzip.GzipFile(path, "wb", compresslevel=9), encoding="utf-8")
+
+    def _next_file(self, month: str, taken: Iterable[str]) -> str:
+        taken = set(taken)
+        n = 0
+        while True:
+            name = f"events-{month}-{n:03d}{_EXT[self.codec]}"
+            if name not in taken and not os.path.exists(os.path.join(self.dir, name)):
+                return name
+            n += 1
+
+    def write(
+        self,
+        events: Iterable[Dict[str, Any]],
+        encode: Callable[[Dict[str, Any]], Dict[str, Any]],
+        **meta: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stap 1: chronologische events wegschrijven, één segment per maand.
+        Geeft de (nog niet gecommitte) index-entries terug.
+        """
+        os.makedirs(self.dir, exist_ok=True)
+        entries: List[Dict[str, Any]] = []
+        taken = [s["file"] for s in self.segments]
+        cur = None
+        fh = None
+        tmp = None
+
+        def _close():
+            fh.close()
+            with open(tmp, "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, os.path.join(self.dir, cur["file"]))
+            cur["bytes"] = os.path.getsize(os.path.join(self.dir, cur["file"]))
+
+        for e in events:
+            t = _epoch(e.get("timestamp"))
+            month = self._month(t) if t != float("-inf") else "0000-00"
+            if cur is None or cur["month"] != month:
+                if cur is not None:
+                    _close()
+                name = self._next_file(month, taken)
+                taken.append(name)
+                cur = {"file": name, "month": month, "start": t, "end": t,
+                       "count": 0, "types": {}, "codec": self.codec, "purged": False, **meta}
+                entries.append(cur)
+                tmp = os.path.join(self.dir, name + ".tmp")
+                fh = self._open_write(tmp)
+            fh.write(json.dumps(encode(e), ensure_ascii=False))
+            fh.write("\n")
+            cur["start"] = min(cur["start"], t)
+            cur["end"] = max(cur["end"], t)
+            cur["count"] += 1
+            etype = str(e.get("type"))
+            cur["types"][etype] = cur["types"].get(etype, 0) + 1
+
+        if cur is not None:
+            _close()
+        return entries
+
+    # ---------------------------------------------------------
+    # Lezen (lazy)
+    # ---------------------------------------------------------
+
+    def _open_read(self, seg: Dict[str, Any]):
+        path = os.path.join(self.dir, seg["file"])
+        if seg.get("codec") == "zstd":
+            if zstandard is None:
+                raise RuntimeError(f"{seg['file']}: zstandard nodig om te lezen")
+            return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, "rb")), encoding="utf-8")
+        return io.TextIOWrapper(gzip.GzipFile(path, "rb"), encoding="utf-8")
+
+    def read_segment(self, seg: Dict[str, Any], decode: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        with self._open_read(seg) as f:
+            for line in f:
+                if line.strip():
+                    yield decode(json.loads(line))
+
+    def iter_range(
+        self,
+        decode: Callable[[Dict[str, Any]], Dict[str, Any]],
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Gearchiveerde events in [start, end), oplopend, gestreamd."""
+        segs = [s for s in self.overlapping(start, end) if type is None or s["types"].get(type)]
+        if not segs:
+            return
+        streams = [self.read_segment(s, decode) for s in sorted(segs, key=lambda s: s["start"])]
+        for e in heapq.merge(*streams, key=lambda e: _epoch(e.get("timestamp"))):
+            t = _epoch(e.get("timestamp"))
+            if start is not None and t < start:
+                continue
+            if end is not None and t >= end:
+                continue
+            if type is not None and e.get("type") != type:
+                continue
+            yield e
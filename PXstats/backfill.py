@@ -0,0 +1,181 @@
+# PXstats • backfill.py • v6.1
+# /backfill: gemiste embeds ophalen uit de kanaalgeschiedenis
+# (bot offline, redeploy, gateway-onderbreking).
+#
+# - channel.history(after=since, oldest_first=True) pagineert door het kanaal
+# - embeds gaan per chunk (PX_BACKFILL_CHUNK berichten) als dict naar een
+#   process pool (PX_BACKFILL_WORKERS, 0 = één worker-thread); daar
+#   Embed.from_dict + content_hash + parse_polygonx_embed
+# - ophalen en parsen overlappen: de volgende pagina wordt al gelezen
+#   terwijl de pool vorige chunks verwerkt
+# - dedup tegen de bestaande events in het bereik (keys) én de DEDUP-index
+#   (live ingest tijdens de backfill)
+# - alles in één keer via utils.add_events → één persist-flush
+# - events krijgen de partitie-tags van hun bericht (partitions.message_tags)
+#
+# Werkt met elk object dat history() en embeds heeft; zie
+# benchmarks/bench_backfill.py voor een fake kanaal zonder Discord.
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import discord
+
+from PXstats import metrics
+from PXstats.dedup import content_hash, event_key, split_key
+from PXstats.parser import parse_polygonx_embed
+from PXstats.partitions import message_tags
+from PXstats.utils import DEDUP, TZ, add_events, iter_events
+
+WORKERS = int(os.getenv("PX_BACKFILL_WORKERS", str(os.cpu_count() or 1)))
+CHUNK = int(os.getenv("PX_BACKFILL_CHUNK", "500"))
+PROGRESS_EVERY = 2.0
+
+# (message_id, embed-index, embed-dict, bericht-tijd, partitie-tags)
+Raw = Tuple[int, int, Dict[str, Any], datetime, Dict[str, Any]]
+
+
+def _parse_chunk(chunk: List[Raw]) -> Tuple[List[Tuple[int, int, str, Optional[Dict[str, Any]]]], float]:
+    """In een worker-proces: embed-dicts → (mid, index, hash, event of None), parse-tijd."""
+    out = []
+    t0 = time.perf_counter()
+    for mid, idx, raw, created, tags in chunk:
+        e = discord.Embed.from_dict(raw)
+        chash = content_hash(e)
+        etype, data = parse_polygonx_embed(e)
+        if etype:
+            data["timestamp"] = e.timestamp or created
+            data["type"] = etype
+            data["key"] = event_key(mid, idx, chash)
+            data.update(tags)
+        else:
+            data = None
+        out.append((mid, idx, chash, data))
+    return out, time.perf_counter() - t0
+
+
+def _existing_keys(since: datetime) -> Tuple[set, set]:
+    """(message_id, index)-slots en content hashes van events sinds `since`."""
+    slots, hashes = set(), set()
+    # embed-timestamps kunnen iets vóór het bericht liggen
+    for e in iter_events(since - timedelta(days=1), None):
+        key = e.get("key")
+        if not key:
+            continue
+        mid, idx, chash = split_key(key)
+        slots.add((mid, idx))
+        if chash.startswith("t"):
+            hashes.add(chash)
+    return slots, hashes
+
+
+class BackfillStats:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.messages = 0
+        self.embeds = 0
+        self.events = 0
+        self.duplicates = 0
+        self.misses = 0
+        self.parse_s = 0.0
+        self.done = False
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.t0
+
+    def rate(self) -> float:
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    def line(self) -> str:
+        state = "klaar" if self.done else "bezig"
+        return (f"{state}: {self.messages:,} berichten, {self.embeds:,} embeds → "
+                f"{self.events:,} nieuwe events ({self.duplicates:,} dubbel, {self.misses:,} onherkend) "
+                f"in {self.elapsed:.1f} s ({self.rate():,.0f} berichten/s)")
+
+
+def _executor(workers: int) -> Executor:
+    if workers <= 0:
+        return ThreadPoolExecutor(1, thread_name_prefix="px-backfill")
+    return ProcessPoolExecutor(workers)
+
+
+async def backfill(
+    channel: Any,
+    since: datetime,
+    progress: Optional[Callable[[BackfillStats], Any]] = None,
+    skip_author: Any = None,
+    workers: int = WORKERS,
+    chunk_size: int = CHUNK,
+) -> BackfillStats:
+    """
+    Geschiedenis van `channel` sinds `since` verwerken. `progress` (sync of
+    async) wordt hooguit elke PROGRESS_EVERY seconden aangeroepen.
+    De caller meldt stats.events aan de persist-worker.
+    """
+    stats = BackfillStats()
+    loop = asyncio.get_running_loop()
+    existing = loop.run_in_executor(None, _existing_keys, since)
+
+    async def _report(force: bool = False):
+        nonlocal last
+        if progress is not None and (force or time.perf_counter() - last >= PROGRESS_EVERY):
+            last = time.perf_counter()
+            r = progress(stats)
+            if asyncio.iscoroutine(r):
+                await r
+
+    last = time.perf_counter()
+    jobs = []
+    chunk: List[Raw] = []
+    with _executor(workers) as pool:
+        async for msg in channel.history(limit=None, after=since, oldest_first=True):
+            stats.messages += 1
+            if skip_author is not None and msg.author == skip_author:
+                continue
+            tags = message_tags(msg)
+            for idx, e in enumerate(msg.embeds):
+                chunk.append((msg.id, idx, e.to_dict(), msg.created_at.astimezone(TZ), tags))
+            if len(chunk) >= chunk_size:
+                jobs.append(loop.run_in_executor(pool, _parse_chunk, chunk))
+                stats.embeds += len(chunk)
+                chunk = []
+                await _report()
+        if chunk:
+            jobs.append(loop.run_in_executor(pool, _parse_chunk, chunk))
+            stats.embeds += len(chunk)
+        results = await asyncio.gather(*jobs)
+
+    slots, hashes = await existing
+    new: List[Dict[str, Any]] = []
+    for rows, parse_s in results:
+        stats.parse_s += parse_s
+        for mid, idx, chash, data in rows:
+            slot = (str(mid), idx)
+            if (slot in slots or chash in hashes
+                    or DEDUP.is_duplicate(mid, idx, chash)):
+                stats.duplicates += 1
+                continue
+            if data is None:
+                stats.misses += 1
+                continue
+            slots.add(slot)
+            if chash.startswith("t"):
+                hashes.add(chash)
+            new.append(data)
+
+    # bulk insert: één lock, één versie-bump, één flush
+    new.sort(key=lambda e: e["timestamp"])
+    with metrics.INGEST_SECONDS.time():
+        add_events(new)
+    for data in new:
+        metrics.EVENTS_TOTAL.inc(data["type"])
+    stats.events = len(new)
+    stats.done = True
+    await _report(force=True)
+    print(f"[BACKFILL] {getattr(channel, 'name', channel)}: {stats.line()}")
+    return stats
@@ -0,0 +1,298 @@
+# PXstats • binsnap.py • v6.1
+# Binaire snapshot (events.bin) voor snelle startup.
+#
+# Zelfde kolommen als ColumnarEvents, elk als één vast-breedte blok:
+#   ts      f64  × n      epoch-seconden
+#   type    u8   × n      index in strings.types
+#   source  u8   × n      index in strings.sources
+#   name    u32  × n      index in strings.names
+#   iv      u8   × 3n     255 = geen IV
+#   shiny   bitmap        (n + 7) // 8 bytes
+#   part    u16  × n      index in strings.parts (v2; v1-bestanden: alles 0)
+#   strings JSON          {"types": [...], "sources": [...], "names": [...],
+#                          "parts": [null, [guild, channel, author, account], ...]}
+#   keys    UTF-8         event-keys, "\0"-gescheiden ("" = geen key)
+#   extra   JSON          [[rij, {...}], ...] overige velden (zeldzaam)
+#
+# Laden = mmap + per kolom één memcpy (array.frombytes) in ColumnarEvents:
+# geen json.load, geen fromisoformat per record. Alles little-endian.
+# JSON blijft het import/export-formaat:
+#   python -m PXstats.binsnap export events.bin events.json
+#   python -m PXstats.binsnap import events.json events.bin
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from PXstats.columnar import PART_FIELDS, ColumnarEvents, _NO_IV
+
+MAGIC = b"PXSNAP\x00\x01"
+VERSION = 2
+# secties per formaatversie (v1: zonder partitie-kolom)
+_SECTIONS = {
+    1: ("ts", "type", "source", "name", "iv", "shiny", "strings", "keys", "extra"),
+    2: ("ts", "type", "source", "name", "iv", "shiny", "part", "strings", "keys", "extra"),
+}
+SECTIONS = _SECTIONS[VERSION]
+
+_HEADER = struct.Struct("<8sIQ")                  # magic, version, n
+_TOC = {v: struct.Struct("<" + "QQ" * len(secs)) for v, secs in _SECTIONS.items()}   # (offset, lengte) per sectie
+
+_LITTLE = sys.byteorder == "little"
+
+
+def _le(a: array) -> bytes:
+    if _LITTLE:
+        return a.tobytes()
+    b = array(a.typecode, a)
+    b.byteswap()
+    return b.tobytes()
+
+
+def _from_le(typecode: str, buf) -> array:
+    a = array(typecode)
+    a.frombytes(buf)
+    if not _LITTLE:
+        a.byteswap()
+    return a
+
+
+def _as_columnar(events: Iterable[Mapping], tz) -> ColumnarEvents:
+    if isinstance(events, ColumnarEvents):
+        return events
+    c = ColumnarEvents(tz=tz)
+    c.extend(events)
+    return c
+
+
+# ------------------------------------------------------------------
+# Schrijven
+# ------------------------------------------------------------------
+
+def dump(path: str, events: Iterable[Mapping], tz=None) -> int:
+    """Events (ColumnarEvents of dicts, chronologisch) → binaire snapshot + fsync."""
+    c = _as_columnar(events, tz)
+    n = len(c)
+
+    keys: List[str] = []
+    extra: List[Any] = []
+    for i, x in enumerate(c._extra):
+        if not x:
+            keys.append("")
+            continue
+        keys.append(str(x.get("key") or ""))
+        rest = {k: v for k, v in x.items() if k != "key"}
+        if rest:
+            extra.append([i, rest])
+
+    blocks = [
+        _le(c._ts),
+        bytes(c._type),
+        bytes(c._source),
+        _le(c._name),
+        bytes(c._iv),
+        bytes(c._shiny),
+        _le(c._part),
+        json.dumps({
+            "types": c._types.values,
+            "sources": c._sources.values,
+            "names": c._species.values,
+            "parts": c._parts.values,
+        }, ensure_ascii=False).encode("utf-8"),
+        "\0".join(keys).encode("utf-8"),
+        json.dumps(extra, ensure_ascii=False, default=str).encode("utf-8"),
+    ]
+
+    toc = []
+    off = _HEADER.size + _TOC[VERSION].size
+    for b in blocks:
+        toc += [off, len(b)]
+        off += len(b)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, n))
+        f.write(_TOC[VERSION].pack(*toc))
+        for b in blocks:
+            f.write(b)
+        f.flush()
+        os.fsync(f.fileno())
+    return n
+
+
+# ------------------------------------------------------------------
+# Lezen
+# ------------------------------------------------------------------
+
+class _Snapshot:
+    """Geopende snapshot: secties als memoryviews op de mmap."""
+
+    def __init__(self, path: str):
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:                 # leeg bestand
+            self._f.close()
+            raise ValueError(f"{path}: lege snapshot")
+        mv = memoryview(self._mm)
+        magic, version, self.n = _HEADER.unpack_from(mv, 0)
+        if magic != MAGIC or version not in _SECTIONS:
+            self.close()
+            raise ValueError(f"{path}: geen PXstats-snapshot (v1–v{VERSION})")
+        toc = _TOC[version].unpack_from(mv, _HEADER.size)
+        self.sections = {
+            name: mv[toc[2 * k]:toc[2 * k] + toc[2 * k + 1]]
+            for k, name in enumerate(_SECTIONS[version])
+        }
+        self._mv = mv
+
+    def close(self):
+        self.sections = {}
+        if getattr(self, "_mv", None) is not None:
+            self._mv.release()
+            self._mv = None
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # views eerst vrijgeven, anders weigert mmap.close()
+        for v in self.sections.values():
+            v.release()
+        self.close()
+        return False
+
+
+def _remap(codes: array, file_values: List[Any], interner) -> array:
+    """Codes uit het bestand → codes van de (bestaande) interner."""
+    table = [interner.code(v) for v in file_values]
+    if table == list(range(len(table))):
+        return codes
+    return array(codes.typecode, [table[c] for c in codes])
+
+
+def load_into(target: ColumnarEvents, path: str) -> int:
+    """
+    Rijen uit de snapshot achteraan toevoegen aan `target` (in place:
+    utils._TS verwijst naar target.ts). Geeft het aantal rijen terug.
+    """
+    with _Snapshot(path) as s:
+        sec = s.sections
+        n = s.n
+        strings = json.loads(bytes(sec["strings"]))
+        ts = _from_le("d", sec["ts"])
+        types = _remap(array("B", sec["type"]), strings["types"], target._types)
+        sources = _remap(array("B", sec["source"]), strings["sources"], target._sources)
+        names = _remap(_from_le("I", sec["name"]), strings["names"], target._species)
+        iv = bytes(sec["iv"])
+        shiny = bytes(sec["shiny"])
+        if "part" in sec:
+            file_parts = [tuple(p) if p else None for p in strings.get("parts", [None])]
+            part = _remap(_from_le("H", sec["part"]), file_parts, target._parts)
+        else:
+            part = array("H", bytes(2 * n))
+        keys = bytes(sec["keys"]).decode("utf-8").split("\0") if n else []
+        extra = json.loads(bytes(sec["extra"]))
+
+    if len(target) % 8:
+        # bitmap niet byte-uitgelijnd: via de gewone (trage) weg toevoegen
+        tmp = ColumnarEvents(tz=target.tz)
+        tmp._ts, tmp._type, tmp._source, tmp._name = ts, types, sources, names
+        tmp._iv, tmp._shiny = bytearray(iv), bytearray(shiny)
+        tmp._part, tmp._parts = part, target._parts
+        tmp._extra = [{"key": k} if k else None for k in keys]
+        for i, x in extra:
+            tmp._extra[i] = dict(tmp._extra[i] or {}, **x)
+        target.extend(dict(r) for r in tmp)
+        return n
+
+    base = len(target)
+    target._ts.extend(ts)
+    target._type.extend(types)
+    target._source.extend(sources)
+    target._name.extend(names)
+    target._iv += iv
+    target._shiny += shiny
+    target._part.extend(part)
+    target._extra.extend({"key": k} if k else None for k in keys)
+    for i, x in extra:
+        cur = target._extra[base + i]
+        target._extra[base + i] = dict(cur or {}, **x)
+    return n
+
+
+def load(path: str, tz=None) -> ColumnarEvents:
+    c = ColumnarEvents(tz=tz)
+    load_into(c, path)
+    return c
+
+
+def load_dicts(path: str, tz=None) -> List[Dict[str, Any]]:
+    """Snapshot → lijst van event-dicts (dict-layout van EVENTS)."""
+    c = load(path, tz)
+    fromts = datetime.fromtimestamp
+    ts, ty, src, nm, iv, bits, part, extra = c._ts, c._type, c._source, c._name, c._iv, c._shiny, c._part, c._extra
+    types, sources, names, parts = c._types.values, c._sources.values, c._species.values, c._parts.values
+    out: List[Dict[str, Any]] = []
+    for i in range(len(ts)):
+        e = {
+            "timestamp": fromts(ts[i], tz) if ts[i] != float("-inf") else None,
+            "type": types[ty[i]],
+            "name": names[nm[i]],
+            "iv": None if iv[3 * i] == _NO_IV else [iv[3 * i], iv[3 * i + 1], iv[3 * i + 2]],
+            "shiny": bool(bits[i >> 3] & (1 << (i & 7))),
+        }
+        if src[i]:
+            e["source"] = sources[src[i]]
+        if part[i]:
+            e.update((f, v) for f, v in zip(PART_FIELDS, parts[part[i]]) if v is not None)
+        if extra[i]:
+            e.update(extra[i])
+        out.append(e)
+    return out
+
+
+def count(path: str) -> Optional[int]:
+    """Aantal records in de header (None als het bestand ontbreekt)."""
+    try:
+        with open(path, "rb") as f:
+            magic, version, n = _HEADER.unpack(f.read(_HEADER.size))
+    except (FileNotFoundError, struct.error):
+        return None
+    return n if magic == MAGIC else None
+
+
+# ------------------------------------------------------------------
+# JSON import / export
+# ------------------------------------------------------------------
+
+def _main(argv: List[str]) -> int:
+    from PXstats.utils import TZ, decode_event, encode_event, _epoch
+
+    if len(argv) != 3 or argv[0] not in ("import", "export"):
+        print("Gebruik:\n"
+              "  python -m PXstats.binsnap export events.bin events.json\n"
+              "  python -m PXstats.binsnap import events.json events.bin")
+        return 2
+    cmd, src, dst = argv
+    if cmd == "export":
+        raw = [encode_event(e) for e in load_dicts(src, TZ)]
+        with open(dst, "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False)
+        print(f"[SNAPSHOT] {len(raw)} events → {dst}")
+    else:
+        with open(src, "r", encoding="utf-8") as f:
+            events = sorted((decode_event(e) for e in json.load(f)), key=_epoch)
+        n = dump(dst, events, TZ)
+        print(f"[SNAPSHOT] {n} events → {dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -0,0 +1,78 @@
+# PXstats • cache.py • v5.2
+# Render-cache voor slash-commands (/summary, /recent_shinies).
+#
+# - key = (naam, ingest-versie, minuut): elke add_event/replace_event
+#   verhoogt de versie, dus de cache is meteen ongeldig zonder expliciete
+#   invalidatie; de minuut vangt het verschuivende 24h-venster
+# - single-flight: gelijktijdige aanvragen voor dezelfde key wachten op
+#   één lopende berekening i.p.v. elk het volledige werk te doen
+# - de berekening zelf draait in een worker-thread (event loop blijft vrij)
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from PXstats import metrics
+from PXstats.utils import ingest_version
+
+Key = Tuple[str, int, int]
+
+
+class RenderCache:
+    """Eén resultaat per naam (de laatste key), plus lopende berekeningen."""
+
+    def __init__(self):
+        self._done: Dict[str, Tuple[Key, Any]] = {}
+        self._inflight: Dict[Key, "asyncio.Future"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(name: str) -> Key:
+        return name, ingest_version(), int(time.time() // 60)
+
+    async def get(self, name: str, compute: Callable[[], Any]) -> Any:
+        key = self.key(name)
+
+        cached = self._done.get(name)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            metrics.RENDER_CACHE.inc("hit")
+            return cached[1]
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            metrics.RENDER_CACHE.inc("coalesced")
+            # shield: een geannuleerde wachter breekt de gedeelde berekening niet af
+            return await asyncio.shield(fut)
+
+        self.misses += 1
+        metrics.RENDER_CACHE.inc("miss")
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await asyncio.to_thread(compute)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()         # wachters krijgen de fout; geen "never retrieved"
+            raise
+        else:
+            fut.set_result(value)
+            self._done[name] = (key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self):
+        self._done.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced}
+
+
+RENDER = RenderCache()
@@ -0,0 +1,347 @@
+# PXstats • columnar.py • v6.1
+# Compacte kolom-opslag voor events (i.p.v. één dict per event).
+#
+# Per event:
+#   ts       array('d')   epoch-seconden                      8 B
+#   type     array('B')   code uit TYPES                      1 B
+#   source   array('B')   code uit SOURCES                    1 B
+#   species  array('I')   index in de naamtabel (pokedex)     4 B
+#   iv       bytearray    3 bytes, 255 = geen IV              3 B
+#   shiny    bytearray    bitmap                            1/8 B
+#   part     array('H')   index in de partitietabel            2 B
+#                         (guild, channel, author, account), 0 = geen tags
+#   extra    list         None of dict met overige velden     8 B
+#
+# EventRow is een lichte, read-only view (Mapping) zodat stats/commands
+# gewoon e.get("type"), e["timestamp"], ... kunnen blijven gebruiken.
+# Views zijn tijdelijk: een insert verschuift indexen. Bewaar dict(row).
+
+from array import array
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from PXstats.pokedex import species_names
+
+TYPES = (None, "Encounter", "Catch", "Rocket", "Raid", "MaxBattle", "Quest", "Hatch", "Fled")
+SOURCES = (None, "wild", "incense", "lure")
+
+# Partitie-tags (feeder-account + kanaal), samen opgeslagen als één code
+PART_FIELDS = ("guild", "channel", "author", "account")
+
+_COLUMNS = ("timestamp", "type", "source", "name", "iv", "shiny") + PART_FIELDS
+_NO_IV = 255
+
+
+class _Interner:
+    """Append-only tabel string ↔ kleine int."""
+
+    def __init__(self, seed: Iterable[Optional[str]] = ()):
+        self.values: List[Optional[str]] = []
+        self.codes: Dict[Optional[str], int] = {}
+        for v in seed:
+            self.code(v)
+
+    def code(self, v: Optional[str]) -> int:
+        c = self.codes.get(v)
+        if c is None:
+            c = len(self.values)
+            self.values.append(v)
+            self.codes[v] = c
+        return c
+
+
+def _species_table() -> _Interner:
+    # Pokédex-volgorde → stabiele species-ID's; onbekende namen volgen erna
+    return _Interner([None] + species_names())
+
+
+class EventRow(Mapping):
+    """Read-only dict-view op één rij van ColumnarEvents."""
+
+    __slots__ = ("_s", "_i")
+
+    def __init__(self, store: "ColumnarEvents", i: int):
+        self._s = store
+        self._i = i
+
+    def _keys(self):
+        s, i = self._s, self._i
+        keys = ["timestamp", "type", "name", "iv", "shiny"]
+        if s._source[i]:
+            keys.append("source")
+        part = s._parts.values[s._part[i]]
+        if part:
+            keys.extend(f for f, v in zip(PART_FIELDS, part) if v is not None)
+        extra = s._extra[i]
+        if extra:
+            keys.extend(extra)
+        return keys
+
+    def __getitem__(self, key):
+        s, i = self._s, self._i
+        if key == "timestamp":
+            return datetime.fromtimestamp(s._ts[i], s.tz)
+        if key == "type":
+            return s._types.values[s._type[i]]
+        if key == "name":
+            return s._species.values[s._name[i]]
+        if key == "iv":
+            j = 3 * i
+            if s._iv[j] == _NO_IV:
+                return None
+            return (s._iv[j], s._iv[j + 1], s._iv[j + 2])
+        if key == "shiny":
+            return bool(s._shiny[i >> 3] & (1 << (i & 7)))
+        if key == "source":
+            c = s._source[i]
+            if c:
+                return s._sources.values[c]
+            raise KeyError(key)
+        if key in PART_FIELDS:
+            part = s._parts.values[s._part[i]]
+            v = part[PART_FIELDS.index(key)] if part else None
+            if v is not None:
+                return v
+            raise KeyError(key)
+        extra = s._extra[i]
+        if extra and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return f"EventRow({dict(self)!r})"
+
+
+class ColumnarEvents:
+    """
+    Lijst-achtige container (append/insert/extend/clear/slice/iter)
+    met kolom-opslag. Rijen komen terug als EventRow.
+    """
+
+    def __init__(self, tz=None):
+        self.tz = tz
+        self._types = _Interner(TYPES)
+        self._sources = _Interner(SOURCES)
+        self._species = _species_table()
+        self._parts = _Interner([None])
+        self._init_columns()
+
+    def _init_columns(self):
+        self._ts = array("d")
+        self._type = array("B")
+        self._source = array("B")
+        self._name = array("I")
+        self._iv = bytearray()
+        self._shiny = bytearray()
+        self._part = array("H")
+        self._extra: List[Optional[Dict[str, Any]]] = []
+
+    @property
+    def ts(self) -> array:
+        """Gesorteerde epoch-kolom (voor bisect)."""
+        return self._ts
+
+    # ---------------------------------------------------------
+    # Encoderen
+    # ---------------------------------------------------------
+
+    def _encode(self, e: Mapping):
+        ts = e.get("timestamp")
+        t = ts.timestamp() if isinstance(ts, datetime) else float("-inf")
+        iv = e.get("iv")
+        ivb = bytes(iv) if iv and len(iv) == 3 else bytes((_NO_IV, _NO_IV, _NO_IV))
+        extra = {k: v for k, v in e.items() if k not in _COLUMNS and v is not None}
+        part = tuple(e.get(f) for f in PART_FIELDS)
+        return (
+            t,
+            self._types.code(e.get("type")),
+            self._sources.code(e.get("source")),
+            self._species.code(e.get("name")),
+            ivb,
+            bool(e.get("shiny")),
+            self._parts.code(part if any(v is not None for v in part) else None),
+            extra or None,
+        )
+
+    # ---------------------------------------------------------
+    # Shiny bitmap
+    # ---------------------------------------------------------
+
+    def _bit_append(self, n: int, flag: bool):
+        if n & 7 == 0:
+            self._shiny.append(0)
+        if flag:
+            self._shiny[n >> 3] |= 1 << (n & 7)
+
+    def _bit_insert(self, i: int, n: int, flag: bool):
+        """Bit invoegen op positie i (n = huidige lengte); staart schuift op."""
+        if n & 7 == 0:
+            self._shiny.append(0)
+        b = i >> 3
+        tail = int.from_bytes(self._shiny[b:], "little")
+        off = i & 7
+        low = tail & ((1 << off) - 1)
+        high = tail >> off
+        tail = (high << (off + 1)) | (int(flag) << off) | low
+        nbytes = len(self._shiny) - b
+        self._shiny[b:] = (tail & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, "little")
+
+    # ---------------------------------------------------------
+    # Lijst-API
+    # ---------------------------------------------------------
+
+    def append(self, e: Mapping):
+        t, ty, src, name, ivb, shiny, part, extra = self._encode(e)
+        n = len(self._ts)
+        self._ts.append(t)
+        self._type.append(ty)
+        self._source.append(src)
+        self._name.append(name)
+        self._iv += ivb
+        self._bit_append(n, shiny)
+        self._part.append(part)
+        self._extra.append(extra)
+
+    def insert(self, i: int, e: Mapping):
+        n = len(self._ts)
+        if i >= n:
+            return self.append(e)
+        t, ty, src, name, ivb, shiny, part, extra = self._encode(e)
+        self._ts.insert(i, t)
+        self._type.insert(i, ty)
+        self._source.insert(i, src)
+        self._name.insert(i, name)
+        self._iv[3 * i:3 * i] = ivb
+        self._bit_insert(i, n, shiny)
+        self._part.insert(i, part)
+        self._extra.insert(i, extra)
+
+    def __delitem__(self, i):
+        """Eén rij of een aaneengesloten slice (bvb. del events[:k] bij retentie)."""
+        n = len(self._ts)
+        if isinstance(i, slice):
+            lo, hi, step = i.indices(n)
+            if step != 1:
+                raise ValueError("enkel aaneengesloten slices")
+            hi = max(lo, hi)
+        else:
+            if i < 0:
+                i += n
+            if not 0 <= i < n:
+                raise IndexError(i)
+            lo, hi = i, i + 1
+        k = hi - lo
+        if not k:
+            return
+        del self._ts[lo:hi]
+        del self._type[lo:hi]
+        del self._source[lo:hi]
+        del self._name[lo:hi]
+        del self._iv[3 * lo:3 * hi]
+        del self._part[lo:hi]
+        del self._extra[lo:hi]
+        # bitmap: staart vanaf bit hi k plaatsen opschuiven
+        b = lo >> 3
+        tail = int.from_bytes(self._shiny[b:], "little")
+        off = lo & 7
+        low = tail & ((1 << off) - 1)
+        tail = ((tail >> (off + k)) << off) | low
+        nbytes = (n - k + 7) // 8 - b
+        self._shiny[b:] = tail.to_bytes(nbytes, "little") if nbytes > 0 else b""
+
+    def extend(self, events: Iterable[Mapping]):
+        for e in events:
+            self.append(e)
+
+    def clear(self):
+        # in place: de ts-kolom wordt elders (utils._TS) gerefereerd
+        del self._ts[:]
+        del self._type[:]
+        del self._source[:]
+        del self._name[:]
+        self._iv.clear()
+        self._shiny.clear()
+        del self._part[:]
+        self._extra.clear()
+
+    def slice(self, lo: int, hi: int) -> "ColumnarEvents":
+        """Bevroren kopie van rijen lo:hi (tabellen gedeeld: append-only)."""
+        n = len(self._ts)
+        lo, hi = max(0, lo), min(n, hi)
+        hi = max(lo, hi)
+        c = ColumnarEvents.__new__(ColumnarEvents)
+        c.tz = self.tz
+        c._types, c._sources, c._species, c._parts = self._types, self._sources, self._species, self._parts
+        c._ts = self._ts[lo:hi]
+        c._type = self._type[lo:hi]
+        c._source = self._source[lo:hi]
+        c._name = self._name[lo:hi]
+        c._iv = self._iv[3 * lo:3 * hi]
+        bits = int.from_bytes(self._shiny, "little") >> lo
+        nbytes = (hi - lo + 7) // 8
+        c._shiny = bytearray((bits & ((1 << (hi - lo)) - 1)).to_bytes(nbytes, "little"))
+        c._part = self._part[lo:hi]
+        c._extra = self._extra[lo:hi]
+        return c
+
+    def take(self, idx: List[int]) -> "ColumnarEvents":
+        """Kopie van de rijen op posities `idx` (oplopend), tabellen gedeeld."""
+        c = self.slice(0, 0)
+        ts, ty, src, nm, iv, bits, part, extra = (
+            self._ts, self._type, self._source, self._name, self._iv, self._shiny, self._part, self._extra)
+        c._ts = array("d", [ts[i] for i in idx])
+        c._type = array("B", [ty[i] for i in idx])
+        c._source = array("B", [src[i] for i in idx])
+        c._name = array("I", [nm[i] for i in idx])
+        c._iv = bytearray(b"".join([iv[3 * i:3 * i + 3] for i in idx]))
+        out = bytearray((len(idx) + 7) // 8)
+        for j, i in enumerate(idx):
+            if bits[i >> 3] & (1 << (i & 7)):
+                out[j >> 3] |= 1 << (j & 7)
+        c._shiny = out
+        c._part = array("H", [part[i] for i in idx])
+        c._extra = [extra[i] for i in idx]
+        return c
+
+    def copy(self) -> "ColumnarEvents":
+        """Bevroren kopie van alle rijen."""
+        return self.slice(0, len(self._ts))
+
+    def __len__(self):
+        return len(self._ts)
+
+    def __getitem__(self, idx):
+        n = len(self._ts)
+        if isinstance(idx, slice):
+            return [EventRow(self, i) for i in range(*idx.indices(n))]
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError(idx)
+        return EventRow(self, idx)
+
+    def __iter__(self) -> Iterator[EventRow]:
+        for i in range(len(self._ts)):
+            yield EventRow(self, i)
+
+    def __reversed__(self) -> Iterator[EventRow]:
+        for i in range(len(self._ts) - 1, -1, -1):
+            yield EventRow(self, i)
+
+    def nbytes(self) -> int:
+        """Geheugen van de kolommen zelf (zonder tabellen/extra-dicts)."""
+        return (
+            self._ts.itemsize * len(self._ts)
+            + len(self._type) + len(self._source)
+            + self._name.itemsize * len(self._name)
+            + len(self._iv) + len(self._shiny)
+            + self._part.itemsize * len(self._part)
+            + 8 * len(self._extra)
+        )
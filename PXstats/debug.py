@@ -0,0 +1,398 @@
+# PXstats • debug.py • v6.3
+# Diagnostiek op aanvraag voor /debug (main.py) en /debug/* (web.py).
+#
+# Alles staat standaard uit en kost dan niets: geen profiler-hook, geen
+# sampling-thread, geen tracemalloc, geen asyncio-debugmodus. Een sessie
+# zet het aan voor N seconden en ruimt daarna zelf op.
+#
+#   profile  cprofile  deterministisch, enkel de event-loop-thread
+#            sample    thread die elke PX_DEBUG_SAMPLE_MS alle stacks leest
+#                      (ook to_thread-workers en de persist-thread)
+#            → top functies (self + cumulatief)
+#   memory   tracemalloc: snapshot / diff t.o.v. de vorige / stop
+#            → top allocatie-sites; tracing stopt vanzelf na
+#            PX_DEBUG_MEMORY_TTL seconden zonder diff
+#   loop     loop-lag (ticker) + slow callbacks (asyncio debug-modus met
+#            slow_callback_duration) gedurende N seconden
+#
+# Eén sessie per soort tegelijk (anders Busy). Rapporten zijn platte
+# tekst: bijlage in Discord, text/plain over HTTP.
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from PXstats.utils import TZ
+
+MAX_SECONDS = float(os.getenv("PX_DEBUG_MAX_SECONDS", "300"))
+SAMPLE_INTERVAL = float(os.getenv("PX_DEBUG_SAMPLE_MS", "5")) / 1000
+TRACE_FRAMES = int(os.getenv("PX_DEBUG_TRACE_FRAMES", "1"))
+MEMORY_TTL = float(os.getenv("PX_DEBUG_MEMORY_TTL", "3600"))
+TOP = int(os.getenv("PX_DEBUG_TOP", "40"))
+
+PROFILE_MODES = ("cprofile", "sample")
+MEMORY_ACTIONS = ("snapshot", "diff", "stop")
+LOOP_TICK = 0.05
+
+# lopende sessies ("profile", "loop")
+_ACTIVE = set()
+
+
+class Busy(RuntimeError):
+    pass
+
+
+class Report:
+    """Eén rapport: korte samenvatting (chat/log) + volledige tekst (bijlage)."""
+
+    def __init__(self, kind: str, summary: str, text: str):
+        self.kind = kind
+        self.summary = summary
+        self.text = text
+        self.created = datetime.now(TZ)
+
+    @property
+    def filename(self) -> str:
+        return f"pxstats-{self.kind}-{self.created:%Y%m%d-%H%M%S}.txt"
+
+    def encode(self) -> bytes:
+        return self.text.encode("utf-8")
+
+
+def _seconds(s) -> float:
+    try:
+        v = float(s)
+    except (TypeError, ValueError):
+        raise ValueError("seconds moet een getal zijn")
+    if not 0 < v <= MAX_SECONDS:
+        raise ValueError(f"seconds moet tussen 0 en {MAX_SECONDS:g} liggen")
+    return v
+
+
+class _Session:
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    def __enter__(self):
+        if self.kind in _ACTIVE:
+            raise Busy(f"er loopt al een {self.kind}-sessie")
+        _ACTIVE.add(self.kind)
+        return self
+
+    def __exit__(self, *exc):
+        _ACTIVE.discard(self.kind)
+
+
+def _header(title: str, lines: List[str]) -> str:
+    return "\n".join([f"PXstats • {title} • {datetime.now(TZ):%Y-%m-%d %H:%M:%S}", *lines, "", ""])
+
+
+# ======================================================
+# Profiler
+# ======================================================
+
+def _where(key: Tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if not line:
+        return name     # built-in (pstats: ("~", 0, "<built-in ...>"))
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class Sampler:
+    """Sampling-profiler: een daemon-thread leest periodiek sys._current_frames()."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.ticks = 0
+        self.threads: Counter = Counter()
+        self.own: Counter = Counter()
+        self.total: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="px-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.ticks += 1
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                self.threads[tid] += 1
+                seen = set()
+                leaf = True
+                while frame is not None:
+                    code = frame.f_code
+                    key = (code.co_filename, code.co_firstlineno, code.co_name)
+                    if leaf:
+                        self.own[key] += 1
+                        leaf = False
+                    if key not in seen:
+                        # recursie maar één keer tellen
+                        seen.add(key)
+                        self.total[key] += 1
+                    frame = frame.f_back
+
+    def report(self, seconds: float, top: int = TOP) -> Report:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        samples = sum(self.threads.values()) or 1
+        lines = [f"sampling, {seconds:g} s, elke {self.interval * 1000:g} ms: {self.ticks} ticks, {samples} stacks", ""]
+        lines.append("threads (stacks):")
+        for tid, n in self.threads.most_common():
+            lines.append(f"  {n:>7}  {names.get(tid, tid)}")
+        lines += ["", f"top {top} self (leaf-frame; wachten in select/lock telt ook mee):"]
+        for key, n in self.own.most_common(top):
+            lines.append(f"  {n:>7}  {n / samples:>6.1%}  {_where(key)}")
+        lines += ["", f"top {top} cumulatief (op de stack):"]
+        for key, n in self.total.most_common(top):
+            lines.append(f"  {n:>7}  {n / samples:>6.1%}  {_where(key)}")
+        hot = ", ".join(_where(k) for k, _ in self.own.most_common(3)) or "-"
+        return Report("profile", f"sampling {seconds:g} s, {self.ticks} ticks • top: {hot}",
+                      _header("profile", lines))
+
+
+def _pstats_report(prof: cProfile.Profile, seconds: float, top: int) -> Report:
+    buf = io.StringIO()
+    st = pstats.Stats(prof, stream=buf).strip_dirs()
+    buf.write(_header("profile", [f"cProfile, {seconds:g} s, event-loop-thread"]))
+    buf.write(f"top {top} op eigen tijd (tottime):\n")
+    st.sort_stats("tottime").print_stats(top)
+    buf.write(f"\ntop {top} cumulatief:\n")
+    st.sort_stats("cumulative").print_stats(top)
+    rows = sorted(st.stats.items(), key=lambda kv: kv[1][2], reverse=True)[:3]
+    hot = ", ".join(_where(k) for k, _ in rows) or "-"
+    return Report("profile", f"cProfile {seconds:g} s, {st.total_calls:,} calls • top: {hot}", buf.getvalue())
+
+
+async def profile(seconds: float = 10, mode: str = "cprofile", top: int = TOP) -> Report:
+    """Profiler `seconds` lang aan, daarna het rapport. Buiten een sessie: geen hook."""
+    seconds = _seconds(seconds)
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"mode: {' of '.join(PROFILE_MODES)}")
+    with _Session("profile"):
+        print(f"[DEBUG] profiler ({mode}) aan voor {seconds:g} s")
+        if mode == "sample":
+            sampler = Sampler().start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                sampler.stop()
+            return sampler.report(seconds, top)
+
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError as e:
+            # al een andere profiler actief (bvb. een lopende sys.setprofile)
+            raise Busy(str(e))
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            prof.disable()
+        return await asyncio.to_thread(_pstats_report, prof, seconds, top)
+
+
+# ======================================================
+# Geheugen (tracemalloc)
+# ======================================================
+
+_IGNORE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _mb(n: float) -> str:
+    return f"{n / 2**20:,.2f} MB"
+
+
+class MemoryTracker:
+    """tracemalloc op aanvraag: snapshot() start het tracen, stop() of de TTL zet het uit."""
+
+    def __init__(self):
+        self._last: Optional[tracemalloc.Snapshot] = None
+        self._expire: Optional[asyncio.TimerHandle] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def _take(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORE)
+
+    def _usage(self) -> str:
+        cur, peak = tracemalloc.get_traced_memory()
+        return f"getraceerd: {_mb(cur)} (piek {_mb(peak)}), tracemalloc zelf: {_mb(tracemalloc.get_tracemalloc_memory())}"
+
+    def snapshot(self, top: int = TOP) -> Report:
+        with self._lock:
+            fresh = not tracemalloc.is_tracing()
+            if fresh:
+                tracemalloc.start(TRACE_FRAMES)
+            snap = self._take()
+            self._last = snap
+            stats = snap.statistics("lineno")
+            lines = [self._usage()]
+            if fresh:
+                lines.append("tracemalloc net gestart: enkel allocaties vanaf nu zijn zichtbaar, neem later een diff")
+            lines += ["", f"top {top} allocatie-sites (grootte):"]
+            for s in stats[:top]:
+                lines.append(f"  {_mb(s.size):>12}  {s.count:>9,}x  {s.traceback}")
+            total = sum(s.size for s in stats)
+            return Report("memory", f"snapshot: {_mb(total)} in {len(stats):,} sites"
+                                    + (" (tracemalloc gestart)" if fresh else ""),
+                          _header("memory snapshot", lines))
+
+    def diff(self, top: int = TOP) -> Report:
+        with self._lock:
+            if self._last is None or not tracemalloc.is_tracing():
+                raise ValueError("nog geen snapshot: eerst /debug memory snapshot")
+            snap = self._take()
+            stats = snap.compare_to(self._last, "lineno")
+            self._last = snap
+            grown = sum(s.size_diff for s in stats)
+            lines = [self._usage(), f"verschil t.o.v. vorige snapshot: {grown / 2**20:+,.2f} MB", "",
+                     f"top {top} allocatie-sites (groei):"]
+            for s in stats[:top]:
+                lines.append(f"  {s.size_diff / 2**20:>+10.3f} MB  {s.count_diff:>+9,}x  "
+                             f"(nu {_mb(s.size)})  {s.traceback}")
+            top3 = ", ".join(str(s.traceback) for s in stats[:3] if s.size_diff > 0) or "-"
+            return Report("memory", f"diff: {grown / 2**20:+,.2f} MB • groei: {top3}", _header("memory diff", lines))
+
+    def stop(self) -> Report:
+        with self._lock:
+            was = tracemalloc.is_tracing()
+            if was:
+                tracemalloc.stop()
+            self._last = None
+            summary = "tracemalloc gestopt" if was else "tracemalloc stond niet aan"
+            return Report("memory", summary, _header("memory", [summary]))
+
+    def _expired(self):
+        self._expire = None
+        if tracemalloc.is_tracing():
+            print(f"[DEBUG] tracemalloc na {MEMORY_TTL:g} s vanzelf gestopt")
+            self.stop()
+
+    async def run(self, action: str, top: int = TOP) -> Report:
+        if action not in MEMORY_ACTIONS:
+            raise ValueError(f"action: {', '.join(MEMORY_ACTIONS)}")
+        # snapshots/vergelijken kosten tot seconden bij een grote heap
+        report = await asyncio.to_thread(getattr(self, action), *(() if action == "stop" else (top,)))
+        # timer enkel op de loop: (her)start de TTL zolang er getraceerd wordt,
+        # zodat een vergeten sessie niet blijft tracen
+        if self._expire is not None:
+            self._expire.cancel()
+            self._expire = None
+        if tracemalloc.is_tracing():
+            self._expire = asyncio.get_running_loop().call_later(MEMORY_TTL, self._expired)
+        print(f"[DEBUG] memory {action}: {report.summary}")
+        return report
+
+
+MEMORY = MemoryTracker()
+
+
+# ======================================================
+# Event loop
+# ======================================================
+
+_ADDR_RE = re.compile(r" at 0x[0-9a-f]+|\bid=0x[0-9a-f]+")
+
+
+class _SlowCallbacks(logging.Handler):
+    """Vangt asyncio's 'Executing <handle> took X seconds' op (debug-modus)."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.seen: Dict[str, List[float]] = {}
+
+    def emit(self, record: logging.LogRecord):
+        if not str(record.msg).startswith("Executing") or not record.args or len(record.args) < 2:
+            return
+        what = _ADDR_RE.sub("", str(record.args[0]))[:300]
+        self.seen.setdefault(what, []).append(float(record.args[1]))
+
+
+async def loop_report(seconds: float = 10, threshold_ms: float = 100, top: int = TOP) -> Report:
+    """Loop-lag + slow callbacks boven threshold_ms, `seconds` lang."""
+    seconds = _seconds(seconds)
+    if threshold_ms <= 0:
+        raise ValueError("threshold_ms moet positief zijn")
+    with _Session("loop"):
+        loop = asyncio.get_running_loop()
+        logger = logging.getLogger("asyncio")
+        handler = _SlowCallbacks()
+        was_debug, was_slow, was_level = loop.get_debug(), loop.slow_callback_duration, logger.level
+        print(f"[DEBUG] loop-monitor aan voor {seconds:g} s (drempel {threshold_ms:g} ms)")
+        logger.addHandler(handler)
+        if not logger.isEnabledFor(logging.WARNING):
+            logger.setLevel(logging.WARNING)
+        loop.slow_callback_duration = threshold_ms / 1000
+        loop.set_debug(True)
+        lags: List[float] = []
+        try:
+            end = loop.time() + seconds
+            while loop.time() < end:
+                t = loop.time()
+                await asyncio.sleep(LOOP_TICK)
+                lags.append(max(0.0, loop.time() - t - LOOP_TICK) * 1000)
+        finally:
+            loop.set_debug(was_debug)
+            loop.slow_callback_duration = was_slow
+            logger.setLevel(was_level)
+            logger.removeHandler(handler)
+
+    lags.sort()
+
+    def pct(p: float) -> float:
+        return lags[min(len(lags) - 1, int(p / 100 * (len(lags) - 1)))] if lags else 0.0
+
+    slow = sorted(handler.seen.items(), key=lambda kv: max(kv[1]), reverse=True)
+    n_slow = sum(len(v) for v in handler.seen.values())
+    lines = [
+        f"{seconds:g} s, ticker {LOOP_TICK * 1000:g} ms, drempel slow callbacks {threshold_ms:g} ms",
+        "(asyncio debug-modus stond aan: die kost zelf wat overhead)",
+        "",
+        f"loop-lag: p50 {pct(50):.1f} ms, p95 {pct(95):.1f} ms, p99 {pct(99):.1f} ms, "
+        f"max {lags[-1] if lags else 0.0:.1f} ms over {len(lags)} ticks",
+        "",
+        f"slow callbacks: {n_slow}",
+    ]
+    for what, times in slow[:top]:
+        lines.append(f"  {len(times):>5}x  max {max(times) * 1000:>8.1f} ms  "
+                     f"totaal {sum(times) * 1000:>9.1f} ms  {what}")
+    summary = (f"loop-lag p99 {pct(99):.1f} ms, max {lags[-1] if lags else 0.0:.1f} ms • "
+               f"{n_slow} slow callbacks (> {threshold_ms:g} ms)")
+    print(f"[DEBUG] loop: {summary}")
+    return Report("loop", summary, _header("event loop", lines))
+
+
+def active() -> List[str]:
+    """Lopende sessies (voor /debug status)."""
+    out = sorted(_ACTIVE)
+    if tracemalloc.is_tracing():
+        out.append("tracemalloc")
+    return out
@@ -0,0 +1,111 @@
+# PXstats • dedup.py • v4.8
+# Idempotente ingest: elk event krijgt een deterministische key
+#   "<message_id>:<embed_index>:<content_hash>"
+# en een begrensde, tijdsgebonden index weigert duplicaten in O(1):
+#   - zelfde (message, embed-index)  → replay na restart
+#   - zelfde content hash            → PolygonX/Spidey re-post
+# Content-dedup enkel voor embeds mét timestamp (hash begint met "t"):
+# zonder timestamp ("n…") kan identieke inhoud een echte nieuwe encounter zijn.
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+def content_hash(e: Any) -> str:
+    """Stabiele hash van titel, beschrijving, velden en timestamp van een embed."""
+    h = hashlib.blake2b(digest_size=8)
+    for part in (e.title, e.description):
+        h.update((part or "").encode("utf-8"))
+        h.update(b"\x1f")
+    for f in e.fields:
+        h.update(f"{f.name}\x1e{f.value}".encode("utf-8"))
+        h.update(b"\x1f")
+    ts = e.timestamp
+    h.update(ts.isoformat().encode() if ts else b"-")
+    return ("t" if ts else "n") + h.hexdigest()
+
+
+def event_key(message_id: int, index: int, chash: str) -> str:
+    return f"{message_id}:{index}:{chash}"
+
+
+def split_key(key: str) -> Tuple[str, int, str]:
+    mid, idx, chash = key.split(":", 2)
+    return mid, int(idx), chash
+
+
+class DedupIndex:
+    """
+    Key-index met TTL en maximale grootte (oudste eerst eruit).
+    Per key wordt de epoch-timestamp van het event bijgehouden zodat
+    het event later snel terug te vinden is (edits).
+    """
+
+    def __init__(self, ttl: float = 48 * 3600, max_size: int = 200_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._keys: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()  # key → (added, event_ts)
+        self._slots = {}      # (message_id, index) → key
+        self._hashes = {}     # content hash → key (enkel embeds met timestamp)
+        self.rejected = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _drop(self, key: str):
+        self._keys.pop(key, None)
+        mid, idx, chash = split_key(key)
+        if self._slots.get((mid, idx)) == key:
+            del self._slots[(mid, idx)]
+        if self._hashes.get(chash) == key:
+            del self._hashes[chash]
+
+    def _expire(self, now: float):
+        keys = self._keys
+        while keys:
+            key, (added, _) = next(iter(keys.items()))
+            if len(keys) <= self.max_size and now - added < self.ttl:
+                break
+            self._drop(key)
+
+    def slot_key(self, message_id: Any, index: int) -> Optional[str]:
+        return self._slots.get((str(message_id), index))
+
+    def event_ts(self, key: str) -> Optional[float]:
+        v = self._keys.get(key)
+        return v[1] if v else None
+
+    def is_duplicate(self, message_id: Any, index: int, chash: str) -> bool:
+        self._expire(time.time())
+        dup = (str(message_id), index) in self._slots or chash in self._hashes
+        if dup:
+            self.rejected += 1
+        return dup
+
+    def add(self, key: str, event_ts: float, added: Optional[float] = None):
+        now = time.time() if added is None else added
+        mid, idx, chash = split_key(key)
+        old = self._slots.get((mid, idx))
+        if old is not None and old != key:
+            self._drop(old)
+        self._keys[key] = (now, event_ts)
+        self._keys.move_to_end(key)
+        self._slots[(mid, idx)] = key
+        if chash.startswith("t"):
+            self._hashes[chash] = key
+        self._expire(time.time())
+
+    def clear(self):
+        self._keys.clear()
+        self._slots.clear()
+        self._hashes.clear()
+
+
+def index_from_env() -> DedupIndex:
+    return DedupIndex(
+        ttl=float(os.getenv("PX_DEDUP_TTL_HOURS", "48")) * 3600,
+        max_size=int(os.getenv("PX_DEDUP_MAX", "200000")),
+    )
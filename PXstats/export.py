@@ -0,0 +1,127 @@
+# PXstats • export.py • v6.1
+# Streaming CSV-export voor /csv.
+#
+# - rijen komen uit een generator (geen lijst + join in geheugen)
+# - output gaat naar een SpooledTemporaryFile (RAM tot 1 MB, daarna disk)
+# - optioneel gzip
+# - automatisch opsplitsen in delen onder de Discord-uploadlimiet
+# - bedoeld om via asyncio.to_thread() buiten de event loop te draaien
+# - optioneel enkel bepaalde partities (account/kanaal, utils.select_partitions)
+
+import gzip
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PXstats.pokedex import species_key
+from PXstats.utils import iter_events
+
+HEADER = "timestamp,type,name,iv0,iv1,iv2,shiny\n"
+
+# Discord: 10 MiB per upload zonder boost; marge voor multipart-overhead
+MAX_BYTES = int(os.getenv("PX_CSV_MAX_BYTES", str(10 * 1024 * 1024 - 256 * 1024)))
+SPOOL_BYTES = 1024 * 1024
+
+
+def csv_line(e: Dict[str, Any]) -> str:
+    iv = e.get("iv") or [None, None, None]
+    shiny = 1 if e.get("shiny") else 0
+    ts = e.get("timestamp")
+    if isinstance(ts, datetime):
+        ts_str = ts.isoformat()
+    else:
+        ts_str = str(ts)
+    return f"{ts_str},{e.get('type')},{e.get('name')},{iv[0]},{iv[1]},{iv[2]},{shiny}\n"
+
+
+def iter_csv_lines(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    type: Optional[str] = None,
+    species: Optional[str] = None,
+    parts: Optional[List[Any]] = None,
+) -> Iterator[str]:
+    """CSV-regels (zonder header) voor events die aan de filters voldoen."""
+    # "p785", "tapu koko" en "Tapu Koko" filteren allemaal op dezelfde species;
+    # forms tellen mee onder hun basis (zie pokedex.species_key)
+    want = species_key(species) if species else None
+    for e in iter_events(start, end, type, parts):
+        if want is not None and species_key(e.get("name")) != want:
+            continue
+        yield csv_line(e)
+
+
+class _Part:
+    """Eén uitvoerbestand: spool + optionele gzip-laag."""
+
+    def __init__(self, compress: bool):
+        self.spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        self._gz = gzip.GzipFile(fileobj=self.spool, mode="wb") if compress else None
+        self.raw_bytes = 0
+        self.rows = 0
+
+    def write(self, data: bytes):
+        (self._gz or self.spool).write(data)
+        self.raw_bytes += len(data)
+
+    def size(self) -> int:
+        # gzip buffert intern: spool.tell() onderschat licht, vandaar de marge
+        return self.spool.tell() if self._gz else self.raw_bytes
+
+    def close(self) -> io.IOBase:
+        if self._gz is not None:
+            self._gz.close()          # sluit de spool zelf niet
+        self.spool.seek(0)
+        return self.spool
+
+
+def write_csv(
+    lines: Iterable[str],
+    compress: bool = False,
+    max_bytes: int = MAX_BYTES,
+) -> List[Tuple[io.IOBase, int]]:
+    """
+    Schrijf regels weg in één of meer delen, elk met header.
+    Geeft [(fileobj, rows), ...] terug; fileobj staat op positie 0.
+    """
+    header = HEADER.encode("utf-8")
+    parts: List[_Part] = []
+    part = None
+
+    for line in lines:
+        data = line.encode("utf-8")
+        if part is None or (part.rows and part.size() + len(data) > max_bytes):
+            part = _Part(compress)
+            part.write(header)
+            parts.append(part)
+        part.write(data)
+        part.rows += 1
+
+    if not parts:
+        part = _Part(compress)
+        part.write(header)
+        parts.append(part)
+
+    return [(p.close(), p.rows) for p in parts]
+
+
+def export_csv(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    type: Optional[str] = None,
+    species: Optional[str] = None,
+    compress: bool = False,
+    max_bytes: int = MAX_BYTES,
+    parts: Optional[List[Any]] = None,
+) -> List[Tuple[str, io.IOBase, int]]:
+    """Volledige export → [(filename, fileobj, rows), ...]."""
+    files = write_csv(iter_csv_lines(start, end, type, species, parts), compress, max_bytes)
+    ext = ".csv.gz" if compress else ".csv"
+    if len(files) == 1:
+        return [("pxstats" + ext, files[0][0], files[0][1])]
+    return [
+        (f"pxstats_part{i + 1:02d}{ext}", fh, rows)
+        for i, (fh, rows) in enumerate(files)
+    ]
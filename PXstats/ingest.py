@@ -0,0 +1,290 @@
+# PXstats • ingest.py • v6.1
+# Async ingest-queue tussen de gateway-handlers en de opslag.
+#
+# - on_message / on_message_edit zetten enkel ruwe embeds in een begrensde
+#   asyncio.Queue (O(1), geen parsing in de gateway-handler)
+# - één consumer-task haalt batches op: tot PX_INGEST_BATCH embeds, of wat
+#   er binnen PX_INGEST_WAIT_MS na de eerste embed bijkomt
+# - content-hash + parse_polygonx_embed voor de hele batch in een
+#   worker-thread; dedup + bulk insert (utils.add_events) op de loop
+# - per batch één persist.notify() i.p.v. één per bericht
+#
+# Backpressure als de queue vol is (PX_INGEST_POLICY):
+#   block        handler wacht tot er plaats is (default, geen verlies)
+#   drop_new     nieuwe embed weggooien
+#   drop_oldest  oudste wachtende embed weggooien
+# Tellers: px_ingest_overflow_total{policy}, px_ingest_dropped_total{reason}.
+#
+# Edits lopen door dezelfde queue, zodat een edit nooit vóór het
+# originele bericht verwerkt wordt.
+#
+# Elk event krijgt de partitie-tags van het bericht (guild, channel,
+# author, account), zie partitions.py.
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PXstats import metrics
+from PXstats.dedup import content_hash, event_key
+from PXstats.parser import parse_polygonx_embed
+from PXstats.partitions import message_tags
+from PXstats.utils import DEDUP, TZ, add_events, replace_event
+
+POLICIES = ("block", "drop_new", "drop_oldest")
+
+# (edit, message_id, embed-index, embed, ontvangen, auteur, partitie-tags)
+Item = Tuple[bool, int, int, Any, datetime, str, Dict[str, Any]]
+
+
+def _parse(item: Item) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Embed → (content hash, event met deterministische key of None)."""
+    _, mid, idx, e, received, _, tags = item
+    chash = content_hash(e)
+    with metrics.PARSE_SECONDS.time():
+        etype, data = parse_polygonx_embed(e)
+    if not etype:
+        return chash, None
+
+    data["timestamp"] = e.timestamp or received
+    data["type"] = etype
+    data["key"] = event_key(mid, idx, chash)
+    data.update(tags)
+    return chash, data
+
+
+def _parse_batch(batch: List[Item]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    return [_parse(item) for item in batch]
+
+
+class IngestQueue:
+    """Begrensde queue + consumer-task die embeds gebundeld verwerkt."""
+
+    def __init__(
+        self,
+        notify: Callable[[int], None],
+        maxsize: int = 10_000,
+        batch_size: int = 256,
+        batch_wait: float = 0.05,
+        policy: str = "block",
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"onbekende ingest-policy: {policy}")
+        self._notify = notify
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.policy = policy
+
+        self._queue: Optional["asyncio.Queue[Item]"] = None
+        self._task: Optional["asyncio.Task"] = None
+
+        # statistieken
+        self.accepted = 0
+        self.dropped = 0
+        self.batches = 0
+        self.events = 0
+        self.duplicates = 0
+        self.max_batch = 0
+
+    # ---------------------------------------------------------
+    # Publieke API
+    # ---------------------------------------------------------
+
+    def start(self):
+        """Consumer-task starten op de lopende event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="px-ingest")
+        return self
+
+    async def submit(self, msg: Any, edit: bool = False) -> int:
+        """Embeds van een bericht in de queue zetten. Geeft het aantal aanvaarde embeds terug."""
+        if self._queue is None:
+            self.start()
+        received = datetime.now(TZ)
+        author = str(msg.author)
+        tags = message_tags(msg)
+        n = 0
+        for idx, e in enumerate(msg.embeds):
+            if await self._put((edit, msg.id, idx, e, received, author, tags)):
+                n += 1
+        return n
+
+    async def stop(self, timeout: float = 10.0):
+        """Wachtende embeds nog verwerken, dan de consumer stoppen."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            print(f"[INGEST] stop: {self._queue.qsize()} embeds niet meer verwerkt")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.depth(),
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "events": self.events,
+            "duplicates": self.duplicates,
+            "max_batch": self.max_batch,
+        }
+
+    # ---------------------------------------------------------
+    # Backpressure
+    # ---------------------------------------------------------
+
+    async def _put(self, item: Item) -> bool:
+        q = self._queue
+        if q.full():
+            metrics.INGEST_OVERFLOW.inc(self.policy)
+            if self.policy == "drop_new":
+                self._drop("new")
+                return False
+            if self.policy == "drop_oldest":
+                try:
+                    q.get_nowait()
+                    q.task_done()
+                    self._drop("oldest")
+                except asyncio.QueueEmpty:
+                    pass
+        await q.put(item)
+        self.accepted += 1
+        return True
+
+    def _drop(self, reason: str):
+        self.dropped += 1
+        metrics.INGEST_DROPPED.inc(reason)
+        # niet per embed loggen: bij een flood zou de log zelf de bottleneck zijn
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            print(f"[INGEST] queue vol ({self.maxsize}): {self.dropped} embeds weggegooid ({self.policy})")
+
+    # ---------------------------------------------------------
+    # Consumer
+    # ---------------------------------------------------------
+
+    async def _next_batch(self) -> List[Item]:
+        q = self._queue
+        batch = [await q.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(q.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            left = deadline - loop.time()
+            if left <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(q.get(), left))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                print("[INGEST ERROR]", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process(self, batch: List[Item]):
+        t0 = time.perf_counter()
+        # parsing + hashing buiten de event loop
+        parsed = await asyncio.to_thread(_parse_batch, batch)
+
+        pending: List[Dict[str, Any]] = []
+        slots = set()       # (message_id, index) binnen deze batch
+        hashes = set()      # content hashes (met timestamp) binnen deze batch
+        changed = 0
+        skipped = 0
+
+        def _flush():
+            if pending:
+                with metrics.INGEST_SECONDS.time():
+                    add_events(pending)
+                for data in pending:
+                    metrics.EVENTS_TOTAL.inc(data["type"])
+                pending.clear()
+
+        for item, (chash, data) in zip(batch, parsed):
+            edit, mid, idx, _, _, author, _ = item
+            if edit:
+                # edit: eerst alles van vóór de edit invoegen (slot_key moet het kennen)
+                _flush()
+                changed += self._apply_edit(mid, idx, chash, data, author)
+                continue
+
+            slot = (str(mid), idx)
+            if slot in slots or chash in hashes or DEDUP.is_duplicate(mid, idx, chash):
+                metrics.DUPLICATES.inc()
+                skipped += 1
+                continue
+            if data is None:
+                continue
+            slots.add(slot)
+            if chash.startswith("t"):
+                hashes.add(chash)
+            pending.append(data)
+            changed += 1
+
+        _flush()
+        dt = time.perf_counter() - t0
+        metrics.INGEST_BATCH_SECONDS.observe(dt)
+
+        self.batches += 1
+        self.events += changed
+        self.duplicates += skipped
+        self.max_batch = max(self.max_batch, len(batch))
+
+        if skipped:
+            print(f"[INGEST] {skipped} dubbele embed(s) genegeerd")
+        if changed:
+            print(f"[INGEST] batch: {changed} events uit {len(batch)} embeds ({dt * 1000:.0f} ms)")
+            self._notify(changed)
+
+    def _apply_edit(self, mid: int, idx: int, chash: str, data: Optional[Dict[str, Any]], author: str) -> int:
+        """Ge-edit embed: bestaand event bijwerken i.p.v. een tweede toevoegen."""
+        old_key = DEDUP.slot_key(mid, idx)
+        if old_key is not None and old_key.endswith(":" + chash):
+            return 0        # inhoud ongewijzigd
+        if old_key is not None and replace_event(old_key, data):
+            print(f"[INGEST] edit van {author}: event bijgewerkt")
+            return 1
+        if data is not None and not DEDUP.is_duplicate(mid, idx, chash):
+            with metrics.INGEST_SECONDS.time():
+                add_events([data])
+            metrics.EVENTS_TOTAL.inc(data["type"])
+            return 1
+        return 0
+
+
+def ingest_from_env(notify: Callable[[int], None]) -> IngestQueue:
+    return IngestQueue(
+        notify,
+        maxsize=int(os.getenv("PX_INGEST_QUEUE", "10000")),
+        batch_size=int(os.getenv("PX_INGEST_BATCH", "256")),
+        batch_wait=float(os.getenv("PX_INGEST_WAIT_MS", "50")) / 1000,
+        policy=os.getenv("PX_INGEST_POLICY", "block").strip().lower(),
+    )
@@ -0,0 +1,268 @@
+# PXstats • journal.py • v5.5
+# Append-only JSONL journal naast de snapshot (events.json).
+#
+# - Nieuwe events = één JSON-regel per event (append, geen rewrite)
+# - fsync gebundeld: elke N regels of elke X seconden
+# - Compactie in achtergrond: journal wordt geroteerd en samen met
+#   de snapshot herschreven naar een nieuwe events.json
+#
+# Herstelprotocol compactie:
+#   1. journal → <journal>.compacting (rotatie, nieuwe journal start leeg)
+#   2. snapshot wegschrijven naar <snapshot>.tmp + fsync
+#   3. <journal>.compacting verwijderen
+#   4. <snapshot>.tmp → <snapshot> (os.replace)
+# Crash vóór stap 3: .compacting bestaat nog → .tmp negeren.
+# Crash tussen 3 en 4: .tmp is volledig → alsnog vervangen.
+#
+# Het snapshot-formaat is pluggable (write_snapshot): JSON (default) of
+# de binaire events.bin uit binsnap.py.
+#
+# Replay-semantiek (apply_tail, ook voor migrate): een key die opnieuw
+# voorkomt vervangt de oudere versie, {"_deleted": key} wist het event.
+
+import os
+import json
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# Journal-record dat een eerder event (op key) ongedaan maakt
+DELETED = "_deleted"
+
+
+def apply_tail(tail: Iterable[Dict[str, Any]], decode: Callable[[Dict[str, Any]], Any] = lambda e: e):
+    """
+    Journal-records → (nieuwe events, keys die in de snapshot vervallen).
+    Een key die opnieuw voorkomt vervangt een oudere versie; een tombstone
+    wist het event. Keys die niet in de tail zelf zitten, slaan op de snapshot.
+    """
+    items: List[Optional[Any]] = []
+    pos: Dict[str, int] = {}
+    drop = set()
+    for e in tail:
+        gone = e.get(DELETED)
+        if gone is not None:
+            i = pos.pop(gone, None)
+            if i is not None:
+                items[i] = None
+            else:
+                drop.add(gone)
+            continue
+        item = decode(e)
+        key = item.get("key")
+        if key is not None and key in pos:
+            items[pos[key]] = item
+            continue
+        if key is not None:
+            pos[key] = len(items)
+            drop.add(key)           # oudere versie in de snapshot (indien aanwezig)
+        items.append(item)
+    return [e for e in items if e is not None], drop
+
+
+def write_json_snapshot(path: str, events: Iterable[Any], encode: Callable[[Any], Dict[str, Any]]):
+    raw = [encode(e) for e in events]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(raw, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def journal_path_for(snapshot_path: str) -> str:
+    """events.json → events.journal.jsonl"""
+    base, _ = os.path.splitext(snapshot_path)
+    return base + ".journal.jsonl"
+
+
+class EventJournal:
+    """Append-only JSONL log met gebundelde fsync en achtergrond-compactie."""
+
+    def __init__(
+        self,
+        snapshot_path: str = "events.json",
+        journal_path: Optional[str] = None,
+        fsync_every: int = 50,
+        fsync_interval: float = 2.0,
+        compact_after: int = 5000,
+        write_snapshot: Callable[[str, Any, Callable], None] = write_json_snapshot,
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or journal_path_for(snapshot_path)
+        self.compacting_path = self.journal_path + ".compacting"
+        self.tmp_path = snapshot_path + ".tmp"
+
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_after = compact_after
+        self._write_snapshot = write_snapshot
+
+        self._fh = None
+        self._lines = 0          # regels in huidige journal
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+    # ---------------------------------------------------------
+    # Lezen
+    # ---------------------------------------------------------
+
+    def _recover(self):
+        """Maak een onderbroken compactie af of draai ze terug."""
+        if os.path.exists(self.tmp_path):
+            if os.path.exists(self.compacting_path):
+                # stap 2 niet afgerond → tmp is mogelijk onvolledig
+                os.remove(self.tmp_path)
+            else:
+                # stap 3 gedaan, stap 4 niet → tmp is de nieuwe snapshot
+                os.replace(self.tmp_path, self.snapshot_path)
+
+    @staticmethod
+    def _read_lines(path: str) -> Iterable[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # half geschreven laatste regel na crash
+                        print(f"[JOURNAL] corrupte regel overgeslagen in {path}")
+        except FileNotFoundError:
+            return
+
+    def replay(self, decode: Callable[[Dict[str, Any]], Any] = lambda e: e) -> List[Any]:
+        """
+        JSON-snapshot + (compacting) journal teruglezen, met de replay-semantiek
+        van apply_tail: geen tombstones, per key enkel de laatste versie.
+        """
+        self._recover()
+
+        raw: List[Dict[str, Any]] = []
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                raw.extend(json.load(f))
+        except FileNotFoundError:
+            pass
+
+        items, drop = apply_tail(self.replay_tail(), decode)
+        return [decode(e) for e in raw if e.get("key") not in drop] + items
+
+    def replay_tail(self) -> List[Dict[str, Any]]:
+        """Enkel (compacting) journal, zonder snapshot (die leest de caller zelf)."""
+        self._recover()
+
+        raw: List[Dict[str, Any]] = list(self._read_lines(self.compacting_path))
+
+        n = 0
+        for item in self._read_lines(self.journal_path):
+            raw.append(item)
+            n += 1
+        self._lines = n
+        return raw
+
+    # ---------------------------------------------------------
+    # Schrijven
+    # ---------------------------------------------------------
+
+    def _open(self):
+        if self._fh is None:
+            self._fh = open(self.journal_path, "a", encoding="utf-8")
+        return self._fh
+
+    def append(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Schrijf ruwe (JSON-veilige) events als regels. Geeft aantal terug."""
+        with self._lock:
+            fh = self._open()
+            n = 0
+            for item in items:
+                fh.write(json.dumps(item, ensure_ascii=False))
+                fh.write("\n")
+                n += 1
+            if not n:
+                return 0
+            fh.flush()
+            self._lines += n
+            self._unsynced += n
+
+            now = time.monotonic()
+            if self._unsynced >= self.fsync_every or now - self._last_sync >= self.fsync_interval:
+                os.fsync(fh.fileno())
+                self._unsynced = 0
+                self._last_sync = now
+            return n
+
+    def sync(self):
+        with self._lock:
+            if self._fh is not None and self._unsynced:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self._unsynced = 0
+                self._last_sync = time.monotonic()
+
+    def close(self):
+        self.sync()
+        self.wait_compaction()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    # ---------------------------------------------------------
+    # Compactie
+    # ---------------------------------------------------------
+
+    def needs_compaction(self) -> bool:
+        busy = self._compactor is not None and self._compactor.is_alive()
+        return not busy and self._lines >= self.compact_after
+
+    def compact(self, events: List[Any], encode: Callable[[Any], Dict[str, Any]], background: bool = True):
+        """
+        Roteer de journal en schrijf `events` (volledige huidige staat,
+        inclusief alles wat al in de journal stond) als nieuwe snapshot.
+        """
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self._fh.close()
+                self._fh = None
+            if os.path.exists(self.compacting_path):
+                # vorige compactie nooit afgewerkt: eerst samenvoegen
+                with open(self.compacting_path, "a", encoding="utf-8") as dst, \
+                        open(self.journal_path, "r", encoding="utf-8") as src:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            elif os.path.exists(self.journal_path):
+                os.replace(self.journal_path, self.compacting_path)
+            self._lines = 0
+            self._unsynced = 0
+
+        # lijst of bevroren ColumnarEvents-kopie: ongewijzigd doorgeven
+        snapshot = events if hasattr(events, "__len__") else list(events)
+
+        def _run():
+            t0 = time.perf_counter()
+            try:
+                self._write_snapshot(self.tmp_path, snapshot, encode)
+                if os.path.exists(self.compacting_path):
+                    os.remove(self.compacting_path)
+                os.replace(self.tmp_path, self.snapshot_path)
+                dt = (time.perf_counter() - t0) * 1000
+                print(f"[JOURNAL] compactie klaar: {len(snapshot)} records in {dt:.0f} ms")
+            except Exception as e:
+                print("[JOURNAL COMPACT ERROR]", e)
+
+        if background:
+            self._compactor = threading.Thread(target=_run, name="px-compact", daemon=True)
+            self._compactor.start()
+        else:
+            _run()
+
+    def wait_compaction(self):
+        t = self._compactor
+        if t is not None and t.is_alive():
+            t.join()
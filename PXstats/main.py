@@ -1,68 +1,70 @@
-# PXstats • main.py • v4.2 • 2025-11-14
+# PXstats • main.py • v6.3 • 2026-10-17
 
+import io
 import os
-import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
 
 import discord
 from discord import app_commands
 
-from PXstats.parser import parse_polygonx_embed
-from PXstats.stats import build_embed
+from PXstats import debug, metrics, web
+from PXstats.backfill import backfill
+from PXstats.cache import RENDER
+from PXstats.export import export_csv
+from PXstats.ingest import ingest_from_env
+from PXstats.persist import worker_from_env, install_sigterm
+from PXstats.pokedex import normalize_species
+from PXstats.rollups import PERIODS
+from PXstats.stats import build_embed, build_ivstats_embed, build_species_embed
 from PXstats.utils import (
     load_events,
     save_events,
-    add_event,
     EVENTS,
     TZ,
-    last_24h,
-    load_pokedex,
+    events_between,
+    PARTS,
+    get_store,
+    iv_stats,
+    select_partitions,
+    species_stats,
+    summary_view,
 )
 
 print("=== PXstats startup initiated ===")
 
-# Pokédex pre-load (optioneel)
-try:
-    pokedex = load_pokedex()
-    print(f"[INIT] Pokédex geladen: {len(pokedex)} entries")
-except Exception as e:
-    print(f"[INIT ERROR] Pokédex kon niet geladen worden: {e}")
+# Pokédex: wordt lazy geladen bij de eerste lookup (zie pokedex.py)
 
 # Events laden
 load_events()
 
-DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "").strip()
-GUILD_ID = int(os.getenv("GUILD_ID", "0")) or None
+# Write-behind persistentie (disk-I/O buiten de event loop)
+persist = worker_from_env(save_events).start()
 
-intents = discord.Intents.default()
-intents.message_content = True  # nodig om embeds van andere bots te lezen
+# Ingest-queue: on_message zet embeds enkel in de queue
+ingest = ingest_from_env(persist.notify)
 
-bot = discord.Client(intents=intents)
-tree = app_commands.CommandTree(bot)
 
+def _event_count() -> int:
+    store = get_store()
+    return store.count() if store is not None else len(EVENTS)
 
-# ======================================================
-# Keep-alive server (Render)
-# ======================================================
 
-class KeepAlive(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(b"OK")
+# Gauges: pas geëvalueerd bij een scrape van /metrics
+metrics.Gauge("px_events", "Aantal opgeslagen events", _event_count)
+metrics.Gauge("px_persist_queue_depth", "Wachtende persist-meldingen",
+              lambda: persist.stats()["queue_depth"])
+metrics.Gauge("px_ingest_queue_depth", "Wachtende embeds in de ingest-queue", ingest.depth)
 
-    def do_HEAD(self):
-        self.send_response(200)
-        self.end_headers()
-
-
-def start_server():
-    server = HTTPServer(("0.0.0.0", 10000), KeepAlive)
-    server.serve_forever()
+DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "").strip()
+GUILD_ID = int(os.getenv("GUILD_ID", "0")) or None
 
+intents = discord.Intents.default()
+intents.message_content = True  # nodig om embeds van andere bots te lezen
 
-threading.Thread(target=start_server, daemon=True).start()
+bot = discord.Client(intents=intents)
+tree = app_commands.CommandTree(bot)
 
 
 # ======================================================
@@ -99,35 +101,79 @@ async def on_message(msg: discord.Message):
     if not msg.embeds:
         return
 
-    processed = 0
+    # enkel in de queue zetten: parsing en opslag gebeuren gebundeld (ingest.py)
+    await ingest.submit(msg)
+
+
+@bot.event
+async def on_message_edit(before: discord.Message, after: discord.Message):
+    """Ge-edit embed: bestaand event bijwerken i.p.v. een tweede toevoegen."""
+    if after.author == bot.user or not after.embeds:
+        return
+
+    await ingest.submit(after, edit=True)
 
-    for e in msg.embeds:
-        etype, data = parse_polygonx_embed(e)
-        if not etype:
-            continue
 
-        ts = e.timestamp or datetime.now(TZ)
-        data["timestamp"] = ts
-        data["type"] = etype
+# ======================================================
+# Partities (feeder-account / kanaal)
+# ======================================================
 
-        add_event(data)
-        processed += 1
+async def account_autocomplete(inter: discord.Interaction, current: str):
+    cur = current.lower()
+    return [
+        app_commands.Choice(name=a, value=a)
+        for a in PARTS.accounts() if cur in a.lower()
+    ][:25]
 
-    if processed:
-        print(f"[INGEST] processed embeds from {msg.author} ({processed} events)")
-        save_events()
+
+def _scope(account: Optional[str], channel: Optional[discord.TextChannel]) -> Optional[str]:
+    """Label voor de embed-titel (None = alle accounts)."""
+    bits = [account] if account else []
+    if channel is not None:
+        bits.append(f"#{channel.name}")
+    return " • ".join(bits) or None
 
 
 # ======================================================
 # /summary
 # ======================================================
 
-@tree.command(name="summary", description="Toon statistieken van de laatste 24 uur")
-async def summary_cmd(inter: discord.Interaction):
+def _summary_embed(period: str, account: Optional[str], channel: Optional[int], scope: Optional[str]) -> discord.Embed:
+    # enkel de echte render telt: cache-hits komen hier niet langs
+    with metrics.SUMMARY_SECONDS.time():
+        parts = select_partitions(account, channel)
+        return build_embed(agg=summary_view(period, parts), period=period, scope=scope)
+
+
+@tree.command(name="summary", description="Toon statistieken (default laatste 24 uur)")
+@app_commands.describe(
+    period="Periode: 24h, 7d, 30d of all-time",
+    account="Enkel dit feeder-account",
+    channel="Enkel dit feed-kanaal",
+)
+@app_commands.choices(period=[
+    app_commands.Choice(name="Laatste 24 uur", value="24h"),
+    app_commands.Choice(name="Laatste 7 dagen", value="7d"),
+    app_commands.Choice(name="Laatste 30 dagen", value="30d"),
+    app_commands.Choice(name="All-time", value="all"),
+])
+@app_commands.autocomplete(account=account_autocomplete)
+async def summary_cmd(
+    inter: discord.Interaction,
+    period: Optional[app_commands.Choice[str]] = None,
+    account: Optional[str] = None,
+    channel: Optional[discord.TextChannel] = None,
+):
     try:
         await inter.response.defer(ephemeral=False, thinking=False)
-        rows = last_24h(EVENTS)
-        embed = build_embed(rows)
+        p = period.value if period else "24h"
+        cid = channel.id if channel is not None else None
+        scope = _scope(account, channel)
+        # gecachet per ingest-versie + minuut, gelijktijdige calls delen één render
+        embed = await RENDER.get(
+            f"summary:{p}:{(account or '').lower()}:{cid or ''}",
+            lambda: _summary_embed(p, account, cid, scope),
+        )
         await inter.followup.send(embed=embed)
     except Exception as e:
         print("[SUMMARY ERROR]", e)
@@ -137,31 +183,103 @@ async def summary_cmd(inter: discord.Interaction):
             pass
 
 
+# ======================================================
+# /species
+# ======================================================
+
+def _species_embed(name: str, period: str) -> discord.Embed:
+    seconds = PERIODS[period]
+    start = None if seconds is None else datetime.now(TZ) - timedelta(seconds=seconds)
+    return build_species_embed(species_stats(name, start), period)
+
+
+@tree.command(name="species", description="Statistieken voor één Pokémon")
+@app_commands.describe(name="Pokémon (naam of p###)", period="Periode (default 7 dagen)")
+@app_commands.choices(period=[
+    app_commands.Choice(name="Laatste 24 uur", value="24h"),
+    app_commands.Choice(name="Laatste 7 dagen", value="7d"),
+    app_commands.Choice(name="Laatste 30 dagen", value="30d"),
+    app_commands.Choice(name="All-time", value="all"),
+])
+async def species_cmd(
+    inter: discord.Interaction,
+    name: str,
+    period: Optional[app_commands.Choice[str]] = None,
+):
+    try:
+        await inter.response.defer(ephemeral=False, thinking=False)
+        p = period.value if period else "7d"
+        canon = normalize_species(name)
+        embed = await RENDER.get(f"species:{canon.lower()}:{p}", lambda: _species_embed(canon, p))
+        await inter.followup.send(embed=embed)
+    except Exception as e:
+        print("[SPECIES ERROR]", e)
+        try:
+            await inter.followup.send("Er ging iets mis bij /species.")
+        except Exception:
+            pass
+
+
+# ======================================================
+# /ivstats
+# ======================================================
+
+def _ivstats_embed(period: str) -> discord.Embed:
+    seconds = PERIODS[period]
+    start = None if seconds is None else datetime.now(TZ) - timedelta(seconds=seconds)
+    return build_ivstats_embed(iv_stats(start), period)
+
+
+@tree.command(name="ivstats", description="IV-verdeling, vangstratio per soort en heatmap")
+@app_commands.describe(period="Periode (default 30 dagen)")
+@app_commands.choices(period=[
+    app_commands.Choice(name="Laatste 24 uur", value="24h"),
+    app_commands.Choice(name="Laatste 7 dagen", value="7d"),
+    app_commands.Choice(name="Laatste 30 dagen", value="30d"),
+    app_commands.Choice(name="All-time", value="all"),
+])
+async def ivstats_cmd(
+    inter: discord.Interaction,
+    period: Optional[app_commands.Choice[str]] = None,
+):
+    try:
+        await inter.response.defer(ephemeral=False, thinking=False)
+        p = period.value if period else "30d"
+        embed = await RENDER.get(f"ivstats:{p}", lambda: _ivstats_embed(p))
+        await inter.followup.send(embed=embed)
+    except Exception as e:
+        print("[IVSTATS ERROR]", e)
+        try:
+            await inter.followup.send("Er ging iets mis bij /ivstats.")
+        except Exception:
+            pass
+
+
 # ======================================================
 # /recent_shinies
 # ======================================================
 
+def _recent_shinies_text() -> str:
+    since = datetime.now(TZ) - timedelta(hours=24)
+    rows = events_between(since, None, type="Catch")
+    # rows zijn al chronologisch: van achter naar voor lezen
+    shinies = [e for e in reversed(rows) if e.get("shiny")][:5]
+
+    if not shinies:
+        return "Geen shinies gevonden in de laatste 24 uur."
+
+    lines = []
+    for e in shinies:
+        ts = e["timestamp"].strftime("%d %B %Y %H:%M")
+        lines.append(f"{e['name']} {e['iv'][0]}/{e['iv'][1]}/{e['iv'][2]} ({ts})")
+    return "✨ **Laatste Shinies:**\n" + "\n".join(lines)
+
+
 @tree.command(name="recent_shinies", description="Toon de laatste 5 shinies (laatste 24h)")
 async def recent_shinies_cmd(inter: discord.Interaction):
     try:
         await inter.response.defer(ephemeral=False)
-        rows = last_24h(EVENTS)
-        shinies = [
-            e for e in rows
-            if e.get("type") == "Catch" and e.get("shiny")
-        ]
-        shinies = sorted(shinies, key=lambda x: x["timestamp"], reverse=True)[:5]
-
-        if not shinies:
-            await inter.followup.send("Geen shinies gevonden in de laatste 24 uur.")
-            return
-
-        lines = []
-        for e in shinies:
-            ts = e["timestamp"].strftime("%d %B %Y %H:%M")
-            lines.append(f"{e['name']} {e['iv'][0]}/{e['iv'][1]}/{e['iv'][2]} ({ts})")
-
-        await inter.followup.send("✨ **Laatste Shinies:**\n" + "\n".join(lines))
+        await inter.followup.send(await RENDER.get("recent_shinies", _recent_shinies_text))
     except Exception as e:
         print("[SHINIES ERROR]", e)
         await inter.followup.send("Fout bij ophalen van shinies.")
@@ -171,32 +289,239 @@ async def recent_shinies_cmd(inter: discord.Interaction):
 # /csv
 # ======================================================
 
-@tree.command(name="csv", description="Download volledige CSV-log")
-async def csv_cmd(inter: discord.Interaction):
+def _timed_export(*args, **kwargs):
+    with metrics.CSV_SECONDS.time():
+        return export_csv(*args, **kwargs)
+
+
+def _parse_day(s: Optional[str]) -> Optional[datetime]:
+    """'YYYY-MM-DD' → middernacht in TZ (None blijft None)."""
+    if not s:
+        return None
+    return datetime.strptime(s.strip(), "%Y-%m-%d").replace(tzinfo=TZ)
+
+
+@tree.command(name="csv", description="Download CSV-log (optioneel gefilterd)")
+@app_commands.describe(
+    since="Vanaf datum (YYYY-MM-DD)",
+    until="Tot en met datum (YYYY-MM-DD)",
+    type="Enkel dit event-type",
+    species="Enkel deze Pokémon (naam)",
+    gzip="Comprimeer als .csv.gz",
+    account="Enkel dit feeder-account",
+    channel="Enkel dit feed-kanaal",
+)
+@app_commands.choices(type=[
+    app_commands.Choice(name=t, value=t)
+    for t in ("Encounter", "Catch", "Fled", "Quest", "Raid", "Rocket", "MaxBattle", "Hatch")
+])
+@app_commands.autocomplete(account=account_autocomplete)
+async def csv_cmd(
+    inter: discord.Interaction,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    type: Optional[app_commands.Choice[str]] = None,
+    species: Optional[str] = None,
+    gzip: bool = False,
+    account: Optional[str] = None,
+    channel: Optional[discord.TextChannel] = None,
+):
     try:
         await inter.response.defer(ephemeral=True)
 
-        lines = ["timestamp,type,name,iv0,iv1,iv2,shiny"]
-        for e in EVENTS:
-            iv = e.get("iv") or [None, None, None]
-            shiny = 1 if e.get("shiny") else 0
-            ts = e.get("timestamp")
-            if isinstance(ts, datetime):
-                ts_str = ts.isoformat()
-            else:
-                ts_str = str(ts)
-            lines.append(f"{ts_str},{e.get('type')},{e.get('name')},{iv[0]},{iv[1]},{iv[2]},{shiny}")
-
-        csv_bytes = "\n".join(lines).encode("utf-8")
-        file = discord.File(fp=csv_bytes, filename="pxstats.csv")
-        await inter.followup.send(file=file)
+        try:
+            start = _parse_day(since)
+            end = _parse_day(until)
+        except ValueError:
+            await inter.followup.send("Ongeldige datum, gebruik YYYY-MM-DD.")
+            return
+        if end is not None:
+            end += timedelta(days=1)
+
+        # enkel de segmenten van dit account/kanaal (None = alles)
+        selected = select_partitions(account, channel.id if channel is not None else None)
+
+        # export in worker-thread: event loop blijft vrij
+        parts = await asyncio.to_thread(
+            _timed_export,
+            start, end,
+            type.value if type else None,
+            species,
+            gzip,
+            parts=selected,
+        )
+
+        total = len(parts)
+        for i, (filename, fh, rows) in enumerate(parts, 1):
+            try:
+                note = f"Deel {i}/{total} ({rows} rijen)" if total > 1 else None
+                await inter.followup.send(content=note, file=discord.File(fp=fh, filename=filename))
+            finally:
+                fh.close()
     except Exception as e:
         print("[CSV ERROR]", e)
         await inter.followup.send("Fout bij CSV-export.")
 
 
+# ======================================================
+# /backfill
+# ======================================================
+
+_BACKFILL_LOCK = asyncio.Lock()
+
+
+def _parse_since(s: str) -> datetime:
+    """'YYYY-MM-DD' of 'YYYY-MM-DD HH:MM' (TZ)."""
+    dt = datetime.fromisoformat(s.strip())
+    return dt if dt.tzinfo else dt.replace(tzinfo=TZ)
+
+
+@tree.command(name="backfill", description="Gemiste embeds ophalen uit de kanaalgeschiedenis")
+@app_commands.describe(
+    channel="Kanaal met de PolygonX/Spidey-feed",
+    since="Vanaf (YYYY-MM-DD of YYYY-MM-DD HH:MM)",
+)
+@app_commands.default_permissions(manage_guild=True)
+async def backfill_cmd(inter: discord.Interaction, channel: discord.TextChannel, since: str):
+    try:
+        await inter.response.defer(ephemeral=True)
+
+        try:
+            start = _parse_since(since)
+        except ValueError:
+            await inter.followup.send("Ongeldige datum, gebruik YYYY-MM-DD of YYYY-MM-DD HH:MM.")
+            return
+        if _BACKFILL_LOCK.locked():
+            await inter.followup.send("Er loopt al een backfill.")
+            return
+
+        async with _BACKFILL_LOCK:
+            status = await inter.followup.send(f"Backfill {channel.mention} sinds {start:%Y-%m-%d %H:%M}…", wait=True)
+
+            async def progress(stats):
+                try:
+                    await status.edit(content=f"Backfill {channel.mention}: {stats.line()}")
+                except Exception:
+                    pass    # voortgang is best-effort
+
+            stats = await backfill(channel, start, progress=progress, skip_author=bot.user)
+            if stats.events:
+                persist.notify(stats.events)
+    except Exception as e:
+        print("[BACKFILL ERROR]", e)
+        try:
+            await inter.followup.send("Fout bij backfill.")
+        except Exception:
+            pass
+
+
+# ======================================================
+# /debug (admin): profiler, tracemalloc, loop-lag
+# ======================================================
+# Alles staat uit tot een sessie het aanzet, zie debug.py.
+# Dezelfde rapporten via HTTP: /debug/* (web.py, PX_DEBUG_TOKEN).
+
+debug_group = app_commands.Group(
+    name="debug",
+    description="Profiling en geheugen-diagnostiek (admin)",
+    default_permissions=discord.Permissions(administrator=True),
+    guild_only=True,
+)
+
+
+async def _debug_run(inter: discord.Interaction, run):
+    """Admin-check, rapport als bijlage; Busy/ongeldige invoer als tekst."""
+    perms = getattr(inter.user, "guild_permissions", None)
+    if perms is None or not perms.administrator:
+        await inter.response.send_message("Enkel voor admins.", ephemeral=True)
+        return
+    try:
+        await inter.response.defer(ephemeral=True, thinking=True)
+        try:
+            report = await run()
+        except (debug.Busy, ValueError) as e:
+            await inter.followup.send(str(e))
+            return
+        await inter.followup.send(
+            content=report.summary[:2000],
+            file=discord.File(fp=io.BytesIO(report.encode()), filename=report.filename),
+        )
+    except Exception as e:
+        print("[DEBUG ERROR]", e)
+        try:
+            await inter.followup.send("Fout bij /debug.")
+        except Exception:
+            pass
+
+
+@debug_group.command(name="profile", description="Profiler N seconden aan, top functies als bijlage")
+@app_commands.describe(seconds="Duur in seconden (default 10)", mode="cProfile (loop-thread) of sampling (alle threads)")
+@app_commands.choices(mode=[
+    app_commands.Choice(name="cProfile", value="cprofile"),
+    app_commands.Choice(name="Sampling", value="sample"),
+])
+async def debug_profile_cmd(
+    inter: discord.Interaction,
+    seconds: app_commands.Range[int, 1, 300] = 10,
+    mode: Optional[app_commands.Choice[str]] = None,
+):
+    await _debug_run(inter, lambda: debug.profile(seconds, mode.value if mode else "cprofile"))
+
+
+@debug_group.command(name="memory", description="tracemalloc: snapshot, diff met de vorige, of stoppen")
+@app_commands.describe(action="snapshot start het tracen; diff vergelijkt met de vorige snapshot")
+@app_commands.choices(action=[
+    app_commands.Choice(name=a, value=a) for a in debug.MEMORY_ACTIONS
+])
+async def debug_memory_cmd(inter: discord.Interaction, action: app_commands.Choice[str]):
+    await _debug_run(inter, lambda: debug.MEMORY.run(action.value))
+
+
+@debug_group.command(name="loop", description="Event-loop-lag en slow callbacks gedurende N seconden")
+@app_commands.describe(seconds="Duur in seconden (default 10)", threshold_ms="Slow callback vanaf (ms, default 100)")
+async def debug_loop_cmd(
+    inter: discord.Interaction,
+    seconds: app_commands.Range[int, 1, 300] = 10,
+    threshold_ms: app_commands.Range[int, 1, 10_000] = 100,
+):
+    await _debug_run(inter, lambda: debug.loop_report(seconds, threshold_ms))
+
+
+tree.add_command(debug_group)
+
+
 # ======================================================
 # Start bot
 # ======================================================
 
-bot.run(DISCORD_TOKEN)
+async def _shutdown():
+    """SIGTERM: ingest leegmaken, laatste persist-flush, dan de bot sluiten."""
+    await ingest.stop()
+    # join van de persist-thread niet op de loop
+    await asyncio.to_thread(persist.stop)
+    await bot.close()
+
+
+async def _run():
+    # HTTP (health check, /metrics, /api) deelt de loop met de bot en
+    # luistert al vóór de Discord-login, zodat Render de poort meteen ziet
+    server = await web.start()
+    ingest.start()
+    install_sigterm(asyncio.get_running_loop(), _shutdown)
+    try:
+        async with server, bot:
+            await bot.start(DISCORD_TOKEN)
+    finally:
+        # wachtende embeds nog opslaan vóór de laatste persist-flush
+        await ingest.stop()
+
+
+# enkel als script (python -m PXstats.main): benchmarks/bench_e2e.py
+# importeert de handlers zonder gateway-verbinding
+if __name__ == "__main__":
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        persist.stop()
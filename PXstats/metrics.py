@@ -0,0 +1,178 @@
+# PXstats • metrics.py • v5.6
+# Minimale Prometheus-instrumentatie (geen externe dependency).
+#
+# - Counter / Histogram: observe() = een paar int-optellingen, geen lock
+#   (GIL; een zeldzame race tussen threads kost hooguit één telling)
+# - Gauge: callback, pas geëvalueerd bij een scrape
+# - render(): Prometheus text format 0.0.4 voor /metrics
+
+import os
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+_REGISTRY: List["_Metric"] = []
+
+# Default buckets (seconden): 50µs … 10s
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _num(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+def _escape(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.doc = doc
+        self.labels = labels
+        _REGISTRY.append(self)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, doc, labels=()):
+        super().__init__(name, doc, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, n: float = 1):
+        self._values[labels] = self._values.get(labels, 0) + n
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        out = self._header()
+        for lv, v in sorted(self._values.items()):
+            out.append(f"{self.name}{_fmt_labels(self.labels, lv)} {_num(v)}")
+        if not self._values and not self.labels:
+            out.append(f"{self.name} 0")
+        return out
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name, doc, fn: Optional[Callable[[], float]] = None):
+        super().__init__(name, doc)
+        self._fn = fn
+        self._value = 0.0
+
+    def set(self, v: float):
+        self._value = v
+
+    def render(self) -> List[str]:
+        v = self._value
+        if self._fn is not None:
+            try:
+                v = self._fn()
+            except Exception:
+                return []
+        return self._header() + [f"{self.name} {_num(v)}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, doc, buckets=BUCKETS):
+        super().__init__(name, doc)
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)   # laatste = +Inf
+        self._sum = 0.0
+
+    def observe(self, seconds: float):
+        self._counts[bisect_left(self.buckets, seconds)] += 1
+        self._sum += seconds
+
+    def time(self) -> "_Timer":
+        """`with HIST.time(): ...` — goedkoper dan een @contextmanager."""
+        return _Timer(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def render(self) -> List[str]:
+        out = self._header()
+        acc = 0
+        for le, c in zip(self.buckets, self._counts):
+            acc += c
+            out.append(f'{self.name}_bucket{{le="{le:g}"}} {acc}')
+        acc += self._counts[-1]
+        out.append(f'{self.name}_bucket{{le="+Inf"}} {acc}')
+        out.append(f"{self.name}_sum {self._sum:.6f}")
+        out.append(f"{self.name}_count {acc}")
+        return out
+
+
+class _Timer:
+    __slots__ = ("_hist", "_t0")
+
+    def __init__(self, hist: Histogram):
+        self._hist = hist
+
+    def __enter__(self):
+        self._t0 = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._hist.observe(perf_counter() - self._t0)
+        return False
+
+
+def rss_bytes() -> float:
+    """Huidig RSS (Linux /proc), anders piek-RSS via resource."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def render() -> str:
+    lines: List[str] = []
+    for m in _REGISTRY:
+        lines.extend(m.render())
+    return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ------------------------------------------------------------------
+# PXstats-metrics
+# ------------------------------------------------------------------
+
+PARSE_SECONDS = Histogram("px_parse_seconds", "Tijd per parse_polygonx_embed")
+INGEST_SECONDS = Histogram("px_ingest_seconds", "Tijd per insert: add_event of een batch via add_events")
+INGEST_BATCH_SECONDS = Histogram("px_ingest_batch_seconds", "Tijd per ingest-batch (parse + dedup + insert)")
+FLUSH_SECONDS = Histogram("px_persist_flush_seconds", "Tijd per persistentie-flush")
+SUMMARY_SECONDS = Histogram("px_summary_build_seconds", "Tijd per /summary render (enkel cache-misses)")
+CSV_SECONDS = Histogram("px_csv_export_seconds", "Tijd per /csv export", buckets=BUCKETS + (30.0, 60.0))
+
+EVENTS_TOTAL = Counter("px_events_total", "Geïngeste events per type", ("type",))
+PARSE_MISS = Counter("px_parse_miss_total", "Embeds zonder herkend event-type")
+POKEDEX_FALLBACK = Counter("px_pokedex_fallback_total", "p###-ID's die niet in de Pokédex staan")
+DUPLICATES = Counter("px_duplicates_total", "Geweigerde dubbele embeds")
+INGEST_OVERFLOW = Counter("px_ingest_overflow_total", "Embeds aangeboden aan een volle ingest-queue", ("policy",))
+INGEST_DROPPED = Counter("px_ingest_dropped_total", "Embeds weggegooid door backpressure", ("reason",))
+RENDER_CACHE = Counter("px_render_cache_total", "Render-cache lookups per resultaat", ("result",))
+
+RSS = Gauge("px_process_rss_bytes", "Resident set size van het proces", rss_bytes)
@@ -0,0 +1,38 @@
+# PXstats • migrate.py • v4.3
+# Importeer een bestaande events.json (+ journal) in een SQLite-store.
+#
+# Gebruik:
+#   python -m PXstats.migrate [events.json] [events.db]
+
+import sys
+import time
+
+from PXstats.journal import EventJournal
+from PXstats.sqlite_store import SqliteStore
+from PXstats.utils import TZ, decode_event
+
+
+def migrate(src: str = "events.json", dst: str = "events.db", batch: int = 5000) -> int:
+    # zelfde semantiek als load_events: tombstones wissen, laatste versie wint
+    events = EventJournal(snapshot_path=src).replay(decode_event)
+    store = SqliteStore(dst, tz=TZ)
+
+    if store.count():
+        print(f"[MIGRATE] {dst} bevat al {store.count()} records, afgebroken.")
+        store.close()
+        return 0
+
+    t0 = time.perf_counter()
+    n = 0
+    for i in range(0, len(events), batch):
+        n += store.insert_many(events[i:i + batch])
+    store.close()
+
+    dt = time.perf_counter() - t0
+    print(f"[MIGRATE] {n} records van {src} → {dst} in {dt:.1f}s")
+    return n
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    migrate(*args[:2])
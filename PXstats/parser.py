@@ -6,13 +6,18 @@
 # - PolygonX glitch "p 7/9/10"
 # - MaxBattle support (Bread / Tera / Max)
 # - Correct event ordering & indentation fix
+# - v4.7: rule-table classifier (vlakke keyword-tabel, eerste hit wint);
+#         logging enkel met PX_DEBUG=1
+# - v5.0: tellers voor parse-misses en Pokédex-fallbacks (/metrics)
 # -------------------------------------------------------------
 
+import os
 import re
 import unicodedata
 from typing import Tuple, Optional
 
 import discord
+from PXstats import metrics
 from PXstats.pokedex import get_name_from_id
 
 
@@ -20,7 +25,18 @@ from PXstats.pokedex import get_name_from_id
 # Helpers
 # -------------------------------------------------------------
 
+DEBUG = os.getenv("PX_DEBUG", "").strip() not in ("", "0")
+
 IV_TRIPLE = re.compile(r"IV\s*[:：]?\s*(\d{1,2})/(\d{1,2})/(\d{1,2})", re.I)
+IV_MAX = 15
+NAME_RE = re.compile(r"pokemon:\s*([A-Za-zÀ-ÿ' .0-9:-]+)", re.I)
+PID_RE = re.compile(r"\bp\s*0*([0-9]{1,4}(?:-[A-Za-z0-9]+)?)\b", re.I)
+GLITCH_RE = re.compile(r"p\s*[0-9]{1,2}/[0-9]{1,2}/[0-9]{1,2}")
+
+
+def _log(msg: str):
+    if DEBUG:
+        print(msg)
 
 
 def _norm(s: str) -> str:
@@ -32,12 +48,12 @@ def _norm(s: str) -> str:
 
 def _extract_name(desc: str) -> str:
     """Extract Pokémon name or p### ID from text."""
-    m = re.search(r"pokemon:\s*([A-Za-zÀ-ÿ' .0-9:-]+)", desc, re.I)
+    m = NAME_RE.search(desc)
     if m:
         return m.group(1).strip()
 
     # Fallback: p### / p 785 / p1017-C
-    m = re.search(r"\bp\s*0*([0-9]{1,4}(?:-[A-Za-z0-9]+)?)\b", desc, re.I)
+    m = PID_RE.search(desc)
     if m:
         return f"p{m.group(1)}"
 
@@ -45,11 +61,94 @@ def _extract_name(desc: str) -> str:
 
 
 def _extract_iv(desc: str):
-    """Extract IV triple as (atk,def,sta) or None."""
+    """Extract IV triple as (atk,def,sta) or None (ook bij waarden > 15)."""
     m = IV_TRIPLE.search(desc)
     if not m:
         return None
-    return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    iv = (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    if max(iv) > IV_MAX:
+        # regex laat 2 cijfers toe; species.py pakt IV's in 4 bits
+        _log(f"[PARSER] ongeldige IV {iv}, genegeerd")
+        return None
+    return iv
+
+
+# -------------------------------------------------------------
+# Classifier (rule table)
+# -------------------------------------------------------------
+# Volgorde = prioriteit: de eerste regel waarvan een keyword in de tekst
+# voorkomt wint (zelfde gedrag als de vroegere if-chain).
+
+EVENT_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Catch", ("pokemon caught successfully", "pokemon caught")),
+    ("Hatch", ("hatched egg", "hatch")),
+    ("Quest", ("quest",)),
+    ("Rocket", ("rocket", "invasion encounter", "invasion", "grunt", "leader", "giovanni")),
+    ("Raid", ("raid battle encounter", "raid")),
+    ("MaxBattle", ("max battle", "bread battle", "complete bread battle",
+                   "tera raid battle", "tera battle")),
+    ("Fled", ("pokemon flee", "pokemon fled", "ran away", "fleed")),
+    ("Encounter", ("encounter ping", "encounter!", "encounter")),
+)
+
+# Vlaggen (onafhankelijk van het type)
+FLAG_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("shiny", ("shiny",)),
+    ("incense", ("incense",)),
+    ("lure", ("lure encounter", "lure")),
+)
+
+
+def _compile_rules():
+    """
+    Vlakke keyword-tabel in prioriteitsvolgorde: de eerste hit is het type.
+
+    Keywords die nooit als eerste kunnen matchen vallen weg: een keyword
+    dat een eerder keyword (of een korter keyword van hetzelfde label)
+    bevat, wordt altijd al door dat keyword gevonden (bvb. "hatched egg"
+    → "hatch", "tera raid battle" → "raid" van de hogere Raid-regel).
+    Resultaat blijft exact de if-chain, met minder substring-checks.
+    """
+    table = []
+    for label, words in EVENT_RULES:
+        for w in words:
+            if any(k in w for k, _ in table) or any(k != w and k in w for k in words):
+                continue
+            table.append((w, label))
+
+    flags = {}
+    for label, words in FLAG_RULES:
+        flags[label] = tuple(w for w in words if not any(k != w and k in w for k in words))
+    return tuple(table), flags
+
+
+_TYPE_TABLE, _FLAG_WORDS = _compile_rules()
+# Na minimalisatie blijft per vlag precies één keyword over ("lure
+# encounter" bevat "lure"); een rechtstreekse `in`-check is veel
+# goedkoper dan any() over een generator.
+(_SHINY,) = _FLAG_WORDS["shiny"]
+(_INCENSE,) = _FLAG_WORDS["incense"]
+(_LURE,) = _FLAG_WORDS["lure"]
+
+
+def classify(full_norm: str) -> Tuple[Optional[str], str, bool]:
+    """
+    Genormaliseerde tekst → (event_type, source, shiny).
+    source is enkel relevant voor Encounter.
+    """
+    etype = None
+    for w, label in _TYPE_TABLE:
+        if w in full_norm:
+            etype = label
+            break
+
+    src = "wild"
+    if _INCENSE in full_norm:
+        src = "incense"
+    elif _LURE in full_norm:
+        src = "lure"
+
+    return etype, src, _SHINY in full_norm
 
 
 # -------------------------------------------------------------
@@ -86,75 +185,39 @@ def parse_polygonx_embed(e: discord.Embed) -> Tuple[Optional[str], dict]:
     # ---------------------------------------------------------
     # Pokédex mapping
     # ---------------------------------------------------------
-    m_id = re.search(r"\bp\s*0*([0-9]{1,4}(?:-[A-Za-z0-9]+)?)\b", raw)
+    m_id = PID_RE.search(raw)
     if m_id:
         pid = m_id.group(1)          # bvb. "859" of "1017-C"
         resolved = get_name_from_id(pid)
-        print(f"[Pokédex-map] {data['name']} → {resolved}")
+        if resolved == f"p{pid}":
+            metrics.POKEDEX_FALLBACK.inc()
+        _log(f"[Pokédex-map] {data['name']} → {resolved}")
         data["name"] = resolved
 
     # PolygonX glitch: "p 7/9/10"
-    elif re.match(r"p\s*[0-9]{1,2}/[0-9]{1,2}/[0-9]{1,2}", raw):
+    elif GLITCH_RE.match(raw):
         data["name"] = f"Unknown ({raw})"
 
     # ---------------------------------------------------------
-    # SHINY detection
-    # ---------------------------------------------------------
-    if "shiny" in full_norm:
-        data["shiny"] = True
-
-    # ---------------------------------------------------------
-    # EVENT TYPE DETECTION
+    # TYPE + SOURCE + SHINY in één pass
     # ---------------------------------------------------------
+    etype, src, shiny = classify(full_norm)
 
-    # CATCH
-    if "pokemon caught successfully" in full_norm or "pokemon caught" in full_norm:
-        return "Catch", data
-
-    # HATCH
-    if "hatched egg" in full_norm or "hatch" in full_norm:
-        return "Hatch", data
-
-    # QUEST
-    if "quest" in full_norm:
-        return "Quest", data
-
-    # ROCKET
-    if any(x in full_norm for x in ["rocket", "invasion encounter", "invasion", "grunt", "leader", "giovanni"]):
-        return "Rocket", data
-
-    # RAID
-    if "raid battle encounter" in full_norm or "raid" in full_norm:
-        return "Raid", data
-
-    # MAX / BREAD / TERA / ETC
-    if any(x in full_norm for x in [
-        "max battle",
-        "bread battle",
-        "complete bread battle",
-        "tera raid battle",
-        "tera battle",
-    ]):
-        return "MaxBattle", data
+    if shiny:
+        data["shiny"] = True
 
-    # FLED
-    if any(x in full_norm for x in ["pokemon flee", "pokemon fled", "ran away", "fleed"]):
-        return "Fled", data
+    if etype is None:
+        metrics.PARSE_MISS.inc()
+        return None, {}
 
     # ENCOUNTER (wild / incense / lure)
-    if "encounter ping" in full_norm or "encounter!" in full_norm or "encounter" in full_norm:
-        src = "wild"
-        if "incense" in full_norm:
-            src = "incense"
-        elif "lure encounter" in full_norm or "lure" in full_norm:
-            src = "lure"
-
+    if etype == "Encounter":
         return "Encounter", {
             "name": data["name"],
             "source": src,
             "iv": data["iv"],
             "level": data["level"],
-            "shiny": data.get("shiny", False),
+            "shiny": shiny,
         }
 
-    return None, {}
+    return etype, data
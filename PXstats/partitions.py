@@ -0,0 +1,387 @@
+# PXstats • partitions.py • v6.1
+# Events per feeder-account en kanaal: partitie = (guild, channel, author).
+#
+# Elke partitie heeft:
+#   segment   dict-layout: eigen chronologische lijst (referenties naar de
+#             dicts uit utils.EVENTS) + eigen epoch-index (bisect)
+#             columnar: enkel posities (array('I')) in de gedeelde
+#             EVENTS-kolommen, geen kopie van de rijen; een insert/delete
+#             midden in EVENTS verschuift posities → lui herbouwd uit de
+#             part-kolom bij de volgende query
+#   rolling   RollingAggregator (24h)
+#   rollups   Rollups (7d / 30d / all-time)
+#
+# - /summary en /csv met account/channel lezen enkel de gekozen partities
+# - meerdere partities (een account over kanalen heen) → MergedView:
+#   tellers optellen en de latest-lijsten samenvoegen, O(partities), niet
+#   O(events)
+# - zonder filter blijven utils.ROLLING/ROLLUPS gebruikt: die zijn exact
+#   de som van alle partities en al bijgewerkt
+# - events zonder tags (van vóór v6.1, replay van dumps) → (None, None, None)
+# - sqlite-modus: geen segmenten (de store filtert via idx_events_part_ts),
+#   enkel de aggregaten
+#
+# Onderhouden in utils (add_event/replace_event/retentie), herbouwd bij load.
+# Rollups per partitie: <snapshot>.partitions.json, gevalideerd op het
+# totaal aantal events (zoals rollups.json).
+
+import heapq
+import json
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PXstats.aggregates import KEYS, RollingAggregator
+from PXstats.columnar import PART_FIELDS, ColumnarEvents
+from PXstats.rollups import Rollups
+
+PartKey = Tuple[Optional[int], Optional[int], Optional[int]]
+
+
+def part_key(e) -> PartKey:
+    return e.get("guild"), e.get("channel"), e.get("author")
+
+
+def message_tags(msg: Any) -> Dict[str, Any]:
+    """Partitie-tags van een Discord-bericht (velden die ontbreken worden weggelaten)."""
+    guild = getattr(msg, "guild", None)
+    channel = getattr(msg, "channel", None)
+    author = getattr(msg, "author", None)
+    tags = {
+        "guild": getattr(guild, "id", None),
+        "channel": getattr(channel, "id", None),
+        "author": getattr(author, "id", None),
+        "account": str(author) if author is not None else None,
+    }
+    return {k: v for k, v in tags.items() if v is not None}
+
+
+def partitions_path_for(path: str) -> str:
+    """events.json → events.partitions.json, events.db → events.partitions.json"""
+    base, _ = os.path.splitext(path)
+    return base + ".partitions.json"
+
+
+def _epoch(e) -> float:
+    ts = e.get("timestamp")
+    return ts.timestamp() if isinstance(ts, datetime) else float("-inf")
+
+
+class Partition:
+    """Segment + aggregaten van één (guild, channel, author)."""
+
+    def __init__(self, key: PartKey, columnar: bool = False):
+        self.key = key
+        self.account: Optional[str] = None
+        self._columnar = columnar
+        self.rolling = RollingAggregator()
+        self.rollups = Rollups()
+        self.clear()
+
+    @property
+    def guild(self) -> Optional[int]:
+        return self.key[0]
+
+    @property
+    def channel(self) -> Optional[int]:
+        return self.key[1]
+
+    @property
+    def author(self) -> Optional[int]:
+        return self.key[2]
+
+    def label(self) -> str:
+        who = self.account or (str(self.author) if self.author is not None else "onbekend")
+        return f"{who} @ {self.channel}" if self.channel is not None else who
+
+    # ---------------------------------------------------------
+    # Segment
+    # ---------------------------------------------------------
+
+    def clear(self):
+        if self._columnar:
+            self.pos = array("I")           # oplopende posities in utils.EVENTS
+        else:
+            self.events: List[Any] = []
+            self.ts = array("d")
+
+    # insert/remove/prune: enkel dict-layout (columnar: zie PartitionIndex)
+
+    def insert(self, e, t: float):
+        if not self.ts or t >= self.ts[-1]:
+            self.events.append(e)
+            self.ts.append(t)
+        else:
+            i = bisect_right(self.ts, t)
+            self.events.insert(i, e)
+            self.ts.insert(i, t)
+
+    def remove(self, key: str, t: float) -> bool:
+        i = bisect_left(self.ts, t)
+        while i < len(self.ts) and self.ts[i] == t:
+            if self.events[i].get("key") == key:
+                del self.events[i]
+                del self.ts[i]
+                return True
+            i += 1
+        return False
+
+    def prune(self, upto: float) -> int:
+        k = bisect_right(self.ts, upto)
+        if k:
+            del self.events[:k]
+            del self.ts[:k]
+        return k
+
+    def rows(self, start: Optional[float] = None, end: Optional[float] = None,
+             shared: Optional[ColumnarEvents] = None):
+        """Rijen met start <= ts < end: lijst-slice, of (columnar) bevroren take() uit `shared`."""
+        if self._columnar:
+            # globale grenzen op de ts-kolom, dan bisect in de eigen posities
+            lo = 0 if start is None else bisect_left(shared.ts, start)
+            hi = len(shared) if end is None else bisect_left(shared.ts, end)
+            pos = self.pos
+            return shared.take(pos[bisect_left(pos, lo):bisect_left(pos, hi)])
+        lo = 0 if start is None else bisect_left(self.ts, start)
+        hi = len(self.ts) if end is None else bisect_left(self.ts, end)
+        return self.events[lo:hi]
+
+    def __len__(self):
+        return len(self.pos) if self._columnar else len(self.ts)
+
+
+class MergedView:
+    """totals()/latest() over meerdere aggregators (RollingAggregator of RollupView)."""
+
+    def __init__(self, aggs: Iterable[Any]):
+        self._aggs = list(aggs)
+
+    def totals(self, now: Optional[float] = None) -> Dict[str, int]:
+        out = dict.fromkeys(KEYS, 0)
+        for agg in self._aggs:
+            for k, v in agg.totals(now).items():
+                out[k] = out.get(k, 0) + v
+        return out
+
+    def latest(self, which: str, n: int = 5, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        rows = heapq.merge(*(agg.latest(which, n, now=now) for agg in self._aggs), key=_epoch)
+        return list(rows)[-n:]
+
+
+class PartitionIndex:
+    """(guild, channel, author) → Partition."""
+
+    def __init__(self, shared: Optional[ColumnarEvents] = None):
+        # columnar: `shared` is utils.EVENTS, partities bewaren enkel posities
+        self.shared = shared
+        self.columnar = shared is not None
+        self._parts: Dict[PartKey, Partition] = {}
+        self._stale = False     # posities verschoven door insert/delete midden in EVENTS
+
+    def _get(self, key: PartKey, account: Optional[str] = None) -> Partition:
+        p = self._parts.get(key)
+        if p is None:
+            p = self._parts[key] = Partition(key, self.columnar)
+        if account:
+            p.account = account
+        return p
+
+    def get(self, key: PartKey) -> Optional[Partition]:
+        return self._parts.get(key)
+
+    def __iter__(self) -> Iterator[Partition]:
+        return iter(list(self._parts.values()))
+
+    def __len__(self):
+        return len(self._parts)
+
+    # ---------------------------------------------------------
+    # Incrementeel (onder utils._LOCK)
+    # ---------------------------------------------------------
+
+    def add(self, e, memory: bool):
+        """Na de insert in utils.EVENTS."""
+        p = self._get(part_key(e), e.get("account"))
+        if memory:
+            if self.columnar:
+                self._add_pos(p, _epoch(e))
+            else:
+                p.insert(e, _epoch(e))
+        p.rollups.add(e)
+        p.rolling.add(e)
+
+    def _add_pos(self, p: Partition, t: float):
+        # utils voegt achteraan toe als t >= laatste ts, anders vóór een latere
+        # timestamp: enkel in het eerste geval verschuiven er geen posities
+        n = len(self.shared)
+        if not self._stale and self.shared.ts[n - 1] == t:
+            p.pos.append(n - 1)
+        else:
+            self._stale = True
+
+    def remove(self, e, memory: bool):
+        """Na het verwijderen uit utils.EVENTS."""
+        p = self._parts.get(part_key(e))
+        if p is None:
+            return
+        if memory and self.columnar:
+            self._stale = True
+        elif memory and e.get("key"):
+            p.remove(e["key"], _epoch(e))
+        p.rollups.remove(e)
+        p.rolling.remove(e)
+
+    def prune(self, upto: float, keep: Iterable[Any] = ()):
+        """Retentie: segmenten tot upto inkorten (rollups blijven all-time), `keep` terugzetten."""
+        if self.columnar:
+            self._stale = True
+            return
+        for p in self._parts.values():
+            p.prune(upto)
+        for e in keep:
+            self._get(part_key(e)).insert(e, _epoch(e))
+
+    def clear_segments(self):
+        for p in self._parts.values():
+            p.clear()
+        self._stale = False
+
+    def reset(self):
+        self._parts.clear()
+
+    # ---------------------------------------------------------
+    # Load
+    # ---------------------------------------------------------
+
+    def build(self, events):
+        """Segmenten herbouwen uit EVENTS (chronologisch → enkel appends)."""
+        self.clear_segments()
+        if self.columnar:
+            self._reindex()
+            return
+        for e in events:
+            p = self._get(part_key(e), e.get("account"))
+            p.events.append(e)
+            p.ts.append(_epoch(e))
+
+    def _reindex(self):
+        """Columnar: posities per partitie uit de part-kolom van EVENTS (één pass)."""
+        ev = self.shared
+        for p in self._parts.values():
+            p.clear()
+        tags = ev._parts.values
+        codes = ev._part
+        present = set(codes)
+        # enkel partities die nog rijen hebben (de tag-tabel is append-only)
+        targets: List[Optional[Partition]] = [None] * len(tags)
+        for c in present:
+            t = tags[c] or (None,) * len(PART_FIELDS)
+            targets[c] = self._get(t[:3], t[3])
+        if len(present) == 1:
+            targets[present.pop()].pos = array("I", range(len(codes)))
+        else:
+            appends = [p.pos.append if p is not None else None for p in targets]
+            for i, c in enumerate(codes):
+                appends[c](i)
+        self._stale = False
+
+    def rows(self, parts: List[Partition], start: Optional[float] = None,
+             end: Optional[float] = None) -> List[Any]:
+        """Onder utils._LOCK: per partitie de rijen met start <= ts < end."""
+        if self._stale:
+            self._reindex()
+        return [p.rows(start, end, self.shared) for p in parts]
+
+    def reset_rolling(self):
+        for p in self._parts.values():
+            p.rolling.reset()
+
+    def rolling_add(self, e):
+        self._get(part_key(e), e.get("account")).rolling.add(e)
+
+    def reset_rollups(self):
+        for p in self._parts.values():
+            p.rollups.reset()
+
+    def rollups_add(self, e):
+        self._get(part_key(e), e.get("account")).rollups.add(e)
+
+    def prune_rollups(self, now: float):
+        for p in self._parts.values():
+            p.rollups.prune(now)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+
+    def select(self, account: Optional[str] = None, channel: Optional[int] = None) -> List[Partition]:
+        """Partities van een account (naam of author-ID) en/of kanaal."""
+        want = account.strip().lower() if account else None
+        out = []
+        for p in self._parts.values():
+            if channel is not None and p.channel != channel:
+                continue
+            if want is not None and want not in ((p.account or "").lower(), str(p.author)):
+                continue
+            out.append(p)
+        return out
+
+    def accounts(self) -> List[str]:
+        """Gekende feeder-accounts (naam, anders author-ID) voor autocomplete."""
+        names = {p.account or str(p.author) for p in self._parts.values() if p.author is not None}
+        return sorted(names, key=str.lower)
+
+    @staticmethod
+    def view(parts: List[Partition], period: str, now: Optional[float] = None) -> MergedView:
+        """Aggregator voor build_embed over `parts` (24h: rolling, anders rollups)."""
+        if period == "24h":
+            return MergedView(p.rolling for p in parts)
+        return MergedView(p.rollups.view(period, now) for p in parts)
+
+    @staticmethod
+    def iter_rows(rows: List[Any]) -> Iterator[Any]:
+        """Segment-slices (uit Partition.rows) chronologisch samengevoegd."""
+        rows = [r for r in rows if len(r)]
+        if len(rows) == 1:
+            return iter(rows[0])
+        return heapq.merge(*rows, key=_epoch)
+
+    # ---------------------------------------------------------
+    # Persistentie (rollups per partitie)
+    # ---------------------------------------------------------
+
+    def to_dict(self, encode: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        parts = list(self._parts.values())
+        return {
+            "events": sum(p.rollups.events for p in parts),
+            "parts": [
+                {"key": list(p.key), "account": p.account, "rollups": p.rollups.to_dict(encode)}
+                for p in parts
+            ],
+        }
+
+    def save(self, path: str, snapshot: Dict[str, Any]):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def load(self, path: str, decode, expected_events: int) -> bool:
+        """Rollups per partitie; True als het bestand klopt met het aantal events."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if raw.get("events") != expected_events:
+                print(f"[PARTITIONS] {path} verouderd ({raw.get('events')} ≠ {expected_events}), herberekenen")
+                return False
+            for item in raw["parts"]:
+                p = self._get(tuple(item["key"]), item.get("account"))
+                p.rollups.from_dict(item["rollups"], decode)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print("[PARTITIONS LOAD ERROR]", e)
+            return False
@@ -0,0 +1,161 @@
+# PXstats • persist.py • v5.0
+# Write-behind persistentie: disk-I/O gebeurt in een eigen thread,
+# niet in de discord.py event loop.
+#
+# - on_message meldt enkel "dirty" via notify() (queue, O(1))
+# - worker bundelt bursts: één flush per PX_FLUSH_INTERVAL seconden
+#   of zodra PX_FLUSH_EVENTS events wachten
+# - stop() doet een laatste flush; SIGTERM (Render redeploy) plant een
+#   ordelijke shutdown op de event loop (install_sigterm)
+
+import asyncio
+import os
+import queue
+import signal
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from PXstats import metrics
+
+_STOP = object()
+
+
+class PersistWorker:
+    """Achtergrondthread die een flush-functie gebundeld uitvoert."""
+
+    def __init__(
+        self,
+        flush: Callable[[], None],
+        interval: float = 1.0,
+        max_events: int = 100,
+        slow_ms: float = 250.0,
+    ):
+        self._flush_fn = flush
+        self.interval = interval
+        self.max_events = max_events
+        self.slow_ms = slow_ms
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+        # statistieken
+        self.flushes = 0
+        self.flushed_events = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # ---------------------------------------------------------
+    # Publieke API
+    # ---------------------------------------------------------
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="px-persist", daemon=True)
+            self._thread.start()
+        return self
+
+    def notify(self, n: int = 1):
+        """Meld n nieuwe (dirty) events. Niet-blokkerend."""
+        self._queue.put_nowait(n)
+
+    def stop(self, timeout: float = 10.0):
+        """Laatste flush en thread stoppen."""
+        if self._thread is None or self._stopped.is_set():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._stopped.set()
+
+    def stats(self) -> Dict[str, float]:
+        avg = self.total_flush_ms / self.flushes if self.flushes else 0.0
+        return {
+            "queue_depth": self._queue.qsize(),
+            "flushes": self.flushes,
+            "flushed_events": self.flushed_events,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(avg, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+    # ---------------------------------------------------------
+    # Worker
+    # ---------------------------------------------------------
+
+    def _flush(self, n: int):
+        t0 = time.perf_counter()
+        try:
+            self._flush_fn()
+        except Exception as e:
+            print("[PERSIST ERROR]", e)
+        dt = (time.perf_counter() - t0) * 1000
+        metrics.FLUSH_SECONDS.observe(dt / 1000)
+
+        self.flushes += 1
+        self.flushed_events += n
+        self.last_flush_ms = dt
+        self.total_flush_ms += dt
+        self.max_flush_ms = max(self.max_flush_ms, dt)
+
+        if dt >= self.slow_ms:
+            print(f"[PERSIST] trage flush: {n} events in {dt:.0f} ms "
+                  f"(queue={self._queue.qsize()})")
+
+    def _run(self):
+        dirty = 0
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                if dirty:
+                    self._flush(dirty)
+                return
+
+            if item is not None:
+                dirty += item
+                if deadline is None:
+                    deadline = time.monotonic() + self.interval
+
+            if dirty and (dirty >= self.max_events or time.monotonic() >= deadline):
+                self._flush(dirty)
+                dirty = 0
+                deadline = None
+
+
+def worker_from_env(flush: Callable[[], None]) -> PersistWorker:
+    return PersistWorker(
+        flush,
+        interval=float(os.getenv("PX_FLUSH_INTERVAL", "1.0")),
+        max_events=int(os.getenv("PX_FLUSH_EVENTS", "100")),
+    )
+
+
+_SHUTDOWN: Optional["asyncio.Task"] = None
+
+
+def install_sigterm(loop: asyncio.AbstractEventLoop, shutdown: Callable[[], Awaitable[None]]):
+    """
+    SIGTERM (Render redeploy): shutdown() als task op de loop plannen.
+    Geen werk in de signal handler zelf: die kan de main thread onderbreken
+    terwijl die utils._LOCK vasthoudt, en een join daar blokkeert de flush.
+    """
+    def _handler():
+        global _SHUTDOWN
+        if _SHUTDOWN is None:
+            print("[PERSIST] SIGTERM ontvangen, shutdown gepland")
+            _SHUTDOWN = loop.create_task(shutdown(), name="px-shutdown")
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, _handler)
+    except (NotImplementedError, RuntimeError):
+        # Windows / niet in de main thread: enkel de finally in main.py
+        pass
@@ -1,16 +1,61 @@
-# PXstats • pokedex.py • v4.2
-# Leest pokedex.json en mapt ID → naam.
+# PXstats • pokedex.py • v4.9
+# Pokédex lookups (ID ↔ naam) via een vooraf gegenereerde tabel.
+#
+# pokedex.json is de bron; `python -m PXstats.pokedex build` compileert die
+# naar pokedex_table.py:
+#   BASE    tuple, index = nationaal dex-nummer → naam
+#   FORMS   {(nummer, "FORM"): naam}          bvb. (6, "MX") → Charizard-Mega-X
+#   BY_NAME {naam.lower(): "6-MX"}            reverse, case-insensitive
+# De tabel wordt pas bij de eerste lookup geïmporteerd (lazy).
+# Ontbreekt ze, dan wordt pokedex.json rechtstreeks ingelezen.
 
 import os
+import sys
 import json
 from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+_DIR = os.path.dirname(__file__)
+JSON_PATH = os.path.join(_DIR, "pokedex.json")
+TABLE_PATH = os.path.join(_DIR, "pokedex_table.py")
+
+# Compacte species-ID: dex-nummer in de lage 11 bits, form-index erboven
+FORM_SHIFT = 11
+_NUM_MASK = (1 << FORM_SHIFT) - 1
+
+
+def _compile(data: Dict[str, str]):
+    """pokedex.json-dict → (BASE, FORMS, BY_NAME)."""
+    size = max(int(k.split("-", 1)[0]) for k in data) + 1 if data else 1
+    base = [None] * size
+    forms: Dict[Tuple[int, str], str] = {}
+    by_name: Dict[str, str] = {}
+    for key, name in data.items():
+        if "-" in key:
+            num, form = key.split("-", 1)
+            forms[(int(num), form.upper())] = name
+        else:
+            base[int(key)] = name
+        by_name.setdefault(name.lower(), key)
+    return tuple(base), forms, by_name
+
+
+@lru_cache()
+def _table():
+    """Lazy: eerste lookup laadt de gecompileerde tabel."""
+    try:
+        from PXstats import pokedex_table as t
+        return t.BASE, t.FORMS, t.BY_NAME
+    except ImportError:
+        print("[POKEDEX] pokedex_table ontbreekt, val terug op pokedex.json")
+        return _compile(load_pokedex())
 
 
 @lru_cache()
 def load_pokedex():
-    path = os.path.join(os.path.dirname(__file__), "pokedex.json")
+    """Ruwe pokedex.json als dict ("785" → naam)."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with open(JSON_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
         print(f"[POKEDEX] geladen: {len(data)} entries")
         return data
@@ -19,21 +64,131 @@ def load_pokedex():
         return {}
 
 
+def _split(pid) -> Tuple[Optional[int], str]:
+    if isinstance(pid, int):
+        return pid, ""
+    key = str(pid).strip().lstrip("pP").strip()
+    num, _, form = key.partition("-")
+    if not num.isdigit():
+        return None, ""
+    return int(num), form.upper()
+
+
 def get_name_from_id(pid):
     """
     pid kan zijn:
     - int: 785
-    - str: "785" of "785-A"
+    - str: "785" of "785-A" (form hoofdletterongevoelig)
+    Onbekend → "p<pid>". Onbekende form → naam van de basisvorm.
     """
-    dex = load_pokedex()
-
-    key = str(pid)
-    name = dex.get(key)
+    base, forms, _ = _table()
+    num, form = _split(pid)
 
-    if not name and "-" in key:
-        base, _ = key.split("-", 1)
-        name = dex.get(key) or dex.get(base)
+    name = None
+    if num is not None:
+        if form:
+            name = forms.get((num, form))
+        if not name and 0 <= num < len(base):
+            name = base[num]
 
     if not name:
-        return f"p{key}"
+        return f"p{pid}"
     return name
+
+
+def species_names():
+    """Alle namen in tabelvolgorde (basisvormen, dan forms)."""
+    base, forms, _ = _table()
+    return [n for n in base if n] + [forms[k] for k in sorted(forms)]
+
+
+def get_id_from_name(name: str) -> Optional[str]:
+    """Naam (hoofdletterongevoelig) → pokedex-key ("785", "6-MX") of None."""
+    _, _, by_name = _table()
+    return by_name.get((name or "").strip().lower())
+
+
+def normalize_species(text: str) -> str:
+    """'p785', '785', '6-mx' of 'pikachu' → canonieke Pokédex-naam (of text)."""
+    s = (text or "").strip()
+    num, _ = _split(s)
+    if num is not None:
+        return get_name_from_id(s.lstrip("pP").strip())
+    key = get_id_from_name(s)
+    return get_name_from_id(key) if key else s
+
+
+@lru_cache(maxsize=None)
+def _form_codes() -> Tuple[Dict[str, int], Tuple[str, ...]]:
+    _, forms, _ = _table()
+    names = ("",) + tuple(sorted({f for _, f in forms}))
+    return {f: i for i, f in enumerate(names)}, names
+
+
+def species_code(text: str) -> Optional[int]:
+    """Compacte int-ID voor een species (naam of p###), None als onbekend."""
+    key = get_id_from_name(normalize_species(text))
+    if key is None:
+        return None
+    num, form = _split(key)
+    return num | (_form_codes()[0][form] << FORM_SHIFT)
+
+
+def species_name(code: int) -> str:
+    num = code & _NUM_MASK
+    form = _form_codes()[1][code >> FORM_SHIFT]
+    return get_name_from_id(f"{num}-{form}" if form else num)
+
+
+@lru_cache(maxsize=4096)
+def species_key(text: Optional[str]) -> Union[int, str]:
+    """
+    Groepeersleutel voor /species en filters: dex-nummer van de basisvorm.
+    Forms vallen samen met hun basis: vóór v4.9 viel een kleine-letter form
+    ("p6-mx") terug op de basisnaam, dus oude historiek staat onder
+    "Charizard" en nieuwe onder "Charizard-Mega-X". Eén sleutel houdt beide
+    in dezelfde bucket. Onbekende namen → naam in kleine letters.
+    """
+    code = species_code(text or "")
+    if code is None:
+        return (text or "").strip().lower()
+    return code & _NUM_MASK
+
+
+def species_aliases(text: str) -> List[str]:
+    """Alle opgeslagen namen onder species_key(text): basisnaam eerst, dan de forms."""
+    key = species_key(text)
+    if not isinstance(key, int):
+        return [normalize_species(text)]
+    base, forms, _ = _table()
+    names = [base[key]] if key < len(base) and base[key] else []
+    return names + [forms[k] for k in sorted(forms) if k[0] == key]
+
+
+# -------------------------------------------------------------
+# Build: pokedex.json → pokedex_table.py
+# -------------------------------------------------------------
+
+def build(path: str = TABLE_PATH) -> str:
+    base, forms, by_name = _compile(load_pokedex())
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# PXstats • pokedex_table.py\n")
+        f.write("# GEGENEREERD door `python -m PXstats.pokedex build` — niet met de hand aanpassen.\n\n")
+        f.write(f"BASE = {base!r}\n\n")
+        f.write("FORMS = {\n")
+        for k in sorted(forms):
+            f.write(f"    {k!r}: {forms[k]!r},\n")
+        f.write("}\n\n")
+        f.write("BY_NAME = {\n")
+        for k in sorted(by_name):
+            f.write(f"    {k!r}: {by_name[k]!r},\n")
+        f.write("}\n")
+    print(f"[POKEDEX] tabel geschreven: {path} ({len(base) - 1} basis, {len(forms)} forms)")
+    return path
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["build"]:
+        build()
+    else:
+        print("Gebruik: python -m PXstats.pokedex build")
@@ -0,0 +1,403 @@
+# PXstats • replay.py • v5.8
+# Offline her-ingest van ruwe embed-dumps (na parser-fixes) naar een
+# nieuwe event-store.
+#
+# Invoer (meerdere bestanden mogelijk, .gz wordt transparant gelezen):
+#   *.jsonl   één record per regel:
+#               embed-dict                         {"title": …, "description": …}
+#               bericht met embeds                 {"id": …, "timestamp": …, "embeds": [...]}
+#               embed met herkomst                 {"message_id": …, "index": …, "embed": {...}}
+#   *.json    Discord-export (DiscordChatExporter): {"messages": [...]}
+#             (niet streambaar: wordt in één keer ingelezen)
+#
+# Uitvoer volgens extensie: .json (snapshot), .bin (binsnap.py), .db (SQLite).
+#
+# - records worden in chunks over alle cores verdeeld (multiprocessing);
+#   JSON-decoding, Embed.from_dict, content-hash en parse_polygonx_embed
+#   gebeuren in de workers, de volgorde van de invoer blijft behouden
+# - dedup zoals live ingest: zelfde (bericht, index) of zelfde content hash
+# - tijd: embed-timestamp, anders die van het bericht (veld of snowflake-id);
+#   records zonder enige tijd worden overgeslagen en geteld ("zonder tijd")
+# - checkpoints: geparste events gaan append-only naar <out>.partial;
+#   <out>.ckpt.json bewaart (bestand, record, lengte van .partial).
+#   --resume gaat verder vanaf het laatste checkpoint
+# - rapport: records/s tijdens en na de run
+#
+# Gebruik:
+#   python -m PXstats.replay dump.jsonl.gz --out events.json
+#   python -m PXstats.replay export-*.json --out events.bin --workers 8
+#   python -m PXstats.replay dump.jsonl --out events.json --resume
+
+import argparse
+import gzip
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import discord
+
+from PXstats.dedup import content_hash, event_key, split_key
+from PXstats.journal import journal_path_for
+from PXstats.parser import parse_polygonx_embed
+from PXstats.partitions import partitions_path_for
+from PXstats.rollups import rollups_path_for
+from PXstats.utils import TZ, decode_event, encode_event
+
+REPORT_EVERY = 5.0
+
+# worker-resultaat voor een herkend event zonder enige tijd: wordt geteld, niet geschreven
+UNTIMED = "untimed"
+
+# (bestand-index, record-index, ruwe regel of dict)
+Record = Tuple[int, int, Any]
+
+
+# ======================================================
+# Invoer
+# ======================================================
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def read_records(paths: List[str], start: Tuple[int, int] = (0, 0)) -> Iterator[Record]:
+    """Records uit alle dumps, vanaf (bestand, record) = start."""
+    for fi, path in enumerate(paths):
+        if fi < start[0]:
+            continue
+        skip = start[1] if fi == start[0] else 0
+        with _open(path) as f:
+            if path.removesuffix(".gz").endswith(".json"):
+                rows = json.load(f)
+                rows = rows.get("messages", []) if isinstance(rows, dict) else rows
+                for ri, row in enumerate(rows):
+                    if ri >= skip:
+                        yield fi, ri, row
+                continue
+            ri = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                if ri >= skip:
+                    yield fi, ri, line      # JSON-decoding gebeurt in de worker
+                ri += 1
+
+
+def _embed_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """DiscordChatExporter-velden (isInline) → Discord API-vorm."""
+    fields = raw.get("fields")
+    if fields and "isInline" in fields[0]:
+        raw = dict(raw, fields=[
+            {"name": f.get("name", ""), "value": f.get("value", ""), "inline": f.get("isInline", False)}
+            for f in fields
+        ])
+    return raw
+
+
+def _embeds(fi: int, ri: int, obj: Any) -> Iterator[Tuple[Any, int, Dict[str, Any], Optional[datetime]]]:
+    """Record → (message-id, embed-index, embed-dict, bericht-tijd of None)."""
+    if isinstance(obj, str):
+        obj = json.loads(obj)
+    # zonder bericht-id: synthetische id op basis van de positie in de dump
+    synthetic = f"r{fi}-{ri}"
+    if "embeds" in obj:
+        created = _message_time(obj.get("id"), obj.get("timestamp"))
+        for idx, e in enumerate(obj["embeds"]):
+            yield obj.get("id") or synthetic, idx, _embed_dict(e), created
+    elif "embed" in obj:
+        mid = obj.get("message_id")
+        yield mid or synthetic, obj.get("index", 0), _embed_dict(obj["embed"]), _message_time(mid, obj.get("timestamp"))
+    else:
+        # kale embed-dict: enkel zijn eigen "timestamp" (via Embed.from_dict)
+        yield synthetic, 0, _embed_dict(obj), None
+
+
+def _message_time(mid: Any, created: Optional[str]) -> Optional[datetime]:
+    """Berichttijd: expliciet veld, anders uit de snowflake-id van Discord."""
+    if created:
+        return datetime.fromisoformat(created)
+    if isinstance(mid, int) or (isinstance(mid, str) and mid.isdigit()):
+        return discord.utils.snowflake_time(int(mid))
+    return None
+
+
+# ======================================================
+# Worker
+# ======================================================
+
+def _parse_chunk(chunk: List[Record]):
+    """
+    In een worker-proces: records → [(mid, index, hash, event of None)],
+    aantal fouten, aantal records en positie (bestand, record) van het laatste.
+    Een event zonder embed- of berichttijd wordt UNTIMED (nooit timestamp None).
+    """
+    out = []
+    errors = 0
+    for fi, ri, obj in chunk:
+        try:
+            for mid, idx, raw, created in _embeds(fi, ri, obj):
+                e = discord.Embed.from_dict(raw)
+                chash = content_hash(e)
+                etype, data = parse_polygonx_embed(e)
+                ts = e.timestamp or created
+                if not etype:
+                    data = None
+                elif ts is None:
+                    data = UNTIMED
+                else:
+                    data["timestamp"] = ts.astimezone(TZ)
+                    data["type"] = etype
+                    data["key"] = event_key(mid, idx, chash)
+                out.append((str(mid), idx, chash, data))
+        except Exception:
+            errors += 1
+    return out, errors, len(chunk), chunk[-1][:2]
+
+
+def _init_worker():
+    # parser-logging per embed zou de workers domineren
+    sys.stdout = open(os.devnull, "w")
+
+
+# ======================================================
+# Checkpoints
+# ======================================================
+
+class Checkpoint:
+    def __init__(self, out: str):
+        self.path = out + ".ckpt.json"
+        self.partial = out + ".partial"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict[str, Any]):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        for p in (self.path, self.partial):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+# ======================================================
+# Uitvoer
+# ======================================================
+
+def _sorted_lines(partial: str) -> List[str]:
+    """Regels "epoch<TAB>json" uit .partial, chronologisch (stabiel)."""
+    with open(partial, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if line.strip()]
+    lines.sort(key=lambda s: float(s.split("\t", 1)[0]))
+    return [s.split("\t", 1)[1] for s in lines]
+
+
+def write_store(partial: str, out: str) -> int:
+    """.partial → nieuwe store (atomisch voor .json/.bin)."""
+    lines = _sorted_lines(partial)
+    if out.endswith(".db"):
+        from PXstats.sqlite_store import SqliteStore
+        store = SqliteStore(out, tz=TZ)
+        for i in range(0, len(lines), 5000):
+            store.insert_many(decode_event(json.loads(s)) for s in lines[i:i + 5000])
+        store.close()
+        return len(lines)
+
+    tmp = out + ".tmp"
+    if out.endswith(".bin"):
+        from PXstats import binsnap
+        binsnap.dump(tmp, (decode_event(json.loads(s)) for s in lines), TZ)
+    else:
+        # regels zijn al JSON: enkel samenvoegen
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[")
+            f.write(",".join(lines))
+            f.write("]")
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, out)
+    return len(lines)
+
+
+def _clear_out(out: str):
+    """Oude store + afgeleide bestanden weg (anders speelt een oude journal mee)."""
+    for p in (out, journal_path_for(out), rollups_path_for(out), partitions_path_for(out),
+              out + "-wal", out + "-shm"):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+# ======================================================
+# Replay
+# ======================================================
+
+class Stats:
+    def __init__(self, done: Dict[str, int]):
+        self.records = done.get("records", 0)
+        self.embeds = done.get("embeds", 0)
+        self.events = done.get("events", 0)
+        self.duplicates = done.get("duplicates", 0)
+        self.misses = done.get("misses", 0)
+        self.untimed = done.get("untimed", 0)
+        self.errors = done.get("errors", 0)
+        self.t0 = time.perf_counter()
+        self.base = self.records
+
+    def rate(self) -> float:
+        dt = time.perf_counter() - self.t0
+        return (self.records - self.base) / dt if dt else 0.0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {k: getattr(self, k) for k in ("records", "embeds", "events", "duplicates", "misses", "untimed", "errors")}
+
+    def line(self) -> str:
+        return (f"{self.records:,} records, {self.embeds:,} embeds → {self.events:,} events "
+                f"({self.duplicates:,} dubbel, {self.misses:,} onherkend, {self.untimed:,} zonder tijd, "
+                f"{self.errors:,} fouten), "
+                f"{self.rate():,.0f} records/s")
+
+
+def _seen_from_partial(partial: str) -> Tuple[set, set]:
+    slots, hashes = set(), set()
+    with open(partial, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            key = json.loads(line.split("\t", 1)[1]).get("key")
+            if key:
+                mid, idx, chash = split_key(key)
+                slots.add((mid, idx))
+                if chash.startswith("t"):
+                    hashes.add(chash)
+    return slots, hashes
+
+
+def replay(
+    paths: List[str],
+    out: str,
+    workers: Optional[int] = None,
+    chunk: int = 2000,
+    checkpoint_every: int = 50,
+    resume: bool = False,
+    force: bool = False,
+) -> Stats:
+    ckpt = Checkpoint(out)
+    state = ckpt.load() if resume else None
+    if state is not None and state.get("inputs") != paths:
+        raise SystemExit(f"[REPLAY] checkpoint hoort bij andere invoer: {state.get('inputs')}")
+    if state is None:
+        if os.path.exists(out) and not force:
+            raise SystemExit(f"[REPLAY] {out} bestaat al (gebruik --force om te vervangen)")
+        ckpt.clear()
+
+    slots, hashes = set(), set()
+    start = (0, 0)
+    if state is not None:
+        # enkel wat vóór het checkpoint geschreven werd telt
+        with open(ckpt.partial, "r+b") as f:
+            f.truncate(state["partial_bytes"])
+        slots, hashes = _seen_from_partial(ckpt.partial)
+        start = (state["file"], state["record"])
+        print(f"[REPLAY] hervat vanaf bestand {start[0]}, record {start[1]:,}")
+    stats = Stats(state["stats"] if state else {})
+
+    def _chunks() -> Iterator[List[Record]]:
+        buf: List[Record] = []
+        for rec in read_records(paths, start):
+            buf.append(rec)
+            if len(buf) >= chunk:
+                yield buf
+                buf = []
+        if buf:
+            yield buf
+
+    workers = workers or os.cpu_count() or 1
+    last_report = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool, \
+            open(ckpt.partial, "a", encoding="utf-8") as part:
+        # imap: volgorde van de invoer blijft behouden (checkpoints kloppen)
+        for n, (rows, errors, count, (fi, ri)) in enumerate(pool.imap(_parse_chunk, _chunks()), 1):
+            stats.records += count
+            stats.errors += errors
+            for mid, idx, chash, data in rows:
+                stats.embeds += 1
+                if (mid, idx) in slots or chash in hashes:
+                    stats.duplicates += 1
+                    continue
+                if data is None:
+                    stats.misses += 1
+                    continue
+                if data == UNTIMED:
+                    stats.untimed += 1
+                    continue
+                slots.add((mid, idx))
+                if chash.startswith("t"):
+                    hashes.add(chash)
+                ts = data["timestamp"].timestamp()
+                part.write(f"{ts!r}\t{json.dumps(encode_event(data), ensure_ascii=False)}\n")
+                stats.events += 1
+
+            if n % checkpoint_every == 0:
+                part.flush()
+                os.fsync(part.fileno())
+                ckpt.save({"inputs": paths, "file": fi, "record": ri + 1,
+                           "partial_bytes": part.tell(), "stats": stats.to_dict()})
+            if time.perf_counter() - last_report >= REPORT_EVERY:
+                last_report = time.perf_counter()
+                print(f"[REPLAY] {stats.line()}")
+
+    t0 = time.perf_counter()
+    if force:
+        _clear_out(out)
+    n = write_store(ckpt.partial, out)
+    ckpt.clear()
+    print(f"[REPLAY] klaar: {stats.line()}")
+    print(f"[REPLAY] {n:,} events → {out} ({time.perf_counter() - t0:.1f} s schrijven)")
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m PXstats.replay",
+        description="Ruwe embed-dumps (.jsonl/.json, optioneel .gz) opnieuw parsen "
+                    "en naar een nieuwe event-store schrijven (.json, .bin of .db).",
+    )
+    ap.add_argument("inputs", nargs="+", help="embed-dumps (.jsonl, .json, optioneel .gz)")
+    ap.add_argument("--out", default="events.json", help="nieuwe store: .json, .bin of .db")
+    ap.add_argument("--workers", type=int, default=None, help="processen (default: alle cores)")
+    ap.add_argument("--chunk", type=int, default=2000, help="records per worker-taak")
+    ap.add_argument("--checkpoint-every", type=int, default=50, help="chunks tussen checkpoints")
+    ap.add_argument("--resume", action="store_true", help="verder vanaf het laatste checkpoint")
+    ap.add_argument("--force", action="store_true", help="bestaande store vervangen")
+    args = ap.parse_args(argv)
+
+    replay(
+        [os.path.abspath(p) for p in args.inputs],
+        args.out,
+        workers=args.workers,
+        chunk=args.chunk,
+        checkpoint_every=args.checkpoint_every,
+        resume=args.resume,
+        force=args.force,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
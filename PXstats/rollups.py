@@ -0,0 +1,211 @@
+# PXstats • rollups.py • v5.3
+# Hiërarchische rollups voor lange /summary-vensters (7d, 30d, all-time).
+#
+#   minuut → RollingAggregator (aggregates.py, laatste 24h)
+#   uur    → ROLLUP_HOURS_DAYS dagen bewaard (randen van 7d/30d)
+#   dag    → volledige historiek
+#
+# Zelfde tellers als build_embed (aggregates.KEYS) + het totaal aantal
+# events. add()/remove() zijn O(1); een venster van 30 dagen kost hooguit
+# ~48 uur-rijen + 30 dag-rijen, onafhankelijk van de historiek.
+# Uren/dagen zijn UTC-epoch-gebaseerd zodat uren exact in dagen passen.
+#
+# Persistentie: <snapshot>.rollups.json (atomisch via .tmp + os.replace).
+# Bij het laden wordt het bestand enkel gebruikt als het aantal events
+# klopt met de opslag; anders worden de rollups opnieuw opgebouwd.
+
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from PXstats.aggregates import KEYS, event_keys, is_perfect
+
+# Index van het event-totaal in een bucket (na de KEYS-tellers)
+N = len(KEYS)
+
+HOURS_DAYS = int(os.getenv("PX_ROLLUP_HOURS_DAYS", "35"))
+
+# /summary period → seconden (None = all-time)
+PERIODS = {"24h": 86400, "7d": 7 * 86400, "30d": 30 * 86400, "all": None}
+
+
+def rollups_path_for(path: str) -> str:
+    """events.json → events.rollups.json, events.db → events.rollups.json"""
+    base, _ = os.path.splitext(path)
+    return base + ".rollups.json"
+
+
+def _epoch(ts) -> Optional[float]:
+    if isinstance(ts, datetime):
+        return ts.timestamp()
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    return None
+
+
+class Rollups:
+    """Uur- en dag-tellers + laatste catches/shinies/100 IV over de hele historiek."""
+
+    def __init__(self, hours_days: int = HOURS_DAYS, latest: int = 32):
+        self.hours_days = hours_days
+        self._latest_n = latest
+        self.reset()
+
+    def reset(self):
+        self.hours: Dict[int, List[int]] = {}    # epoch-uur → tellers
+        self.days: Dict[int, List[int]] = {}     # epoch-dag → tellers
+        self._last_prune = int(time.time() // 3600)
+        self.latest_catches: Deque[Dict[str, Any]] = deque(maxlen=self._latest_n)
+        self.latest_shinies: Deque[Dict[str, Any]] = deque(maxlen=self._latest_n)
+        self.latest_perfect: Deque[Dict[str, Any]] = deque(maxlen=self._latest_n)
+
+    @property
+    def events(self) -> int:
+        return sum(b[N] for b in self.days.values())
+
+    # ---------------------------------------------------------
+
+    def _apply(self, e: Dict[str, Any], delta: int):
+        t = _epoch(e.get("timestamp"))
+        if t is None:
+            return
+        idx = event_keys(e)
+        h = int(t // 3600)
+        targets = [self.days.setdefault(h // 24, [0] * (N + 1))]
+        if h >= self._last_prune - self.hours_days * 24:
+            targets.append(self.hours.setdefault(h, [0] * (N + 1)))
+        for b in targets:
+            b[N] += delta
+            for i in idx:
+                b[i] += delta
+
+    def add(self, e: Dict[str, Any]):
+        self._apply(e, 1)
+        if e.get("type") == "Catch":
+            self.latest_catches.append(e)
+            if e.get("shiny"):
+                self.latest_shinies.append(e)
+            if is_perfect(e.get("iv")):
+                self.latest_perfect.append(e)
+
+    def remove(self, e: Dict[str, Any]):
+        self._apply(e, -1)
+        key = e.get("key")
+        for dq in (self.latest_catches, self.latest_shinies, self.latest_perfect):
+            for x in list(dq):
+                if x is e or (key is not None and x.get("key") == key):
+                    dq.remove(x)
+
+    def prune(self, now: float):
+        """Uur-rijen ouder dan hours_days dagen weggooien (dagen blijven)."""
+        now_h = int(now // 3600)
+        self._last_prune = now_h
+        cutoff = now_h - self.hours_days * 24
+        for h in [h for h in self.hours if h < cutoff]:
+            del self.hours[h]
+
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _sum(out: List[int], rows: Iterable[Optional[List[int]]]):
+        for b in rows:
+            if b:
+                for i, v in enumerate(b):
+                    out[i] += v
+
+    def totals_since(self, cutoff: Optional[float], now: float) -> Dict[str, int]:
+        """
+        Tellers voor events met timestamp >= cutoff (uur-resolutie aan de rand).
+        cutoff=None → all-time.
+        """
+        out = [0] * (N + 1)
+        if cutoff is None:
+            self._sum(out, self.days.values())
+        else:
+            h0 = -(-int(cutoff) // 3600)             # eerste volledige uur
+            h1 = int(now // 3600)                    # huidig (lopend) uur
+            d0 = -(-h0 // 24)                        # eerste volledige dag
+            d1 = (h1 + 1) // 24                      # dag van het huidige uur
+            if d0 < d1:
+                hours = list(range(h0, d0 * 24)) + list(range(d1 * 24, h1 + 1))
+                self._sum(out, (self.days.get(d) for d in range(d0, d1)))
+            else:
+                hours = range(h0, h1 + 1)
+            self._sum(out, (self.hours.get(h) for h in hours))
+        t = dict(zip(KEYS, out))
+        t["events"] = out[N]
+        return t
+
+    def latest_since(self, which: str, cutoff: Optional[float], n: int = 5) -> List[Dict[str, Any]]:
+        src = getattr(self, f"latest_{which}")
+        if cutoff is None:
+            return list(src)[-n:]
+        return [e for e in src if (_epoch(e.get("timestamp")) or 0) >= cutoff][-n:]
+
+    def view(self, period: str, now: Optional[float] = None) -> "RollupView":
+        return RollupView(self, PERIODS[period], now)
+
+    # ---------------------------------------------------------
+    # Persistentie
+    # ---------------------------------------------------------
+
+    def to_dict(self, encode: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "keys": list(KEYS),
+            "events": self.events,
+            "hours": {str(k): list(v) for k, v in self.hours.items()},
+            "days": {str(k): list(v) for k, v in self.days.items()},
+            "latest": {
+                w: [encode(e) for e in getattr(self, f"latest_{w}")]
+                for w in ("catches", "shinies", "perfect")
+            },
+        }
+
+    def from_dict(self, raw: Dict[str, Any], decode: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        if raw.get("keys") != list(KEYS):
+            raise ValueError("rollup-formaat komt niet overeen met KEYS")
+        self.reset()
+        self.hours = {int(k): list(v) for k, v in raw["hours"].items()}
+        self.days = {int(k): list(v) for k, v in raw["days"].items()}
+        for w, rows in raw.get("latest", {}).items():
+            getattr(self, f"latest_{w}").extend(decode(e) for e in rows)
+
+    def save(self, path: str, snapshot: Dict[str, Any]):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def load(self, path: str, decode, expected_events: int) -> bool:
+        """True als het bestand bruikbaar is (zelfde aantal events als de opslag)."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if raw.get("events") != expected_events:
+                print(f"[ROLLUPS] {path} verouderd ({raw.get('events')} ≠ {expected_events}), herberekenen")
+                return False
+            self.from_dict(raw, decode)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print("[ROLLUPS LOAD ERROR]", e)
+            return False
+
+
+class RollupView:
+    """Zelfde interface als RollingAggregator (totals/latest) voor build_embed."""
+
+    def __init__(self, rollups: Rollups, seconds: Optional[int], now: Optional[float] = None):
+        self._r = rollups
+        self.now = now if now is not None else datetime.now().timestamp()
+        self.cutoff = None if seconds is None else self.now - seconds
+
+    def totals(self, now: Optional[float] = None) -> Dict[str, int]:
+        return self._r.totals_since(self.cutoff, self.now)
+
+    def latest(self, which: str, n: int = 5, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        return self._r.latest_since(which, self.cutoff, n)
@@ -0,0 +1,259 @@
+# PXstats • species.py • v5.9
+# Inverted index per species voor /species.
+#
+#   species-ID (pokedex.species_key) → tijdgeordende kolommen
+#     ts     array('d')   epoch-seconden
+#     kind   bytearray    type-code | SHINY-bit
+#     iv     array('H')   atk<<8 | def<<4 | sta, NO_IV = geen IV
+#
+# De kolommen bevatten zelf wat /species nodig heeft: geen posities in
+# EVENTS (die verschuiven bij elke insert van een laat event of retentie).
+# Een query = bisect op ts + één pass over de events van die species in
+# het venster, onafhankelijk van de totale historiek.
+# Onderhouden in utils (add_event/replace_event/retentie), herbouwd bij load.
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from PXstats.pokedex import species_key, species_name
+
+TYPES = ("Encounter", "Catch", "Fled", "Quest", "Raid", "Rocket", "MaxBattle", "Hatch")
+_TYPE_CODE = {t: i + 1 for i, t in enumerate(TYPES)}   # 0 = onbekend type
+_CATCH = _TYPE_CODE["Catch"]
+_FLED = _TYPE_CODE["Fled"]
+# Encounters zoals in /summary: alles wat je gezien hebt, incl. gevlucht
+_SEEN = {_TYPE_CODE[t] for t in ("Encounter", "Quest", "Raid", "Rocket", "MaxBattle", "Fled")}
+SHINY = 0x80
+NO_IV = 0xFFFF
+
+Key = Union[int, str]
+
+
+def _epoch(ts) -> Optional[float]:
+    return ts.timestamp() if hasattr(ts, "timestamp") else None
+
+
+def _pack_iv(iv) -> int:
+    # > 15 past niet in een nibble (oude historiek van voor de parser-check)
+    if not iv or len(iv) != 3 or max(iv) > 15:
+        return NO_IV
+    return (iv[0] << 8) | (iv[1] << 4) | iv[2]
+
+
+def _unpack_iv(v: int) -> Tuple[int, int, int]:
+    return v >> 8, (v >> 4) & 0xF, v & 0xF
+
+
+class _Postings:
+    __slots__ = ("ts", "kind", "iv")
+
+    def __init__(self):
+        self.ts = array("d")
+        self.kind = bytearray()
+        self.iv = array("H")
+
+    def insert(self, t: float, kind: int, iv: int):
+        if not self.ts or t >= self.ts[-1]:
+            self.ts.append(t)
+            self.kind.append(kind)
+            self.iv.append(iv)
+        else:
+            i = bisect_right(self.ts, t)
+            self.ts.insert(i, t)
+            self.kind.insert(i, kind)
+            self.iv.insert(i, iv)
+
+    def remove(self, t: float, kind: int, iv: int) -> bool:
+        i = bisect_left(self.ts, t)
+        while i < len(self.ts) and self.ts[i] == t:
+            if self.kind[i] == kind and self.iv[i] == iv:
+                del self.ts[i]
+                del self.kind[i]
+                del self.iv[i]
+                return True
+            i += 1
+        return False
+
+    def __len__(self):
+        return len(self.ts)
+
+
+class SpeciesStats:
+    """Resultaat van een /species-query (optelbaar: hot store + archief)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events = 0
+        self.encounters = 0      # gezien (zie _SEEN)
+        self.catches = 0
+        self.fled = 0
+        self.shinies = 0         # shiny catches
+        self.by_type: Dict[str, int] = {}
+        self._top: List[Tuple[int, float, int]] = []   # (iv-som, ts, packed) min-heap
+
+    def _add(self, t: float, kind: int, iv: int, top: int):
+        code = kind & ~SHINY
+        etype = TYPES[code - 1] if code else "?"
+        self.events += 1
+        self.by_type[etype] = self.by_type.get(etype, 0) + 1
+        if code in _SEEN:
+            self.encounters += 1
+        if code == _FLED:
+            self.fled += 1
+        elif code == _CATCH:
+            self.catches += 1
+            if kind & SHINY:
+                self.shinies += 1
+            if iv != NO_IV:
+                a, d, s = _unpack_iv(iv)
+                item = (a + d + s, t, iv)
+                if len(self._top) < top:
+                    heapq.heappush(self._top, item)
+                elif item > self._top[0]:
+                    heapq.heapreplace(self._top, item)
+
+    @property
+    def runaways_est(self) -> int:
+        """Zelfde schatting als /summary: max(gevlucht, encounters - vangsten)."""
+        return max(self.fled, max(0, self.encounters - self.catches))
+
+    @property
+    def catch_rate(self) -> Optional[float]:
+        """Vangsten / (vangsten + runaways_est); None zonder pogingen."""
+        tries = self.catches + self.runaways_est
+        return self.catches / tries if tries else None
+
+    def top_ivs(self) -> List[Tuple[Tuple[int, int, int], float]]:
+        """Beste gevangen IV's: [((atk, def, sta), epoch)], hoogste eerst."""
+        return [(_unpack_iv(iv), t) for _, t, iv in sorted(self._top, reverse=True)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "events": self.events,
+            "encounters": self.encounters,
+            "catches": self.catches,
+            "fled": self.fled,
+            "shinies": self.shinies,
+            "catch_rate": self.catch_rate,
+            "by_type": self.by_type,
+            "top_ivs": [list(iv) for iv, _ in self.top_ivs()],
+        }
+
+
+class SpeciesIndex:
+    """species-ID → _Postings, gesorteerd op tijd."""
+
+    def __init__(self):
+        self._lists: Dict[Key, _Postings] = {}
+        self._keys: Dict[Optional[str], Key] = {}
+
+    def key(self, name: Optional[str]) -> Key:
+        """Naam (of p###) → dex-nummer, forms onder hun basis; onbekende namen op naam."""
+        k = self._keys.get(name)
+        if k is None:
+            k = self._keys[name] = species_key(name)
+        return k
+
+    @staticmethod
+    def _row(e) -> Tuple[Optional[float], int, int]:
+        kind = _TYPE_CODE.get(e.get("type"), 0) | (SHINY if e.get("shiny") else 0)
+        return _epoch(e.get("timestamp")), kind, _pack_iv(e.get("iv"))
+
+    def add(self, e):
+        t, kind, iv = self._row(e)
+        if t is None:
+            return
+        k = self.key(e.get("name"))
+        p = self._lists.get(k)
+        if p is None:
+            p = self._lists[k] = _Postings()
+        p.insert(t, kind, iv)
+
+    def remove(self, e):
+        t, kind, iv = self._row(e)
+        p = self._lists.get(self.key(e.get("name")))
+        if t is not None and p is not None:
+            p.remove(t, kind, iv)
+
+    def clear(self):
+        self._lists.clear()
+
+    def build(self, events: Iterable[Any]):
+        """Volledig herbouwen (load); events chronologisch → enkel appends."""
+        self.clear()
+        for e in events:
+            self.add(e)
+
+    def build_columnar(self, c):
+        """Herbouwen rechtstreeks uit de kolommen van ColumnarEvents (geen EventRow-views)."""
+        self.clear()
+        keys = [self.key(n) for n in c._species.values]
+        kinds = [_TYPE_CODE.get(t, 0) for t in c._types.values]
+        ts, ty, nm, ivb, bits = c._ts, c._type, c._name, c._iv, c._shiny
+        lists = self._lists
+        for i in range(len(ts)):
+            t = ts[i]
+            if t == float("-inf"):
+                continue
+            k = keys[nm[i]]
+            p = lists.get(k)
+            if p is None:
+                p = lists[k] = _Postings()
+            j = 3 * i
+            # 255 = geen IV; > 15 past niet in een nibble
+            a, d, s = ivb[j], ivb[j + 1], ivb[j + 2]
+            iv = NO_IV if a > 15 or d > 15 or s > 15 else (a << 8) | (d << 4) | s
+            kind = kinds[ty[i]] | (SHINY if bits[i >> 3] & (1 << (i & 7)) else 0)
+            p.ts.append(t)
+            p.kind.append(kind)
+            p.iv.append(iv)
+
+    def prune(self, upto: float, keep: Iterable[Any] = ()):
+        """Alles met ts <= upto weg (retentie), daarna `keep` terugzetten."""
+        for k in list(self._lists):
+            p = self._lists[k]
+            i = bisect_right(p.ts, upto)
+            if i:
+                del p.ts[:i]
+                del p.kind[:i]
+                del p.iv[:i]
+            if not p.ts:
+                del self._lists[k]
+        for e in keep:
+            self.add(e)
+
+    def __len__(self):
+        return sum(len(p) for p in self._lists.values())
+
+    def count(self, name: str) -> int:
+        p = self._lists.get(self.key(name))
+        return len(p) if p is not None else 0
+
+    def stats(self, name: str, start: Optional[float] = None, end: Optional[float] = None,
+              top: int = 5, out: Optional[SpeciesStats] = None) -> SpeciesStats:
+        """Tellers voor `name` met start <= ts < end (grenzen optioneel)."""
+        k = self.key(name)
+        out = out or SpeciesStats(species_name(k) if isinstance(k, int) else name)
+        p = self._lists.get(k)
+        if p is None:
+            return out
+        lo = 0 if start is None else bisect_left(p.ts, start)
+        hi = len(p.ts) if end is None else bisect_left(p.ts, end)
+        ts, kind, iv = p.ts, p.kind, p.iv
+        for i in range(lo, hi):
+            out._add(ts[i], kind[i], iv[i], top)
+        return out
+
+
+def stats_from_events(name: str, events: Iterable[Any], top: int = 5,
+                      out: Optional[SpeciesStats] = None) -> SpeciesStats:
+    """Zelfde tellers uit een event-stroom (SQLite, archief)."""
+    out = out or SpeciesStats(name)
+    for e in events:
+        t, kind, iv = SpeciesIndex._row(e)
+        if t is not None:
+            out._add(t, kind, iv, top)
+    return out
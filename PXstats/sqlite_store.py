@@ -0,0 +1,241 @@
+# PXstats • sqlite_store.py • v6.1
+# SQLite-backend voor events (WAL-modus).
+#
+# Schema: één rij per event, timestamp als epoch-seconden (REAL) zodat
+# range-queries via de index lopen i.p.v. door Python-dicts te scannen.
+# Onbekende velden gaan als JSON in de kolom `extra`.
+# Partitie-tags (guild, channel, author, account) zijn eigen kolommen met
+# een (guild, channel, author, ts)-index: /summary en /csv per account of
+# kanaal lezen enkel die partitie.
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+_COLUMNS = ("timestamp", "type", "source", "name", "iv", "shiny", "key",
+            "guild", "channel", "author", "account")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id      INTEGER PRIMARY KEY,
+    ts      REAL NOT NULL,
+    type    TEXT,
+    source  TEXT,
+    name    TEXT,
+    iv0     INTEGER,
+    iv1     INTEGER,
+    iv2     INTEGER,
+    shiny   INTEGER NOT NULL DEFAULT 0,
+    extra   TEXT,
+    key     TEXT,
+    guild   INTEGER,
+    channel INTEGER,
+    author  INTEGER,
+    account TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts      ON events (ts);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, ts);
+CREATE INDEX IF NOT EXISTS idx_events_name    ON events (name);
+CREATE INDEX IF NOT EXISTS idx_events_name_ts ON events (name, ts);
+"""
+
+# Na eventuele ALTER TABLE (oudere databases zonder key- of partitie-kolommen)
+_LATE_COLUMNS = (("key", "TEXT"), ("guild", "INTEGER"), ("channel", "INTEGER"),
+                 ("author", "INTEGER"), ("account", "TEXT"))
+_LATE_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_events_key     ON events (key);
+CREATE INDEX IF NOT EXISTS        idx_events_part_ts ON events (guild, channel, author, ts);
+"""
+
+_SELECT = ("SELECT ts, type, source, name, iv0, iv1, iv2, shiny, extra, key, "
+           "guild, channel, author, account FROM events")
+
+
+def _epoch(ts: Any) -> Optional[float]:
+    if ts is None:
+        return None
+    if isinstance(ts, datetime):
+        return ts.timestamp()
+    return float(ts)
+
+
+class SqliteStore:
+    """Event-opslag in SQLite met indexen op (ts), (type, ts), (name), (name, ts) en de partitie."""
+
+    def __init__(self, path: str = "events.db", tz: Optional[ZoneInfo] = None):
+        self.path = path
+        self.tz = tz
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        cols = {r[1] for r in self._conn.execute("PRAGMA table_info(events)")}
+        for col, kind in _LATE_COLUMNS:
+            if col not in cols:
+                self._conn.execute(f"ALTER TABLE events ADD COLUMN {col} {kind}")
+        self._conn.executescript(_LATE_INDEXES)
+        self._conn.commit()
+
+    # ---------------------------------------------------------
+    # Conversie
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _to_row(e: Dict[str, Any]):
+        iv = e.get("iv") or (None, None, None)
+        extra = {k: v for k, v in e.items() if k not in _COLUMNS and v is not None}
+        return (
+            _epoch(e.get("timestamp")),
+            e.get("type"),
+            e.get("source"),
+            e.get("name"),
+            iv[0], iv[1], iv[2],
+            1 if e.get("shiny") else 0,
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+            e.get("key"),
+            e.get("guild"),
+            e.get("channel"),
+            e.get("author"),
+            e.get("account"),
+        )
+
+    def _to_event(self, row) -> Dict[str, Any]:
+        ts, etype, src, name, iv0, iv1, iv2, shiny, extra, key = row[:10]
+        e: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(ts, self.tz),
+            "type": etype,
+            "name": name,
+            "iv": (iv0, iv1, iv2) if iv0 is not None else None,
+            "shiny": bool(shiny),
+        }
+        if src is not None:
+            e["source"] = src
+        if extra:
+            e.update(json.loads(extra))
+        if key is not None:
+            e["key"] = key
+        for f, v in zip(("guild", "channel", "author", "account"), row[10:]):
+            if v is not None:
+                e[f] = v
+        return e
+
+    # ---------------------------------------------------------
+    # Schrijven
+    # ---------------------------------------------------------
+
+    def insert_many(self, events: Iterable[Dict[str, Any]]) -> int:
+        rows = [self._to_row(e) for e in events]
+        if not rows:
+            return 0
+        with self._lock:
+            # zelfde key = ge-edit event → vervangen
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events "
+                "(ts, type, source, name, iv0, iv1, iv2, shiny, extra, key, guild, channel, author, account) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    # ---------------------------------------------------------
+    # Lezen
+    # ---------------------------------------------------------
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(_SELECT + " WHERE key = ?", (key,)).fetchone()
+        return self._to_event(row) if row else None
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        keys = [(k,) for k in keys]
+        if not keys:
+            return 0
+        with self._lock:
+            cur = self._conn.executemany("DELETE FROM events WHERE key = ?", keys)
+            self._conn.commit()
+        return cur.rowcount
+
+    def delete_before(self, end, max_id: int) -> int:
+        """Retentie: events met ts < end en id <= max_id (latere inserts blijven)."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM events WHERE ts < ? AND id <= ?", (_epoch(end), max_id))
+            self._conn.commit()
+        return cur.rowcount
+
+    def max_id(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+    def min_ts(self) -> Optional[float]:
+        with self._lock:
+            return self._conn.execute("SELECT MIN(ts) FROM events").fetchone()[0]
+
+    def range(self, start=None, end=None, type: Optional[str] = None,
+              parts: Optional[Iterable[Tuple]] = None) -> List[Dict[str, Any]]:
+        """Events met start <= ts < end (grenzen optioneel), oplopend op tijd."""
+        return list(self.iter_range(start, end, type, parts=parts))
+
+    def by_name(self, names: Iterable[str], start=None, end=None) -> Iterator[Dict[str, Any]]:
+        """Events van één species (basisnaam + forms) in [start, end), via de (name, ts)-index."""
+        return self.iter_range(start, end, names=names)
+
+    def iter_range(self, start=None, end=None, type: Optional[str] = None,
+                   batch: int = 1000, max_id: Optional[int] = None,
+                   names: Optional[Iterable[str]] = None,
+                   parts: Optional[Iterable[Tuple]] = None) -> Iterator[Dict[str, Any]]:
+        """parts: enkel deze (guild, channel, author)-partities (via idx_events_part_ts)."""
+        where, args = [], []
+        if parts is not None:
+            parts = list(parts)
+            if not parts:
+                return
+            where.append("(" + " OR ".join(["(guild IS ? AND channel IS ? AND author IS ?)"] * len(parts)) + ")")
+            for p in parts:
+                args.extend(p)
+        if names is not None:
+            names = list(names)
+            if not names:
+                return
+            where.append("name IN (" + ",".join("?" * len(names)) + ")")
+            args.extend(names)
+        if max_id is not None:
+            where.append("id <= ?")
+            args.append(max_id)
+        if type is not None:
+            where.append("type = ?")
+            args.append(type)
+        if start is not None:
+            where.append("ts >= ?")
+            args.append(_epoch(start))
+        if end is not None:
+            where.append("ts < ?")
+            args.append(_epoch(end))
+
+        sql = _SELECT
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY ts, id"
+
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute(sql, args)
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(batch)
+            if not rows:
+                break
+            for r in rows:
+                yield self._to_event(r)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,7 @@
-# PXstats • stats-v4.5 • 2025-11-14
+# PXstats • stats-v5.0 • 2026-10-17
 # ---------------------------------
+# - Tellers komen uit de incrementele RollingAggregator (geen full scan)
+# - period 7d / 30d / all: uur-/dag-rollups (utils.ROLLUPS)
 # - Encounters / Catches / Shinies
 # - Event breakdown (Wild / Incense / Lure / Quest / Raid / Rocket / Max / Runaways)
 # - Runaways (est.) = max(Fled, Encounters - Catches)
@@ -7,90 +9,79 @@
 # - Latest Catches
 # - Latest Shinies (uit catches met shiny=True)
 # - NIEUW: Latest 100 IV (uit catches met IV 15/15/15)
+# - build_species_embed: /species (utils.species_stats)
+# - build_ivstats_embed: /ivstats (utils.iv_stats, numpy-kolommen)
+# - build_embed(scope=...): /summary per account/kanaal (partitie-aggregaten)
 # ---------------------------------
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 
 import discord
 
-from PXstats.utils import TZ
+from PXstats.aggregates import RollingAggregator, aggregate
+from PXstats.utils import TZ, summary_view
 
+TITLES = {
+    "24h": "📊 Today’s Stats (Last 24h)",
+    "7d": "📊 Stats (Last 7 days)",
+    "30d": "📊 Stats (Last 30 days)",
+    "all": "📊 All-time Stats",
+}
 
-def _last_24h(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Filter events van de laatste 24 uur."""
-    cutoff = datetime.now(TZ) - timedelta(hours=24)
-    out = []
-    for e in events:
-        ts = e.get("timestamp")
-        if isinstance(ts, datetime) and ts >= cutoff:
-            out.append(e)
-    return out
+PERIOD_LABELS = {"24h": "Last 24h", "7d": "Last 7 days", "30d": "Last 30 days", "all": "All-time"}
+
+
+# Encounters = alles wat je effectief gezien hebt (ook /api/summary)
+ENCOUNTER_KINDS = ("wild", "incense", "lure", "quest", "raid", "rocket", "max", "fled")
+
+
+def encounter_count(t: Dict[str, int]) -> int:
+    """Encounters uit een totals()-dict; één definitie voor embed en API."""
+    return sum(t[k] for k in ENCOUNTER_KINDS)
 
 
 def _fmt_ts(dt: datetime) -> str:
     return dt.strftime("%d %B %Y %H:%M")
 
 
-def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
-    # Window = laatste 24h
-    window = _last_24h(all_events)
+def build_embed(
+    all_events: Optional[List[Dict[str, Any]]] = None,
+    agg: Optional[RollingAggregator] = None,
+    period: str = "24h",
+    scope: Optional[str] = None,
+) -> discord.Embed:
+    """
+    Bouw de summary (default 24h).
+    Default: snapshot van de voorberekende tellers (utils.summary_view):
+    24h uit utils.ROLLING, 7d/30d/all uit de uur-/dag-rollups.
+    Met `all_events` wordt eenmalig een aggregator opgebouwd (oude API).
+    `scope` (account/kanaal) komt in de titel; agg = utils.summary_view(...).
+    """
+    if agg is None:
+        if all_events is not None:
+            agg = aggregate(all_events)
+        else:
+            agg = summary_view(period)
 
     # -------------------------------------------------
     # Counters
     # -------------------------------------------------
-    wild = incense = lure = quest = raid = rocket = max_b = runaways = 0
-    catches = 0
-
-    shinies_from_catches: List[Dict[str, Any]] = []
-    perfect_from_catches: List[Dict[str, Any]] = []
-
-    for e in window:
-        etype = e.get("type")
-        src = e.get("source")
-        iv = e.get("iv")
-        shiny_flag = bool(e.get("shiny"))
-
-        # Encounter breakdown
-        if etype == "Encounter":
-            if src == "wild":
-                wild += 1
-            elif src == "incense":
-                incense += 1
-            elif src == "lure":
-                lure += 1
-
-        elif etype == "Quest":
-            quest += 1
-        elif etype == "Raid":
-            raid += 1
-        elif etype == "Rocket":
-            rocket += 1
-        elif etype == "MaxBattle":
-            max_b += 1
-        elif etype == "Fled":
-            runaways += 1
-
-        # Catches & flags
-        if etype == "Catch":
-            catches += 1
-
-            if shiny_flag:
-                shinies_from_catches.append(e)
-
-            if iv and len(iv) == 3 and iv[0] == 15 and iv[1] == 15 and iv[2] == 15:
-                perfect_from_catches.append(e)
-
-    # Encounters = alles wat je effectief gezien hebt
-    encounters = wild + incense + lure + quest + raid + rocket + max_b + runaways
+    t = agg.totals()
+    wild, incense, lure = t["wild"], t["incense"], t["lure"]
+    quest, raid, rocket = t["quest"], t["raid"], t["rocket"]
+    max_b, runaways = t["max"], t["fled"]
+    catches = t["catches"]
+
+    encounters = encounter_count(t)
 
     # Shinies = aantal shiny catches
-    shinies = len(shinies_from_catches)
+    shinies = t["shinies"]
 
     # Perfect 100 IV = aantal perfect catches
-    perfect_100 = len(perfect_from_catches)
+    perfect_100 = t["perfect"]
 
     # Runaways (est.) = max(gezien flee-events, Enc - Catches)
     runaways_est = max(runaways, max(0, encounters - catches))
@@ -105,8 +96,9 @@ def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
     # -------------------------------------------------
     # Embed opbouwen
     # -------------------------------------------------
+    title = TITLES.get(period, TITLES["24h"])
     embed = discord.Embed(
-        title="📊 Today’s Stats (Last 24h)",
+        title=f"{title} • {scope}" if scope else title,
         colour=discord.Colour.blurple()
     )
 
@@ -140,7 +132,7 @@ def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
     # -------------------------------------------------
     # Latest catches
     # -------------------------------------------------
-    latest_catches = [e for e in window if e.get("type") == "Catch"][-5:]
+    latest_catches = agg.latest("catches")
     if latest_catches:
         lines = []
         for e in reversed(latest_catches):
@@ -163,7 +155,7 @@ def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
     # -------------------------------------------------
     # Latest shinies (uit catches)
     # -------------------------------------------------
-    latest_shinies = shinies_from_catches[-5:]
+    latest_shinies = agg.latest("shinies")
     if latest_shinies:
         lines = []
         for e in reversed(latest_shinies):
@@ -186,7 +178,7 @@ def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
     # -------------------------------------------------
     # NIEUW: Latest 100 IV
     # -------------------------------------------------
-    latest_perfect = perfect_from_catches[-5:]
+    latest_perfect = agg.latest("perfect")
     if latest_perfect:
         lines = []
         for e in reversed(latest_perfect):
@@ -211,4 +203,121 @@ def build_embed(all_events: List[Dict[str, Any]]) -> discord.Embed:
         text=f"Rate base: {encounters} • stats-v4.5 • {datetime.now(TZ).date()}"
     )
 
-    return embed
\ No newline at end of file
+    return embed
+
+
+# -------------------------------------------------
+# /species
+# -------------------------------------------------
+
+def build_species_embed(st, period: str = "7d") -> discord.Embed:
+    """Embed voor /species uit een species.SpeciesStats."""
+    label = PERIOD_LABELS.get(period, period)
+    embed = discord.Embed(
+        title=f"🔎 {st.name} ({label})",
+        colour=discord.Colour.blurple()
+    )
+
+    if not st.events:
+        embed.description = "Geen events gevonden voor deze periode."
+        return embed
+
+    rate = st.catch_rate
+    embed.add_field(name="🧑‍✈️ Encounters", value=str(st.encounters), inline=True)
+    embed.add_field(name="🎯 Catches", value=str(st.catches), inline=True)
+    embed.add_field(name="✨ Shinies", value=str(st.shinies), inline=True)
+    embed.add_field(name="🎯 Catch rate", value=f"{100.0 * rate:.1f}%" if rate is not None else "—", inline=True)
+    embed.add_field(name="🏃 Runaways (est.)", value=str(st.runaways_est), inline=True)
+    embed.add_field(name="📦 Events", value=str(st.events), inline=True)
+
+    breakdown = [f"{k}: {v}" for k, v in sorted(st.by_type.items(), key=lambda kv: -kv[1])]
+    embed.add_field(name="📦 Event breakdown", value="\n".join(breakdown), inline=False)
+
+    top = st.top_ivs()
+    if top:
+        lines = [
+            f"{a}/{d}/{s} ({round(100 * (a + d + s) / 45)}%) — {_fmt_ts(datetime.fromtimestamp(t, TZ))}"
+            for (a, d, s), t in top
+        ]
+        embed.add_field(name="🏆 Top IV's (catches)", value="\n".join(lines), inline=False)
+
+    embed.set_footer(text=f"species-index • {datetime.now(TZ).date()}")
+    return embed
+
+
+# -------------------------------------------------
+# /ivstats
+# -------------------------------------------------
+
+# IV-som → band (gevangen met IV)
+IV_BANDS = (("100%", 45, 45), ("91–98%", 41, 44), ("82–89%", 37, 40), ("67–80%", 30, 36), ("< 67%", 0, 29))
+KIND_LABELS = {"wild": "Wild", "incense": "Incense", "lure": "Lure", "quest": "Quest",
+               "raid": "Raid", "rocket": "Rocket", "max": "Max Battle"}
+_WEEKDAYS = ("Ma", "Di", "Wo", "Do", "Vr", "Za", "Zo")
+_SHADES = " ░▒▓█"
+
+
+def _bar(n: int, top: int, width: int = 16) -> str:
+    return "█" * (round(width * n / top) if top else 0)
+
+
+def _heatmap(grid: List[List[int]]) -> str:
+    """7 × 24 tellers → tekstblok, intensiteit relatief tussen kleinste en grootste cel."""
+    cells = [n for row in grid for n in row if n]
+    lo, hi = (min(cells), max(cells)) if cells else (0, 0)
+    lines = ["   " + "".join(f"{h:<6}" for h in (0, 6, 12, 18))]
+    for wd, row in enumerate(grid):
+        shades = "".join(
+            _SHADES[1 + (3 * (n - lo)) // (hi - lo) if hi > lo else 4] if n else _SHADES[0]
+            for n in row
+        )
+        lines.append(f"{_WEEKDAYS[wd]} {shades}")
+    return "\n".join(lines)
+
+
+def build_ivstats_embed(st, period: str = "30d") -> discord.Embed:
+    """Embed voor /ivstats uit een analytics.IVStats."""
+    label = PERIOD_LABELS.get(period, period)
+    embed = discord.Embed(
+        title=f"🧬 IV & catch analytics ({label})",
+        colour=discord.Colour.blurple()
+    )
+
+    if not st.events:
+        embed.description = "Geen events gevonden voor deze periode."
+        return embed
+
+    embed.add_field(name="🎯 Catches", value=str(st.catches), inline=True)
+    embed.add_field(name="🔢 Met IV", value=str(st.with_iv), inline=True)
+    embed.add_field(name="🏅 100 IV", value=str(st.perfect), inline=True)
+
+    if st.with_iv:
+        p = st.percentiles
+        embed.add_field(
+            name="📈 IV% percentielen",
+            value=(f"gem. {st.mean:.1f}% • "
+                   + " • ".join(f"p{k}: {v:.1f}%" for k, v in p.items())),
+            inline=False,
+        )
+        bands = [(name, sum(st.hist[lo:hi + 1])) for name, lo, hi in IV_BANDS]
+        top = max(n for _, n in bands)
+        rows = [f"{name:>7} {n:>6} {_bar(n, top)}" for name, n in bands]
+        embed.add_field(name="📊 IV-verdeling (catches)", value="```\n" + "\n".join(rows) + "\n```", inline=False)
+
+    rates = []
+    for kind, (enc, caught, fled) in st.kinds.items():
+        if enc:
+            rate = st.catch_rate(kind)
+            rates.append(f"{KIND_LABELS[kind]}: {caught}/{enc} ({100.0 * rate:.1f}%), {fled} gevlucht")
+    if rates:
+        embed.add_field(name="🎯 Vangstratio per soort", value="\n".join(rates), inline=False)
+
+    if any(any(row) for row in st.heat_enc):
+        best = max(((n, wd, h) for wd, row in enumerate(st.heat_catch) for h, n in enumerate(row)))
+        value = "```\n" + _heatmap(st.heat_enc) + "\n```"
+        if best[0]:
+            value += f"\nMeeste catches: {_WEEKDAYS[best[1]]} {best[2]:02d}:00 ({best[0]})"
+        embed.add_field(name="🗓️ Encounters per weekdag × uur", value=value, inline=False)
+
+    embed.set_footer(text=f"Catch/Fled gekoppeld aan de laatste encounter van dezelfde species • {datetime.now(TZ).date()}")
+    return embed
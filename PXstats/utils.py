@@ -1,78 +1,924 @@
-# PXstats • utils.py • v4.2a
+# PXstats • utils.py • v6.1
 import os
 import json
+import atexit
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from PXstats import binsnap
+from PXstats.aggregates import LATEST, RollingAggregator, Snapshot
+from PXstats.analytics import HAVE_NUMPY, Columns, IVAnalytics, IVStats, ivstats_np, ivstats_py
+from PXstats.archive import Archive
+from PXstats.columnar import ColumnarEvents
+from PXstats.dedup import index_from_env
+from PXstats.journal import DELETED, EventJournal, apply_tail, journal_path_for
+from PXstats.partitions import Partition, PartitionIndex, part_key, partitions_path_for
+from PXstats.pokedex import species_aliases
+from PXstats.rollups import Rollups, rollups_path_for
+from PXstats.species import SpeciesIndex, SpeciesStats, stats_from_events
+from PXstats.sqlite_store import SqliteStore
 
 TZ = ZoneInfo(os.getenv("TZ", "Europe/Brussels"))
 
+# Opslagmodus:
+#   journal → append-only JSONL + achtergrond-compactie naar events.json (default)
+#   json    → oude gedrag: volledige events.json herschrijven bij elke save
+#   sqlite  → events in SQLite (PX_DB_PATH), niet volledig in geheugen
+STORAGE_MODE = os.getenv("PX_STORAGE", "journal").strip().lower()
+DB_PATH = os.getenv("PX_DB_PATH", "events.db")
+
+# Geheugenlayout van EVENTS:
+#   dict     → lijst van dicts (default)
+#   columnar → ColumnarEvents (kolommen + EventRow-views), veel kleiner
+LAYOUT = os.getenv("PX_LAYOUT", "dict").strip().lower()
+
+# Snapshot-formaat in journal-modus:
+#   json → events.json (default)
+#   bin  → events.bin (binsnap.py): mmap + memcpy per kolom bij het laden;
+#          een bestaande events.json wordt bij de eerste start geïmporteerd
+SNAPSHOT_FORMAT = os.getenv("PX_SNAPSHOT", "json").strip().lower()
+if STORAGE_MODE != "journal":
+    SNAPSHOT_FORMAT = "json"
+
 # Eén globale lijst, hierop werken we overal
-EVENTS: List[Dict[str, Any]] = []
+# Parallelle, gesorteerde epoch-timestamps: _TS[i] hoort bij EVENTS[i].
+# EVENTS blijft daardoor chronologisch; range-queries = bisect + slice.
+if LAYOUT == "columnar":
+    EVENTS = ColumnarEvents(tz=TZ)
+    _TS = EVENTS.ts                      # ts-kolom = de index zelf
+else:
+    EVENTS: List[Dict[str, Any]] = []
+    _TS = array("d")
+_OWN_TS = _TS is not getattr(EVENTS, "ts", None)
+
+# Events die nog niet naar de journal geschreven zijn
+_PENDING: List[Dict[str, Any]] = []
+
+# Beschermt EVENTS/_PENDING tussen event loop (add_event) en persist-thread
+_LOCK = threading.Lock()
+
+# Incrementele 24h-tellers voor /summary (bijgewerkt in add_event)
+ROLLING = RollingAggregator()
+
+# Inverted index per species (/species); enkel in json/journal-modus,
+# sqlite gebruikt de (name, ts)-index van de store
+SPECIES = SpeciesIndex()
+
+# Gematerialiseerde numpy-kolommen voor /ivstats (incrementeel, zie analytics.py)
+ANALYTICS = IVAnalytics()
+
+# Segmenten + aggregaten per (guild, channel, author) voor /summary en /csv
+# per feeder-account of kanaal (zie partitions.py)
+PARTS = PartitionIndex(shared=EVENTS if LAYOUT == "columnar" else None)
+
+# Uur-/dag-tellers over de hele historiek voor /summary 7d/30d/all
+ROLLUPS = Rollups()
+ROLLUP_SAVE_INTERVAL = float(os.getenv("PX_ROLLUP_SAVE_INTERVAL", "60"))
+_ROLLUPS_SAVED = 0.0
+
+# Retentie: events ouder dan PX_RETENTION_DAYS (0 = uit) verhuizen naar
+# onveranderlijke, gecomprimeerde maand-segmenten (archive.py).
+# Er worden enkel volledige maanden gearchiveerd, dus de hot store houdt
+# tussen N en N+31 dagen.
+RETENTION_DAYS = float(os.getenv("PX_RETENTION_DAYS", "0"))
+RETENTION_CHECK = float(os.getenv("PX_RETENTION_CHECK", "3600"))
+ARCHIVE = Archive(
+    os.getenv("PX_ARCHIVE_DIR", "archive"),
+    codec=os.getenv("PX_ARCHIVE_CODEC", "gzip").strip().lower(),
+    tz=TZ,
+)
+_RETENTION_CHECKED: Optional[float] = None
+
+# Event-keys van recente events (duplicaten / edits), zie dedup.py
+DEDUP = index_from_env()
+
+# Ingest-versie: +1 bij elke wijziging van de eventset (ETags / caches)
+_VERSION = 0
+
+_JOURNAL: Optional[EventJournal] = None
+_STORE: Optional[SqliteStore] = None
+
+
+def get_store() -> Optional[SqliteStore]:
+    """SQLite-store in sqlite-modus, anders None (events zitten in EVENTS)."""
+    global _STORE
+    if STORAGE_MODE == "sqlite" and _STORE is None:
+        _STORE = SqliteStore(DB_PATH, tz=TZ)
+    return _STORE
+
+
+def ingest_version() -> int:
+    """Monotone teller; gelijk gebleven = niets toegevoegd/gewijzigd."""
+    return _VERSION
+
+
+def _bump():
+    global _VERSION
+    _VERSION += 1
+
+
+# Herschik-teller: +1 bij elke wijziging van EVENTS die geen append achteraan
+# is (laat event, edit, retentie, load). Gelijk gebleven → EVENTS[:n] ongewijzigd.
+_REWRITES = 0
+
+
+def rewrite_version() -> int:
+    return _REWRITES
+
+
+def _rewritten():
+    global _REWRITES
+    _REWRITES += 1
+
+
+def _rollups_path(path: str) -> str:
+    return rollups_path_for(DB_PATH if STORAGE_MODE == "sqlite" else path)
+
+
+def _partitions_path(path: str) -> str:
+    return partitions_path_for(DB_PATH if STORAGE_MODE == "sqlite" else path)
+
+
+def _load_rollups(path: str, expected: int, events) -> None:
+    """Persistente rollups (globaal + per partitie) gebruiken als ze kloppen, anders opnieuw opbouwen."""
+    rpath = _rollups_path(path)
+    # gearchiveerde events tellen mee in de rollups (all-time)
+    total = expected + ARCHIVE.total()
+    whole = ROLLUPS.load(rpath, decode_event, total)
+    if whole:
+        print(f"[ROLLUPS] geladen uit {rpath}")
+    parts = PARTS.load(_partitions_path(path), decode_event, total)
+    if whole and parts:
+        return
+    if not whole:
+        ROLLUPS.reset()
+    if not parts:
+        PARTS.reset_rollups()
+    # één pass voor wat ontbreekt
+    for source in (ARCHIVE.iter_range(decode_event), events()):
+        for e in source:
+            if not whole:
+                ROLLUPS.add(e)
+            if not parts:
+                PARTS.rollups_add(e)
+    if not whole:
+        print(f"[ROLLUPS] opgebouwd: {len(ROLLUPS.days)} dagen")
+    if not parts:
+        print(f"[PARTITIONS] rollups opgebouwd: {len(PARTS)} partities")
+
+
+def save_rollups(path: str = "events.json", force: bool = False):
+    """Rollups wegschrijven (hooguit elke PX_ROLLUP_SAVE_INTERVAL s)."""
+    global _ROLLUPS_SAVED
+    now = time.monotonic()
+    if not force and now - _ROLLUPS_SAVED < ROLLUP_SAVE_INTERVAL:
+        return
+    _ROLLUPS_SAVED = now
+    with _LOCK:
+        ROLLUPS.prune(time.time())
+        PARTS.prune_rollups(time.time())
+        snapshot = ROLLUPS.to_dict(encode_event)
+        parts = PARTS.to_dict(encode_event)
+    try:
+        ROLLUPS.save(_rollups_path(path), snapshot)
+        PARTS.save(_partitions_path(path), parts)
+    except Exception as e:
+        print("[ROLLUPS SAVE ERROR]", e)
+
+
+def _snapshot_path(path: str) -> str:
+    """events.json → events.bin in bin-modus."""
+    if SNAPSHOT_FORMAT == "bin":
+        return os.path.splitext(path)[0] + ".bin"
+    return path
+
+
+def _write_bin_snapshot(path: str, events, encode):
+    binsnap.dump(path, events, TZ)
+
+
+def _get_journal(path: str) -> EventJournal:
+    global _JOURNAL
+    snap = _snapshot_path(path)
+    if _JOURNAL is None or _JOURNAL.snapshot_path != snap:
+        if _JOURNAL is not None:
+            _JOURNAL.close()
+        kwargs = {"write_snapshot": _write_bin_snapshot} if SNAPSHOT_FORMAT == "bin" else {}
+        _JOURNAL = EventJournal(
+            snapshot_path=snap,
+            fsync_every=int(os.getenv("PX_FSYNC_EVERY", "50")),
+            fsync_interval=float(os.getenv("PX_FSYNC_INTERVAL", "2.0")),
+            compact_after=int(os.getenv("PX_COMPACT_AFTER", "5000")),
+            **kwargs,
+        )
+    return _JOURNAL
+
+
+def encode_event(e: Dict[str, Any]) -> Dict[str, Any]:
+    """Event → JSON-veilige dict (timestamp als ISO-string)."""
+    item = dict(e)
+    ts = item.get("timestamp")
+    if isinstance(ts, datetime):
+        item["timestamp"] = ts.isoformat()
+    return item
+
+
+def _epoch(e: Dict[str, Any]) -> float:
+    ts = e.get("timestamp")
+    if isinstance(ts, datetime):
+        return ts.timestamp()
+    return float("-inf")
+
+
+def _to_epoch(t) -> Optional[float]:
+    if t is None or isinstance(t, float):
+        return t
+    if isinstance(t, datetime):
+        return t.timestamp()
+    return float(t)
+
+
+def decode_event(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-dict → event (timestamp als tz-aware datetime)."""
+    item = dict(raw)
+    ts = item.get("timestamp")
+    if isinstance(ts, str):
+        try:
+            ts_dt = datetime.fromisoformat(ts)
+        except Exception:
+            ts_dt = datetime.now(TZ)
+        if ts_dt.tzinfo is None:
+            ts_dt = ts_dt.replace(tzinfo=TZ)
+        item["timestamp"] = ts_dt
+    return item
+
+
+def _clear_events():
+    EVENTS.clear()
+    if _OWN_TS:
+        del _TS[:]
+    SPECIES.clear()
+    PARTS.clear_segments()
+    _rewritten()
+
+
+def _snapshot_events():
+    """Consistente kopie voor achtergrond-threads (onder _LOCK aanroepen)."""
+    if isinstance(EVENTS, ColumnarEvents):
+        return EVENTS.copy()
+    return list(EVENTS)
 
 
 def load_events(path: str = "events.json"):
-    """Laad events.json in geheugen (EVENTS) zonder de lijst-reference te breken."""
-    global EVENTS
+    """
+    Laad events in geheugen (EVENTS) zonder de lijst-reference te breken.
+    Snapshot (events.json) + journal worden na elkaar teruggespeeld.
+    """
+    store = get_store()
+    if store is not None:
+        # sqlite: niets in geheugen laden, queries gaan naar SQL
+        _clear_events()
+        _PENDING.clear()
+        ROLLING.reset()
+        PARTS.reset()
+        DEDUP.clear()
+        now = datetime.now(TZ)
+        for e in store.iter_range(now - timedelta(seconds=DEDUP.ttl)):
+            if e.get("key"):
+                DEDUP.add(e["key"], _epoch(e), added=_epoch(e))
+            if e["timestamp"] >= now - timedelta(hours=24):
+                ROLLING.add(e)
+                PARTS.rolling_add(e)
+        _recover_archive(path)
+        total = store.count()
+        _load_rollups(path, total, store.iter_range)
+        print(f"[EVENTS] sqlite: {total} records in {store.path}")
+        _bump()
+        return EVENTS
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        journal = _get_journal(path)
+        tail = journal.replay_tail()
 
         # BELANGRIJK: niet EVENTS = [], maar clear() + extend()
-        EVENTS.clear()
-
-        for e in raw:
-            item = dict(e)
-            ts = item.get("timestamp")
-            if isinstance(ts, str):
-                try:
-                    ts_dt = datetime.fromisoformat(ts)
-                except Exception:
-                    ts_dt = datetime.now(TZ)
-                if ts_dt.tzinfo is None:
-                    ts_dt = ts_dt.replace(tzinfo=TZ)
-                item["timestamp"] = ts_dt
-            EVENTS.append(item)
+        _clear_events()
+        _PENDING.clear()
+        PARTS.reset()
+
+        # 1. snapshot (al uniek en chronologisch)
+        imported = False
+        if SNAPSHOT_FORMAT == "bin" and os.path.exists(journal.snapshot_path):
+            if isinstance(EVENTS, ColumnarEvents) and not ARCHIVE.unpurged():
+                # snelste pad: kolommen rechtstreeks in EVENTS (mmap + memcpy)
+                binsnap.load_into(EVENTS, journal.snapshot_path)
+                base = None
+            else:
+                base = binsnap.load_dicts(journal.snapshot_path, TZ)
+        else:
+            base = [decode_event(e) for e in _read_json(path)]
+            imported = SNAPSHOT_FORMAT == "bin" and bool(base)
+
+        # 2. journal: zelfde key = laatste versie wint, tombstones wissen
+        items, drop = apply_tail(tail, decode_event)
+        if drop:
+            if base is None:
+                _drop_keys(drop)
+            else:
+                base = [e for e in base if e.get("key") not in drop]
+
+        if base is not None:
+            items = base + items
+            recovered = _recover_archive(path, items)
+            if recovered is not None:
+                items = recovered
+        else:
+            recovered = None
+
+        # stabiel sorteren: embeds met oudere timestamp kunnen later binnenkomen
+        items.sort(key=_epoch)
+        if not EVENTS:
+            EVENTS.extend(items)
+            if _OWN_TS:
+                _TS.extend(_epoch(e) for e in items)
+            items = []
+        for item in items:
+            # enkel na een binaire snapshot: journal-tail invoegen
+            t = _epoch(item)
+            if not _TS or t >= _TS[-1]:
+                EVENTS.append(item)
+                if _OWN_TS:
+                    _TS.append(t)
+            else:
+                i = bisect_right(_TS, t)
+                EVENTS.insert(i, item)
+                if _OWN_TS:
+                    _TS.insert(i, t)
+
+        # 3. afgeleide indexen: enkel de vensters die ze nodig hebben
+        now = time.time()
+        ROLLING.reset()
+        columnar = isinstance(EVENTS, ColumnarEvents)
+        PARTS.build(EVENTS)
+        for e in EVENTS[bisect_left(_TS, now - ROLLING.window * 60):]:
+            e = dict(e) if columnar else e
+            ROLLING.add(e)
+            PARTS.rolling_add(e)
+        DEDUP.clear()
+        for e in EVENTS[bisect_left(_TS, now - DEDUP.ttl):]:
+            if e.get("key"):
+                DEDUP.add(e["key"], _epoch(e), added=_epoch(e))
+        dated = len(_TS) - bisect_right(_TS, float("-inf"))
+        if columnar:
+            SPECIES.build_columnar(EVENTS)
+        else:
+            SPECIES.build(EVENTS)
+        if columnar:
+            _load_rollups(path, dated, lambda: (dict(e) for e in EVENTS))
+        else:
+            _load_rollups(path, dated, lambda: EVENTS)
 
         print(f"[EVENTS] geladen: {len(EVENTS)} records")
-    except FileNotFoundError:
-        print("[EVENTS] events.json niet gevonden, start leeg.")
-        EVENTS.clear()
+        if recovered is not None or imported:
+            # hot store opnieuw wegschrijven (zonder gearchiveerde events / als events.bin)
+            _flush_memory(path, compact=True)
+            ARCHIVE.mark_purged(ARCHIVE.unpurged())
     except Exception as e:
         print("[EVENT LOAD ERROR]", e)
-        EVENTS.clear()
+        _clear_events()
 
+    if not EVENTS:
+        print("[EVENTS] geen events gevonden, start leeg.")
+
+    _bump()
     return EVENTS
 
 
+def _read_json(path: str) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def _drop_keys(keys) -> int:
+    """Rijen met een key uit `keys` uit EVENTS halen (load, columnar snapshot)."""
+    if isinstance(EVENTS, ColumnarEvents):
+        idx = [i for i, x in enumerate(EVENTS._extra) if x and x.get("key") in keys]
+    else:
+        idx = [i for i, e in enumerate(EVENTS) if e.get("key") in keys]
+    for i in reversed(idx):
+        del EVENTS[i]
+        if _OWN_TS:
+            del _TS[i]
+    if idx:
+        _rewritten()
+    return len(idx)
+
+
+def _save_full(path: str):
+    """Oude modus: volledige snapshot herschrijven."""
+    with _LOCK:
+        snapshot = _snapshot_events()
+        _PENDING.clear()
+    raw = [encode_event(e) for e in snapshot]
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(raw, f, ensure_ascii=False)
+
+    # journal zit nu volledig in de snapshot
+    jpath = journal_path_for(path)
+    for p in (jpath, jpath + ".compacting"):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def _take_pending() -> List[Dict[str, Any]]:
+    with _LOCK:
+        batch = list(_PENDING)
+        _PENDING.clear()
+    return batch
+
+
 def save_events(path: str = "events.json"):
-    """Schrijf EVENTS terug naar disk."""
+    """
+    Persisteer nieuwe events.
+    In journal-modus kost dit O(nieuwe events), niet O(volledige historiek).
+    Thread-safe: wordt normaal vanuit de persist-worker aangeroepen.
+    """
     try:
-        raw = []
-        for e in EVENTS:
-            item = dict(e)
-            ts = item.get("timestamp")
-            if isinstance(ts, datetime):
-                item["timestamp"] = ts.isoformat()
-            raw.append(item)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(raw, f, ensure_ascii=False)
+        store = get_store()
+        if store is not None:
+            batch = _take_pending()
+            if batch:
+                store.insert_many(e for e in batch if DELETED not in e)
+                store.delete_many(e[DELETED] for e in batch if DELETED in e)
+            save_rollups(path)
+            _maybe_retain(path)
+            return
+
+        _flush_memory(path)
+        save_rollups(path)
+        _maybe_retain(path)
     except Exception as e:
         print("[EVENT SAVE ERROR]", e)
 
 
+def _flush_memory(path: str, compact: bool = False):
+    """json/journal-modus: pending events wegschrijven (compact=True: snapshot herschrijven)."""
+    if STORAGE_MODE == "json":
+        _save_full(path)
+        return
+
+    journal = _get_journal(path)
+    if compact:
+        journal.wait_compaction()
+    with _LOCK:
+        batch = list(_PENDING)
+        _PENDING.clear()
+        # snapshot in dezelfde lock: alles daarin zit ofwel in de
+        # geroteerde journal, ofwel in deze batch
+        snapshot = _snapshot_events() if compact or journal.needs_compaction() else None
+
+    if batch:
+        journal.append(encode_event(e) for e in batch)
+    if snapshot is not None:
+        journal.compact(snapshot, encode_event, background=not compact)
+
+
+# ---- Retentie / archief ----------------------------------------------
+
+def _ident(e: Dict[str, Any]):
+    """Identiteit van een event over encode/decode heen (ook zonder key)."""
+    return e.get("key"), _epoch(e), e.get("type"), e.get("name")
+
+
+def retention_cutoff(now: Optional[datetime] = None) -> Optional[datetime]:
+    """Begin van de maand waarin nu - PX_RETENTION_DAYS valt (None = retentie uit)."""
+    if RETENTION_DAYS <= 0:
+        return None
+    # minstens 2 dagen: de 24h-tellers en /recent_shinies lezen de hot store
+    t = (now or datetime.now(TZ)).astimezone(TZ) - timedelta(days=max(RETENTION_DAYS, 2))
+    return t.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _purge_hot(idents, upto: float) -> int:
+    """Onder _LOCK: events met een ident uit `idents` (ts <= upto) uit EVENTS halen."""
+    k = bisect_right(_TS, upto)
+    # laat binnengekomen oude events die (nog) niet gearchiveerd zijn blijven staan
+    keep = [dict(e) for e in EVENTS[:k] if _ident(e) not in idents]
+    del EVENTS[:k]
+    if _OWN_TS:
+        del _TS[:k]
+    for j, e in enumerate(keep):
+        EVENTS.insert(j, e)
+        if _OWN_TS:
+            _TS.insert(j, _epoch(e))
+    SPECIES.prune(upto, keep)
+    PARTS.prune(upto, keep)
+    if k:
+        _rewritten()
+    return k - len(keep)
+
+
+def _recover_archive(path: str, items: Optional[List[Dict[str, Any]]] = None):
+    """
+    Segmenten met purged=false (crash tijdens retentie): hun events alsnog
+    uit de hot store halen. Geeft in geheugenmodus de opgeschoonde items
+    terug (None = niets te doen).
+    """
+    pending = ARCHIVE.unpurged()
+    if not pending:
+        return None
+    print(f"[ARCHIVE] herstel: {len(pending)} segment(en) nog niet uit de hot store verwijderd")
+    store = get_store()
+    if store is not None:
+        for seg in pending:
+            store.delete_before(seg["cutoff"], seg["max_id"])
+        ARCHIVE.mark_purged(pending)
+        return None
+    idents = {_ident(e) for seg in pending for e in ARCHIVE.read_segment(seg, decode_event)}
+    return [e for e in items if _ident(e) not in idents]
+
+
+def apply_retention(path: str = "events.json", now: Optional[datetime] = None) -> int:
+    """
+    Hot events vóór retention_cutoff() naar maand-segmenten verplaatsen.
+    Draait in de persist-thread; geeft het aantal gearchiveerde events terug.
+    """
+    cutoff = retention_cutoff(now)
+    if cutoff is None:
+        return 0
+    t_cut = cutoff.timestamp()
+
+    store = get_store()
+    if store is not None:
+        low = store.min_ts()
+        if low is None or low >= t_cut:
+            return 0
+        max_id = store.max_id()
+        entries = ARCHIVE.write(
+            store.iter_range(None, cutoff, max_id=max_id), encode_event,
+            cutoff=t_cut, max_id=max_id,
+        )
+        ARCHIVE.commit(entries)
+        store.delete_before(cutoff, max_id)
+    else:
+        with _LOCK:
+            k = bisect_left(_TS, t_cut)
+            if k == 0:
+                return 0
+            old = EVENTS.slice(0, k) if isinstance(EVENTS, ColumnarEvents) else EVENTS[:k]
+        # schrijven buiten de lock: add_event blijft doorlopen
+        entries = ARCHIVE.write(old, encode_event, cutoff=t_cut)
+        ARCHIVE.commit(entries)
+        with _LOCK:
+            _purge_hot({_ident(e) for e in old}, t_cut)
+        _flush_memory(path, compact=True)
+
+    ARCHIVE.mark_purged(entries)
+    n = sum(e["count"] for e in entries)
+    print(f"[ARCHIVE] {n} events vóór {cutoff.date()} → {len(entries)} segment(en)")
+    return n
+
+
+def _maybe_retain(path: str):
+    global _RETENTION_CHECKED
+    if RETENTION_DAYS <= 0:
+        return
+    now = time.monotonic()
+    if _RETENTION_CHECKED is not None and now - _RETENTION_CHECKED < RETENTION_CHECK:
+        return
+    _RETENTION_CHECKED = now
+    apply_retention(path)
+
+
+def close_events():
+    """Alles flushen en fsyncen (shutdown). Idempotent: ook atexit roept dit."""
+    global _STORE, _JOURNAL
+    try:
+        if _STORE is not None:
+            save_events()
+            save_rollups(force=True)
+            _STORE.close()
+            _STORE = None
+        if _JOURNAL is not None:
+            if _PENDING:
+                save_events(_JOURNAL.snapshot_path)
+            save_rollups(_JOURNAL.snapshot_path, force=True)
+            _JOURNAL.close()
+            _JOURNAL = None
+    except Exception as e:
+        print("[EVENT CLOSE ERROR]", e)
+
+
+atexit.register(close_events)
+
+
 def add_event(event: Dict[str, Any]):
-    """Event toevoegen aan globale lijst."""
-    EVENTS.append(event)
+    """
+    Event toevoegen (in sqlite-modus enkel naar de store).
+    EVENTS blijft gesorteerd: een embed met oudere timestamp wordt via
+    bisect op de juiste plaats ingevoegd.
+    """
+    with _LOCK:
+        _insert(event, get_store() is None)
+        ROLLING.add(event)
+        _bump()
+
+
+def add_events(events: List[Dict[str, Any]]):
+    """Bulk-variant van add_event (ingest-batches): één lock en één versie-bump."""
+    if not events:
+        return
+    with _LOCK:
+        memory = get_store() is None
+        for event in events:
+            _insert(event, memory)
+            ROLLING.add(event)
+        _bump()
+
 
+def _insert(event: Dict[str, Any], memory: bool):
+    """Onder _LOCK: event in EVENTS (gesorteerd), pending en indexen."""
+    if memory:
+        t = _epoch(event)
+        if not _TS or t >= _TS[-1]:
+            EVENTS.append(event)
+            if _OWN_TS:
+                _TS.append(t)
+        else:
+            i = bisect_right(_TS, t)
+            EVENTS.insert(i, event)
+            if _OWN_TS:
+                _TS.insert(i, t)
+            _rewritten()
+        SPECIES.add(event)
+    PARTS.add(event, memory)
+    _PENDING.append(event)
+    if event.get("key"):
+        DEDUP.add(event["key"], _epoch(event))
+    ROLLUPS.add(event)
 
-def last_24h(events):
-    """Filter: enkel laatste 24 uur."""
+
+def _find_key(key: str) -> Optional[int]:
+    """Index van het event met deze key in EVENTS (bisect op de timestamp)."""
+    t = DEDUP.event_ts(key)
+    if t is not None:
+        i = bisect_left(_TS, t)
+        while i < len(_TS) and _TS[i] == t:
+            if EVENTS[i].get("key") == key:
+                return i
+            i += 1
+    # niet (meer) in de index: van achter naar voor zoeken
+    for i in range(len(EVENTS) - 1, -1, -1):
+        if EVENTS[i].get("key") == key:
+            return i
+    return None
+
+
+def replace_event(old_key: str, event: Optional[Dict[str, Any]]) -> bool:
+    """
+    Vervang het event met `old_key` door `event` (ge-edit embed);
+    event=None verwijdert het. False als het oude event niet bestaat.
+    """
+    store = get_store()
+    with _LOCK:
+        if store is None:
+            i = _find_key(old_key)
+            if i is None:
+                return False
+            old = dict(EVENTS[i])
+            del EVENTS[i]
+            if _OWN_TS:
+                del _TS[i]
+            SPECIES.remove(old)
+            _rewritten()
+        else:
+            old = next((e for e in _PENDING if e.get("key") == old_key), None) or store.get(old_key)
+            if old is None:
+                return False
+        PARTS.remove(old, store is None)
+        if event is None or event.get("key") != old_key:
+            _PENDING.append({DELETED: old_key})
+        ROLLUPS.remove(old)
+        ROLLING.remove(old)
+        _bump()
+    if event is not None:
+        add_event(event)
+    return True
+
+
+def _bounds(start, end):
+    lo = 0 if start is None else bisect_left(_TS, _to_epoch(start))
+    hi = len(_TS) if end is None else bisect_left(_TS, _to_epoch(end))
+    return lo, hi
+
+
+def iter_events(start=None, end=None, type: Optional[str] = None,
+                parts: Optional[List[Partition]] = None):
+    """
+    Events met start <= timestamp < end (grenzen optioneel), oplopend,
+    gestreamd uit de actieve opslag (SQL in sqlite-modus, samen met de
+    nog niet geflushte events). Gearchiveerde maand-segmenten worden enkel geopend als het bereik ze raakt.
+    parts: enkel deze partities (select_partitions), None = alles.
+    """
+    lo, hi = _to_epoch(start), _to_epoch(end)
+    if ARCHIVE.overlapping(lo, hi):
+        yield from heapq.merge(
+            _archived(lo, hi, type, parts),
+            _iter_hot(start, end, type, parts),
+            key=_epoch,
+        )
+    else:
+        yield from _iter_hot(start, end, type, parts)
+
+
+def _archived(lo, hi, type: Optional[str] = None, parts: Optional[List[Partition]] = None):
+    rows = ARCHIVE.iter_range(decode_event, lo, hi, type)
+    if parts is None:
+        return rows
+    keys = {p.key for p in parts}
+    return (e for e in rows if part_key(e) in keys)
+
+
+def _pending_between(lo, hi, type: Optional[str] = None, keys=None) -> List[Dict[str, Any]]:
+    """sqlite: nog niet geflushte events (write-behind) in [lo, hi), oplopend."""
+    with _LOCK:
+        rows = [
+            e for e in _PENDING
+            if DELETED not in e
+            and (lo is None or _epoch(e) >= lo) and (hi is None or _epoch(e) < hi)
+            and (type is None or e.get("type") == type)
+            and (keys is None or part_key(e) in keys)
+        ]
+    rows.sort(key=_epoch)
+    return rows
+
+
+def _iter_hot(start=None, end=None, type: Optional[str] = None,
+              parts: Optional[List[Partition]] = None):
+    store = get_store()
+    if store is not None:
+        keys = None if parts is None else [p.key for p in parts]
+        pending = _pending_between(_to_epoch(start), _to_epoch(end), type, keys)
+        rows = store.iter_range(start, end, type, parts=keys)
+        yield from heapq.merge(rows, pending, key=_epoch) if pending else rows
+        return
+
+    if parts is not None:
+        # enkel de segmenten van de gekozen partities
+        lo, hi = _to_epoch(start), _to_epoch(end)
+        with _LOCK:
+            slices = PARTS.rows(parts, lo, hi)
+        rows = PARTS.iter_rows(slices)
+    else:
+        with _LOCK:
+            lo, hi = _bounds(start, end)
+            if isinstance(EVENTS, ColumnarEvents):
+                # views op een bevroren kopie: veilig vanuit een worker-thread
+                rows = EVENTS.slice(lo, hi)
+            else:
+                rows = EVENTS[lo:hi]
+    for e in rows:
+        if type is None or e.get("type") == type:
+            yield e
+
+
+def events_between(start=None, end=None, type: Optional[str] = None,
+                   parts: Optional[List[Partition]] = None) -> List[Dict[str, Any]]:
+    """
+    Algemene range-query: bisect + slice i.p.v. elke event te checken.
+    start/end: datetime of epoch-seconden, None = open grens.
+    """
+    store = get_store()
+    if store is None:
+        return list(iter_events(start, end, type, parts))
+
+    # sqlite: nog niet geflushte events meenemen (write-behind)
+    lo, hi = _to_epoch(start), _to_epoch(end)
+    keys = None if parts is None else {p.key for p in parts}
+    pending = _pending_between(lo, hi, type, keys)
+    rows = store.range(start, end, type, None if keys is None else list(keys))
+    if ARCHIVE.overlapping(lo, hi):
+        rows = list(heapq.merge(_archived(lo, hi, type, parts), rows, key=_epoch))
+    if pending:
+        rows.extend(pending)
+        rows.sort(key=_epoch)
+    return rows
+
+
+def species_stats(name: str, start=None, end=None, top: int = 5) -> SpeciesStats:
+    """
+    /species: tellers + beste IV's voor één species in [start, end).
+    Kost O(events van die species in het venster): inverted index in
+    geheugen, (name, ts)-index in sqlite-modus. Gearchiveerde maanden
+    worden enkel gelezen als het venster ze raakt.
+    """
+    lo, hi = _to_epoch(start), _to_epoch(end)
+    # forms vallen onder hun basis: oude historiek bewaart ze onder de basisnaam
+    names = species_aliases(name)
+    canon = names[0]
+    out = SpeciesStats(canon)
+    key = SPECIES.key(canon)
+
+    if ARCHIVE.overlapping(lo, hi):
+        archived = (e for e in ARCHIVE.iter_range(decode_event, lo, hi) if SPECIES.key(e.get("name")) == key)
+        stats_from_events(canon, archived, top, out)
+
+    store = get_store()
+    if store is None:
+        with _LOCK:
+            return SPECIES.stats(canon, lo, hi, top, out)
+
+    with _LOCK:
+        pending = [
+            e for e in _PENDING
+            if DELETED not in e and SPECIES.key(e.get("name")) == key
+            and (lo is None or _epoch(e) >= lo) and (hi is None or _epoch(e) < hi)
+        ]
+    stats_from_events(canon, store.by_name(names, start, end), top, out)
+    return stats_from_events(canon, pending, top, out)
+
+
+def select_partitions(account: Optional[str] = None, channel: Optional[int] = None) -> Optional[List[Partition]]:
+    """Partities voor /summary en /csv; None als er niet gefilterd wordt (= alles)."""
+    if account is None and channel is None:
+        return None
+    with _LOCK:
+        return PARTS.select(account, channel)
+
+
+def summary_view(period: str = "24h", parts: Optional[List[Partition]] = None) -> Snapshot:
+    """
+    Snapshot (totals/latest) voor build_embed. Zonder partities de
+    globale ROLLING/ROLLUPS, anders de samengevoegde partitie-aggregaten.
+    Genomen onder _LOCK: de render mag daarna in een worker-thread lopen.
+    """
+    with _LOCK:
+        if parts is None:
+            return Snapshot.of(ROLLING if period == "24h" else ROLLUPS.view(period))
+        return Snapshot.of(PARTS.view(parts, period))
+
+
+def window_view(minutes: Optional[int], n: int = 5, now: Optional[float] = None) -> Snapshot:
+    """
+    /api/summary: snapshot over de laatste `minutes` minuten (None = all-time).
+    Binnen het rolling-venster per minuut, langer via de uur-/dag-rollups.
+    """
+    now = time.time() if now is None else now
+    with _LOCK:
+        if minutes is not None and minutes <= ROLLING.window:
+            t = ROLLING.totals(now, minutes=minutes)
+            rows = {w: ROLLING.latest(w, n, now, minutes=minutes) for w in LATEST}
+        else:
+            # lange vensters: uur-resolutie aan de rand
+            cutoff = None if minutes is None else now - minutes * 60
+            t = ROLLUPS.totals_since(cutoff, now)
+            t.pop("events", None)
+            rows = {w: ROLLUPS.latest_since(w, cutoff, n) for w in LATEST}
+    return Snapshot(t, rows)
+
+
+def iv_stats(start=None, end=None) -> IVStats:
+    """
+    /ivstats: IV-verdeling, vangstratio per soort en heatmap in [start, end).
+    Geheugenmodus: numpy-kolommen van de hot store, enkel nieuwe rijen
+    worden omgezet. sqlite of een venster in het archief: kolommen voor
+    enkel dat venster. Zonder numpy: ivstats_py over iter_events.
+    """
+    lo, hi = _to_epoch(start), _to_epoch(end)
+    if not HAVE_NUMPY:
+        return ivstats_py(events_between(start, end), TZ)
+    if get_store() is not None or ARCHIVE.overlapping(lo, hi):
+        return ivstats_np(Columns.from_events(events_between(start, end)), TZ)
+
+    with _LOCK:
+        gen = _REWRITES
+        base = ANALYTICS.base(gen, len(EVENTS))
+        # bevroren kopie / lijst-slice: omzetten gebeurt buiten de lock
+        rows = EVENTS.slice(base, len(EVENTS)) if isinstance(EVENTS, ColumnarEvents) else EVENTS[base:]
+    cols = ANALYTICS.update(rows, base, gen)
+    return ivstats_np(cols.window(lo, hi), TZ)
+
+
+def last_24h(events=None, type: Optional[str] = None):
+    """Filter: enkel laatste 24 uur (optioneel één event-type)."""
     cutoff = datetime.now(TZ) - timedelta(hours=24)
+
+    if events is None or events is EVENTS:
+        return events_between(cutoff, None, type)
+
     return [
         e for e in events
         if isinstance(e.get("timestamp"), datetime) and e["timestamp"] >= cutoff
+        and (type is None or e.get("type") == type)
     ]
 
 
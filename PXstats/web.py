@@ -0,0 +1,318 @@
+# PXstats • web.py • v6.3
+# Asyncio HTTP-server op de event loop van discord.py
+# (vervangt de keep-alive HTTPServer-thread).
+#
+#   /              health check (Render)
+#   /metrics       Prometheus, zie metrics.py
+#   /api/summary   ?window=24h            tellers uit utils.ROLLING
+#                  (langer, bvb. 7d/30d/all: uur-/dag-rollups uit utils.ROLLUPS)
+#   /api/events    ?from=&to=&type=&limit=
+#   /debug/...     profiler, tracemalloc, loop-lag (debug.py); enkel als
+#                  PX_DEBUG_TOKEN gezet is, met Authorization: Bearer <token>
+#       /debug                 lopende sessies
+#       /debug/profile         ?seconds=10&mode=cprofile|sample&top=40
+#       /debug/memory          ?action=snapshot|diff|stop&top=40
+#       /debug/loop            ?seconds=10&threshold_ms=100&top=40
+#
+# API-antwoorden krijgen een ETag op basis van de ingest-versie en de
+# huidige minuut: If-None-Match → 304 zonder iets te berekenen, en zolang
+# de ETag niet verandert komt de body uit een kleine cache.
+# Dashboards die elke paar seconden pollen scannen EVENTS dus niet opnieuw.
+
+import asyncio
+import hmac
+import json
+import os
+import re
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from PXstats import debug, metrics
+from PXstats.aggregates import LATEST
+from PXstats.stats import encounter_count
+from PXstats.utils import TZ, encode_event, ingest_version, iter_events, window_view
+
+PORT = int(os.getenv("PORT", "10000"))
+MAX_EVENTS = int(os.getenv("PX_API_MAX_EVENTS", "10000"))
+DEBUG_TOKEN = os.getenv("PX_DEBUG_TOKEN", "").strip()
+CACHE_SIZE = 64
+HEADER_LIMIT = 16 * 1024
+READ_TIMEOUT = 10.0
+
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 401: "Unauthorized",
+            404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+            500: "Internal Server Error"}
+
+JSON_TYPE = "application/json; charset=utf-8"
+TEXT_TYPE = "text/plain; charset=utf-8"
+
+# (route + query) → (etag, body)
+_CACHE: Dict[str, Tuple[str, bytes]] = {}
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class BadRequest(ValueError):
+    pass
+
+
+# ======================================================
+# Query-parsing
+# ======================================================
+
+_WINDOW_RE = re.compile(r"^\s*(\d+)\s*([mhd])\s*$", re.I)
+_UNIT_MIN = {"m": 1, "h": 60, "d": 1440}
+
+
+def parse_window(s: Optional[str]) -> Optional[int]:
+    """'90m', '1h', '24h', '7d' → minuten; 'all' → None."""
+    if (s or "").strip().lower() == "all":
+        return None
+    m = _WINDOW_RE.match(s or "24h")
+    if not m:
+        raise BadRequest("window: gebruik bvb. 30m, 6h, 24h, 7d of all")
+    minutes = int(m.group(1)) * _UNIT_MIN[m.group(2).lower()]
+    if minutes <= 0:
+        raise BadRequest("window moet positief zijn")
+    return minutes
+
+
+def parse_time(s: Optional[str]) -> Optional[datetime]:
+    """ISO-datum/-tijd (zonder tz = TZ) of epoch-seconden."""
+    if not s:
+        return None
+    s = s.strip()
+    try:
+        return datetime.fromtimestamp(float(s), TZ)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        raise BadRequest(f"ongeldige tijd: {s!r}")
+    return dt if dt.tzinfo else dt.replace(tzinfo=TZ)
+
+
+def _arg(q: Dict[str, list], name: str) -> Optional[str]:
+    v = q.get(name)
+    return v[0] if v else None
+
+
+# ======================================================
+# Routes
+# ======================================================
+
+def _json(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def _cached(
+    cache_key: str,
+    etag: str,
+    headers: Dict[str, str],
+    build: Callable[[], Awaitable[bytes]],
+) -> Response:
+    out = {"Content-Type": JSON_TYPE, "ETag": etag, "Cache-Control": "no-cache"}
+    if etag in (t.strip() for t in headers.get("if-none-match", "").split(",")):
+        return 304, out, b""
+
+    hit = _CACHE.get(cache_key)
+    if hit is not None and hit[0] == etag:
+        return 200, out, hit[1]
+
+    body = await build()
+    if len(_CACHE) >= CACHE_SIZE:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[cache_key] = (etag, body)
+    return 200, out, body
+
+
+async def api_summary(q: Dict[str, list], headers: Dict[str, str]) -> Response:
+    minutes = parse_window(_arg(q, "window"))
+    # venster schuift elke minuut op, ook zonder nieuwe events
+    etag = f'"s{ingest_version()}-{int(time.time() // 60)}-{minutes}"'
+
+    async def build() -> bytes:
+        snap = window_view(minutes)
+        t = snap.totals()
+        latest = {w: [encode_event(e) for e in snap.latest(w)] for w in LATEST}
+        return _json({
+            "window_minutes": minutes,
+            "generated_at": datetime.now(TZ).isoformat(timespec="seconds"),
+            "version": ingest_version(),
+            "encounters": encounter_count(t),
+            "totals": t,
+            "latest": latest,
+        })
+
+    return await _cached(f"summary?{minutes}", etag, headers, build)
+
+
+async def api_events(q: Dict[str, list], headers: Dict[str, str]) -> Response:
+    start = parse_time(_arg(q, "from"))
+    end = parse_time(_arg(q, "to"))
+    etype = _arg(q, "type")
+    try:
+        limit = min(int(_arg(q, "limit") or 1000), MAX_EVENTS)
+    except ValueError:
+        raise BadRequest("limit moet een getal zijn")
+
+    etag = f'"e{ingest_version()}"'
+    norm = urlencode(sorted((k, v[0]) for k, v in q.items()))
+
+    def render() -> bytes:
+        # streamen: nooit meer dan limit + 1 events ophalen (+1 = afgekapt?)
+        rows = list(islice(iter_events(start, end, etype), limit + 1))
+        return _json({
+            "count": min(len(rows), limit),
+            "truncated": len(rows) > limit,
+            "version": ingest_version(),
+            "events": [encode_event(e) for e in rows[:limit]],
+        })
+
+    async def build() -> bytes:
+        # range-query + JSON-encoding buiten de event loop
+        return await asyncio.to_thread(render)
+
+    return await _cached(f"events?{norm}", etag, headers, build)
+
+
+def _int(q: Dict[str, list], name: str, default: int) -> int:
+    try:
+        return int(_arg(q, name) or default)
+    except ValueError:
+        raise BadRequest(f"{name} moet een getal zijn")
+
+
+def _authorized(headers: Dict[str, str]) -> bool:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.strip().encode(), DEBUG_TOKEN.encode())
+
+
+async def _debug(headers: Dict[str, str], run: Callable[[], Awaitable[debug.Report]]) -> Response:
+    """Gemeenschappelijk voor /debug/*: token, Busy → 409, rapport als text/plain."""
+    if not _authorized(headers):
+        return 401, {"Content-Type": JSON_TYPE, "WWW-Authenticate": "Bearer"}, _json({"error": "unauthorized"})
+    try:
+        report = await run()
+    except debug.Busy as e:
+        return 409, {"Content-Type": JSON_TYPE}, _json({"error": str(e)})
+    except ValueError as e:
+        raise BadRequest(str(e))
+    out = {
+        "Content-Type": TEXT_TYPE,
+        "Content-Disposition": f'inline; filename="{report.filename}"',
+        "Cache-Control": "no-store",
+    }
+    return 200, out, report.encode()
+
+
+async def debug_status(q, headers) -> Response:
+    async def run():
+        active = debug.active()
+        return debug.Report("status", "", "actief: " + (", ".join(active) or "niets") + "\n")
+
+    return await _debug(headers, run)
+
+
+async def debug_profile(q, headers) -> Response:
+    seconds, mode, top = _arg(q, "seconds") or 10, _arg(q, "mode") or "cprofile", _int(q, "top", debug.TOP)
+    return await _debug(headers, lambda: debug.profile(seconds, mode, top))
+
+
+async def debug_memory(q, headers) -> Response:
+    action, top = _arg(q, "action") or "snapshot", _int(q, "top", debug.TOP)
+    return await _debug(headers, lambda: debug.MEMORY.run(action, top))
+
+
+async def debug_loop(q, headers) -> Response:
+    seconds, threshold, top = _arg(q, "seconds") or 10, _int(q, "threshold_ms", 100), _int(q, "top", debug.TOP)
+    return await _debug(headers, lambda: debug.loop_report(seconds, threshold, top))
+
+
+async def health(q, headers) -> Response:
+    return 200, {"Content-Type": "text/plain"}, b"OK"
+
+
+async def prometheus(q, headers) -> Response:
+    return 200, {"Content-Type": metrics.CONTENT_TYPE}, metrics.render().encode("utf-8")
+
+
+ROUTES: Dict[str, Callable[[Dict[str, list], Dict[str, str]], Awaitable[Response]]] = {
+    "/": health,
+    "/metrics": prometheus,
+    "/api/summary": api_summary,
+    "/api/events": api_events,
+}
+
+# zonder token bestaan de debug-routes niet (404)
+if DEBUG_TOKEN:
+    ROUTES.update({
+        "/debug": debug_status,
+        "/debug/profile": debug_profile,
+        "/debug/memory": debug_memory,
+        "/debug/loop": debug_loop,
+    })
+
+
+# ======================================================
+# HTTP/1.1 (minimaal: GET/HEAD, één request per connectie)
+# ======================================================
+
+async def _dispatch(method: str, target: str, headers: Dict[str, str]) -> Response:
+    if method not in ("GET", "HEAD"):
+        return 405, {"Allow": "GET, HEAD"}, b""
+    url = urlsplit(target)
+    handler = ROUTES.get(url.path.rstrip("/") or "/")
+    if handler is None:
+        return 404, {"Content-Type": JSON_TYPE}, _json({"error": "not found"})
+    try:
+        return await handler(parse_qs(url.query), headers)
+    except BadRequest as e:
+        return 400, {"Content-Type": JSON_TYPE}, _json({"error": str(e)})
+    except Exception as e:
+        print("[WEB ERROR]", e)
+        return 500, {"Content-Type": JSON_TYPE}, _json({"error": "internal error"})
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        try:
+            raw = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), READ_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            return
+
+        lines = raw.decode("latin-1").split("\r\n")
+        parts = lines[0].split()
+        if len(parts) != 3:
+            return
+        method, target, _ = parts
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        status, out, body = await _dispatch(method, target, headers)
+
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+        head += [f"{k}: {v}" for k, v in out.items()]
+        head += [f"Content-Length: {len(body)}", "Connection: close", "", ""]
+        writer.write("\r\n".join(head).encode("latin-1"))
+        if method != "HEAD" and status != 304:
+            writer.write(body)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start(host: str = "0.0.0.0", port: int = PORT) -> asyncio.AbstractServer:
+    """Start de server op de lopende loop (bvb. vóór bot.start())."""
+    server = await asyncio.start_server(_handle, host, port, limit=HEADER_LIMIT)
+    print(f"[WEB] luistert op {host}:{port}")
+    return server
@@ -0,0 +1,99 @@
+# PXstats • benchmarks/bench_analytics.py
+# /ivstats: pure-Python loop (ivstats_py) vs numpy-kolommen (ivstats_np)
+# over een 30-dagen venster, plus de kost van materialiseren en van een
+# incrementele refresh na nieuwe events.
+#
+# Gebruik:
+#   python benchmarks/bench_analytics.py [--events N] [--days D]
+#   (default 1_000_000 events over 90 dagen)
+#
+# Beide varianten moeten exact hetzelfde resultaat geven.
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from synth import gen_events  # noqa: E402
+
+from PXstats.analytics import HAVE_NUMPY, Columns, IVAnalytics, ivstats_np, ivstats_py  # noqa: E402
+from PXstats.columnar import ColumnarEvents  # noqa: E402
+from PXstats.utils import TZ  # noqa: E402
+
+REPEAT = 5
+
+
+def _time(fn, repeat: int = REPEAT):
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times), out
+
+
+def _same(a, b) -> bool:
+    da, db = a.to_dict(), b.to_dict()
+    for k in ("mean",):
+        if (da[k] is None) != (db[k] is None) or (da[k] is not None and abs(da[k] - db[k]) > 1e-9):
+            return False
+    if da["percentiles"].keys() != db["percentiles"].keys() or any(
+            abs(da["percentiles"][p] - db["percentiles"][p]) > 1e-9 for p in da["percentiles"]):
+        return False
+    skip = ("mean", "percentiles")
+    return all(da[k] == db[k] for k in da if k not in skip)
+
+
+def main(n: int, days: float):
+    if not HAVE_NUMPY:
+        sys.exit("numpy niet geïnstalleerd")
+    t0 = time.perf_counter()
+    events = list(gen_events(n, days=days))
+    print(f"events: {n:,} over {days:g} dagen (aangemaakt in {time.perf_counter() - t0:.1f} s)")
+    start = (datetime.now(TZ) - timedelta(days=30)).timestamp()
+    lo = bisect_left([e["timestamp"].timestamp() for e in events], start)
+    print(f"venster 30d: {n - lo:,} events")
+
+    rows = []
+    py_s, ref = _time(lambda: ivstats_py(events[lo:], TZ), repeat=1)
+    rows.append(("python loop (venster)", py_s))
+
+    mat_s, cols = _time(lambda: Columns.from_events(events), repeat=1)
+    rows.append(("materialiseren (dicts)", mat_s))
+
+    columnar = ColumnarEvents(tz=TZ)
+    columnar.extend(events)
+    col_s, cols2 = _time(lambda: Columns.from_columnar(columnar))
+    rows.append(("materialiseren (columnar)", col_s))
+
+    np_s, res = _time(lambda: ivstats_np(cols.window(start), TZ))
+    rows.append(("numpy query (venster)", np_s))
+    assert _same(ref, res), "numpy ≠ python (dict-kolommen)"
+    assert _same(ref, ivstats_np(cols2.window(start), TZ)), "numpy ≠ python (columnar)"
+
+    # incrementeel: 1000 nieuwe events achteraan
+    an = IVAnalytics()
+    an.update(events, 0, 0)
+    last = events[-1]["timestamp"]
+    new = [dict(e, timestamp=last + timedelta(seconds=i + 1)) for i, e in enumerate(events[:1000])]
+    inc_s, _ = _time(lambda: an.update(new, an.base(0, n + len(new)), 0), repeat=1)
+    rows.append(("refresh +1000 events", inc_s))
+    assert an.rebuilds == 1 and an.appends == 1
+
+    print(f"{'stap':<28} {'ms':>10} {'vs python':>10}")
+    for name, s in rows:
+        print(f"{name:<28} {s * 1000:>10.1f} {py_s / s:>9.1f}x")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="/ivstats: numpy vs pure python")
+    ap.add_argument("--events", type=int, default=1_000_000, help="aantal events")
+    ap.add_argument("--days", type=float, default=90.0, help="historiek in dagen")
+    args = ap.parse_args()
+    main(args.events, args.days)
@@ -0,0 +1,101 @@
+# PXstats • benchmarks/bench_backfill.py
+# /backfill zonder Discord: FakeChannel speelt synthetische feed-berichten
+# af zoals channel.history() (pagina's van 100, met een kleine wachttijd).
+#
+# Gebruik:
+#   python benchmarks/bench_backfill.py [--messages N] [--workers W]
+#   (default 50_000 berichten, workers = PX_BACKFILL_WORKERS / cpu_count)
+#
+# Alle data (events.json, journal, events.db, archive/) komt in een
+# tijdelijke werkmap: nooit de events.json uit de huidige map.
+#
+# Draait twee keer op hetzelfde kanaal: de tweede run moet alles als
+# dubbel herkennen (0 nieuwe events).
+
+import argparse
+import asyncio
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+# vóór de PXstats-import: utils leest PX_DB_PATH / PX_ARCHIVE_DIR bij import.
+# atexit is LIFO: deze opruiming loopt na de laatste flush van PXstats.
+WORKDIR = tempfile.mkdtemp(prefix="px-backfill-")
+atexit.register(shutil.rmtree, WORKDIR, True)
+os.environ["PX_DB_PATH"] = os.path.join(WORKDIR, "events.db")
+os.environ["PX_ARCHIVE_DIR"] = os.path.join(WORKDIR, "archive")
+
+import discord  # noqa: E402
+from synth import gen_embed_dicts  # noqa: E402
+
+from PXstats import utils  # noqa: E402
+from PXstats.backfill import WORKERS, backfill  # noqa: E402
+from PXstats.utils import TZ  # noqa: E402
+
+
+class FakeMessage:
+    def __init__(self, id: int, embeds: List[Any], created_at: datetime, author: str = "PolygonX"):
+        self.id = id
+        self.embeds = embeds
+        self.created_at = created_at
+        self.author = author
+
+
+class FakeChannel:
+    """Stand-in voor discord.TextChannel: enkel history() en name."""
+
+    def __init__(self, messages: List[FakeMessage], name: str = "fake-feed", page: int = 100, latency: float = 0.0):
+        self.messages = messages
+        self.name = name
+        self.page = page
+        self.latency = latency
+
+    async def history(self, limit=None, after=None, oldest_first=True):
+        rows = [m for m in self.messages if after is None or m.created_at > after]
+        rows.sort(key=lambda m: m.created_at, reverse=not oldest_first)
+        if limit is not None:
+            rows = rows[:limit]
+        for i, m in enumerate(rows):
+            if i % self.page == 0:
+                await asyncio.sleep(self.latency)   # één API-call per pagina
+            yield m
+
+
+def fake_channel(n: int, latency: float = 0.0) -> FakeChannel:
+    now = datetime.now(TZ)
+    msgs = []
+    for i, d in enumerate(gen_embed_dicts(n)):
+        msgs.append(FakeMessage(
+            10_000_000 + i,
+            [discord.Embed.from_dict(d)],
+            datetime.fromisoformat(d["timestamp"]) if d.get("timestamp") else now - timedelta(seconds=n - i),
+        ))
+    return FakeChannel(msgs, latency=latency)
+
+
+async def main(n: int, workers: int):
+    channel = fake_channel(n)
+    since = datetime.now(TZ) - timedelta(days=30)
+    print(f"berichten: {n:,}, workers: {workers}")
+    for run in (1, 2):
+        stats = await backfill(channel, since, progress=lambda s: print("  …", s.line()), workers=workers)
+        print(f"run {run}: {stats.events:,} nieuwe events, {stats.duplicates:,} dubbel, "
+              f"{stats.rate():,.0f} berichten/s (parse {stats.parse_s:.1f} cpu-s)")
+    assert stats.events == 0, "tweede run zou alles als dubbel moeten herkennen"
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="/backfill throughput op een fake kanaal")
+    ap.add_argument("--messages", type=int, default=50_000, help="aantal feed-berichten")
+    ap.add_argument("--workers", type=int, default=WORKERS, help="parse-workers")
+    args = ap.parse_args()
+    os.chdir(WORKDIR)
+    utils.load_events(os.path.join(WORKDIR, "events.json"))
+    asyncio.run(main(args.messages, args.workers))
@@ -0,0 +1,449 @@
+# PXstats • benchmarks/bench_e2e.py
+# End-to-end loadtest: de echte handlers uit PXstats.main (on_message,
+# /summary, /csv) en de HTTP-server (web.py) op één event loop, zonder
+# token of netwerk.
+#
+# Stand-ins voor discord.py-objecten (geen gateway):
+#   FakeUser / FakeGuild / FakeChannel / FakeMessage   berichten van feeders
+#   FakeInteraction (response.defer + followup.send)   slash commands
+# Embeds zijn echte discord.Embed's (synth.gen_embed_dicts).
+#
+# Gemeten:
+#   ingest lag     on_message → event opgeslagen (utils.add_events)
+#   commands       aanroep → eerste followup.send, per command
+#   http           GET / en /api/summary (health check / dashboards)
+#   loop stall     te laat wakker worden van een 10 ms-ticker
+#
+# Gebruik:
+#   python benchmarks/bench_e2e.py                          50 embeds/s, 5 feeders, 30 s
+#   python benchmarks/bench_e2e.py --rate 200 --burst 10 --history 1M
+#   python benchmarks/bench_e2e.py --max-lag-ms 500 --max-stall-ms 100   exit 1 bij overschrijding
+#
+# Draait in een tijdelijke map (events.json met --history events); PX_*
+# uit de omgeving gelden zoals in productie (bvb. PX_STORAGE=sqlite).
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import discord  # noqa: E402
+from discord import app_commands  # noqa: E402
+from synth import gen_embed_dicts, gen_events  # noqa: E402
+
+from PXstats.utils import TZ, encode_event  # noqa: E402
+
+STALL_TICK = 0.01
+ERROR_WORDS = ("mis", "Fout")
+
+
+def _size(s: str) -> int:
+    s = s.strip().lower()
+    mult = {"k": 1_000, "m": 1_000_000}.get(s[-1:], 1)
+    return int(float(s.rstrip("km")) * mult)
+
+
+def _pct(sorted_ms: List[float], p: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    i = min(len(sorted_ms) - 1, int(round(p / 100 * (len(sorted_ms) - 1))))
+    return sorted_ms[i]
+
+
+def _summarize(ms: List[float]) -> Dict[str, float]:
+    ms = sorted(ms)
+    return {
+        "n": len(ms),
+        "p50_ms": round(_pct(ms, 50), 2),
+        "p95_ms": round(_pct(ms, 95), 2),
+        "p99_ms": round(_pct(ms, 99), 2),
+        "max_ms": round(ms[-1], 2) if ms else 0.0,
+    }
+
+
+# ------------------------------------------------------------------
+# Stand-ins voor discord.py
+# ------------------------------------------------------------------
+
+class FakeUser:
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, id: int):
+        self.id = id
+
+
+class FakeChannel:
+    def __init__(self, id: int, name: str, guild: FakeGuild):
+        self.id = id
+        self.name = name
+        self.guild = guild
+        self.mention = f"<#{id}>"
+
+
+class FakeMessage:
+    def __init__(self, id: int, embeds: List[Any], author: FakeUser, channel: FakeChannel):
+        self.id = id
+        self.embeds = embeds
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.created_at = datetime.now(TZ)
+        self.content = ""
+
+    async def edit(self, **kwargs):
+        pass
+
+
+class _Response:
+    def __init__(self, inter: "FakeInteraction"):
+        self._inter = inter
+
+    async def defer(self, ephemeral: bool = False, thinking: bool = False):
+        self._inter.deferred = time.perf_counter()
+
+    async def send_message(self, content=None, **kwargs):
+        self._inter._sent(content, kwargs)
+
+
+class _Followup:
+    def __init__(self, inter: "FakeInteraction"):
+        self._inter = inter
+
+    async def send(self, content=None, *, wait: bool = False, **kwargs):
+        self._inter._sent(content, kwargs)
+        return FakeMessage(0, [], self._inter.user, self._inter.channel)
+
+
+class FakeInteraction:
+    """Genoeg van discord.Interaction voor de slash-command callbacks."""
+
+    def __init__(self, user: FakeUser, channel: FakeChannel):
+        self.user = user
+        self.channel = channel
+        self.guild = channel.guild
+        self.response = _Response(self)
+        self.followup = _Followup(self)
+        self.started = time.perf_counter()
+        self.deferred: Optional[float] = None
+        self.answered: Optional[float] = None
+        self.error = False
+        self.files = 0
+        self.bytes = 0
+
+    def _sent(self, content, kwargs):
+        if self.answered is None:
+            self.answered = time.perf_counter()
+        if content and any(w in content for w in ERROR_WORDS):
+            self.error = True
+        f = kwargs.get("file")
+        if f is not None:
+            self.files += 1
+            fp = f.fp
+            self.bytes += fp.seek(0, os.SEEK_END)
+            fp.seek(0)
+
+
+# ------------------------------------------------------------------
+# Harness
+# ------------------------------------------------------------------
+
+class Harness:
+    def __init__(self, bot, args):
+        self.bot = bot
+        self.args = args
+        self.rnd = random.Random(args.seed)
+        guild = FakeGuild(1)
+        self.channels = [FakeChannel(100 + i, f"feed-{i}", guild) for i in range(max(1, args.channels))]
+        self.feeders = [
+            (FakeUser(1000 + i, f"feeder{i}"), self.channels[i % len(self.channels)])
+            for i in range(args.feeders)
+        ]
+        self.admin = FakeUser(1, "admin")
+        self.embeds = gen_embed_dicts(10**9, seed=args.seed)
+        self.ids = itertools.count(50_000_000)
+
+        self.sent: Dict[int, float] = {}
+        self.lag_ms: List[float] = []
+        self.messages = 0
+        self.cmd_ms: Dict[str, List[float]] = defaultdict(list)
+        self.cmd_errors: Dict[str, int] = defaultdict(int)
+        self.csv_bytes = 0
+        self.http_ms: Dict[str, List[float]] = defaultdict(list)
+        self.http_errors = 0
+        self.stall_ms: List[float] = []
+        self._tasks: List[asyncio.Task] = []
+
+    # --- ingest-lag: add_events van de ingest-queue omwikkelen ---------
+
+    def trace_ingest(self):
+        from PXstats import ingest as ingest_mod
+
+        orig = ingest_mod.add_events
+
+        def traced(events):
+            orig(events)
+            t = time.perf_counter()
+            for e in events:
+                mid = int(str(e.get("key", "0")).split(":", 1)[0] or 0)
+                sent = self.sent.pop(mid, None)
+                if sent is not None:
+                    self.lag_ms.append((t - sent) * 1000)
+
+        ingest_mod.add_events = traced
+
+    # --- feeders ----------------------------------------------------
+
+    async def feeder(self, user: FakeUser, channel: FakeChannel, stop: float):
+        """rate/feeders embeds per seconde, in bursts van --burst berichten."""
+        loop = asyncio.get_running_loop()
+        interval = self.args.burst * len(self.feeders) / self.args.rate
+        nxt = loop.time() + self.rnd.random() * interval
+        while nxt < stop:
+            await asyncio.sleep(max(0.0, nxt - loop.time()))
+            for _ in range(self.args.burst):
+                d = next(self.embeds)
+                d["timestamp"] = datetime.now(TZ).isoformat()
+                msg = FakeMessage(next(self.ids), [discord.Embed.from_dict(d)], user, channel)
+                self.sent[msg.id] = time.perf_counter()
+                self.messages += 1
+                await self.bot.on_message(msg)
+            nxt += interval
+
+    # --- slash commands ---------------------------------------------
+
+    async def _command(self, name: str, callback, **kwargs):
+        inter = FakeInteraction(self.admin, self.channels[0])
+        try:
+            await callback(inter, **kwargs)
+        except Exception as e:
+            print(f"[E2E] /{name} exception: {e}")
+            inter.error = True
+        if inter.answered is None or inter.error:
+            self.cmd_errors[name] += 1
+        else:
+            self.cmd_ms[name].append((inter.answered - inter.started) * 1000)
+        self.csv_bytes += inter.bytes
+
+    def _summary_call(self):
+        period = self.rnd.choice(("24h", "24h", "7d", "30d", "all"))
+        kwargs: Dict[str, Any] = {"period": app_commands.Choice(name=period, value=period)}
+        r = self.rnd.random()
+        if r < 0.3:
+            kwargs["account"] = str(self.rnd.choice(self.feeders)[0])
+        elif r < 0.4:
+            kwargs["channel"] = self.rnd.choice(self.channels)
+        return self._command("summary", self.bot.summary_cmd.callback, **kwargs)
+
+    def _csv_call(self):
+        since = (datetime.now(TZ) - timedelta(days=self.args.csv_days)).strftime("%Y-%m-%d")
+        kwargs: Dict[str, Any] = {"since": since, "gzip": self.rnd.random() < 0.5}
+        if self.rnd.random() < 0.3:
+            kwargs["account"] = str(self.rnd.choice(self.feeders)[0])
+        return self._command("csv", self.bot.csv_cmd.callback, **kwargs)
+
+    async def commands(self, make, per_s: float, stop: float):
+        """Gelijktijdige aanroepen: elke call is een eigen task (zoals discord.py)."""
+        if per_s <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.rnd.expovariate(per_s))
+            if loop.time() >= stop:
+                return
+            self._tasks.append(loop.create_task(make()))
+
+    # --- HTTP (health check + dashboard-polling) ----------------------
+
+    async def http(self, port: int, per_s: float, stop: float):
+        if per_s <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        paths = itertools.cycle(("/", "/api/summary?window=24h", "/api/summary?window=7d"))
+        while loop.time() < stop:
+            await asyncio.sleep(1 / per_s)
+            path = next(paths)
+            t0 = time.perf_counter()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+                await writer.drain()
+                status = (await reader.readline()).split(b" ")[1]
+                await reader.read()
+                writer.close()
+                if status != b"200":
+                    self.http_errors += 1
+                    continue
+            except (OSError, IndexError):
+                self.http_errors += 1
+                continue
+            self.http_ms[path.split("?")[0]].append((time.perf_counter() - t0) * 1000)
+
+    # --- event loop ---------------------------------------------------
+
+    async def watch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            t = loop.time()
+            await asyncio.sleep(STALL_TICK)
+            self.stall_ms.append(max(0.0, loop.time() - t - STALL_TICK) * 1000)
+
+    # --- run ----------------------------------------------------------
+
+    async def run(self) -> Dict[str, Any]:
+        from PXstats import web
+
+        a = self.args
+        server = await web.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        self.bot.ingest.start()
+        self.trace_ingest()
+        watcher = asyncio.get_running_loop().create_task(self.watch_loop())
+
+        loop = asyncio.get_running_loop()
+        stop = loop.time() + a.duration
+        t0 = time.perf_counter()
+        async with server:
+            await asyncio.gather(
+                *(self.feeder(u, c, stop) for u, c in self.feeders),
+                self.commands(self._summary_call, a.summary, stop),
+                self.commands(self._csv_call, a.csv, stop),
+                self.http(port, a.http, stop),
+            )
+            # uitlopen: queue leeg, openstaande commands afwachten
+            await self.bot.ingest.stop(timeout=60)
+            await asyncio.gather(*self._tasks)
+        wall = time.perf_counter() - t0
+        watcher.cancel()
+
+        stalls = sorted(self.stall_ms)
+        return {
+            "config": {k: v for k, v in vars(a).items() if k not in ("out",)},
+            "wall_s": round(wall, 2),
+            "messages": self.messages,
+            "ingested": len(self.lag_ms),
+            "not_stored": len(self.sent),
+            "ingest": self.bot.ingest.stats(),
+            "ingest_lag": _summarize(self.lag_ms),
+            "commands": {
+                name: {**_summarize(self.cmd_ms.get(name, [])), "errors": self.cmd_errors.get(name, 0)}
+                for name in sorted(set(self.cmd_ms) | set(self.cmd_errors))
+            },
+            "csv_mb": round(self.csv_bytes / 2**20, 2),
+            "http": {path: _summarize(ms) for path, ms in sorted(self.http_ms.items())},
+            "http_errors": self.http_errors,
+            "loop_stall": {
+                **_summarize(stalls),
+                "over_50ms": sum(1 for s in stalls if s > 50),
+                "stalled_s": round(sum(stalls) / 1000, 2),
+            },
+            "persist": self.bot.persist.stats(),
+        }
+
+
+# ------------------------------------------------------------------
+# Rapport
+# ------------------------------------------------------------------
+
+def report(r: Dict[str, Any]):
+    c = r["config"]
+    print(f"\n== {c['rate']:g} embeds/s, {c['feeders']} feeders, burst {c['burst']}, "
+          f"{c['duration']:g} s, historiek {c['history']:,} ==")
+    print(f"berichten: {r['messages']:,}  opgeslagen: {r['ingested']:,}  "
+          f"niet opgeslagen (onherkend/dubbel/weggegooid): {r['not_stored']:,}  wall {r['wall_s']} s")
+
+    def row(name, s, extra=""):
+        print(f"  {name:<22} n={s['n']:>6}  p50 {s['p50_ms']:>8.1f}  p95 {s['p95_ms']:>8.1f}  "
+              f"p99 {s['p99_ms']:>8.1f}  max {s['max_ms']:>8.1f} ms{extra}")
+
+    row("ingest lag", r["ingest_lag"])
+    for name, s in r["commands"].items():
+        row(f"/{name}", s, f"  fouten {s['errors']}" if s["errors"] else "")
+    for path, s in r["http"].items():
+        row(f"GET {path}", s)
+    if r["http_errors"]:
+        print(f"  http-fouten: {r['http_errors']}")
+    s = r["loop_stall"]
+    row("loop stall", s, f"  >50ms: {s['over_50ms']}  totaal {s['stalled_s']} s")
+    ing = r["ingest"]
+    print(f"  ingest: {ing['batches']} batches (max {ing['max_batch']}), {ing['dropped']} weggegooid, "
+          f"{ing['duplicates']} dubbel  •  persist: {r['persist'].get('flushes', '-')} flushes")
+
+
+def _write_history(n: int):
+    if n <= 0:
+        return
+    t0 = time.perf_counter()
+    with open("events.json", "w", encoding="utf-8") as f:
+        json.dump([encode_event(e) for e in gen_events(n)], f)
+    print(f"historiek: {n:,} events ({time.perf_counter() - t0:.1f} s)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="PXstats end-to-end loadtest (zonder Discord)")
+    ap.add_argument("--rate", type=float, default=50, help="embeds per seconde (alle feeders samen)")
+    ap.add_argument("--feeders", type=int, default=5)
+    ap.add_argument("--channels", type=int, default=2, help="feed-kanalen (feeders verdeeld)")
+    ap.add_argument("--burst", type=int, default=1, help="berichten per feeder per keer")
+    ap.add_argument("--duration", type=float, default=30, help="seconden")
+    ap.add_argument("--history", type=_size, default=_size("100k"), help="bestaande events, bvb. 1M")
+    ap.add_argument("--summary", type=float, default=2, help="/summary-calls per seconde")
+    ap.add_argument("--csv", type=float, default=0.2, help="/csv-calls per seconde")
+    ap.add_argument("--csv-days", type=int, default=7, help="/csv since = vandaag - N dagen")
+    ap.add_argument("--http", type=float, default=5, help="HTTP-requests per seconde")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", help="resultaat als JSON")
+    ap.add_argument("--max-lag-ms", type=float, help="exit 1 als p99 ingest lag hierboven ligt")
+    ap.add_argument("--max-stall-ms", type=float, help="exit 1 als de langste loop stall hierboven ligt")
+    args = ap.parse_args()
+
+    if args.out:
+        args.out = os.path.abspath(args.out)
+    workdir = tempfile.mkdtemp(prefix="px-e2e-")
+    os.chdir(workdir)
+    os.environ.setdefault("PX_ROLLUP_SAVE_INTERVAL", "3600")
+    _write_history(args.history)
+
+    # pas hier: main laadt events.json uit de werkmap bij import
+    import PXstats.main as bot
+
+    try:
+        result = asyncio.run(Harness(bot, args).run())
+    finally:
+        bot.persist.stop()
+
+    report(result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, default=str)
+        print(f"\nresultaat → {args.out}")
+
+    failed = []
+    if args.max_lag_ms is not None and result["ingest_lag"]["p99_ms"] > args.max_lag_ms:
+        failed.append(f"p99 ingest lag {result['ingest_lag']['p99_ms']} ms > {args.max_lag_ms} ms")
+    if args.max_stall_ms is not None and result["loop_stall"]["max_ms"] > args.max_stall_ms:
+        failed.append(f"loop stall {result['loop_stall']['max_ms']} ms > {args.max_stall_ms} ms")
+    for f in failed:
+        print("FAIL:", f)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# PXstats • benchmarks/bench_memory.py
+# Geheugen: lijst van dicts vs ColumnarEvents.
+#
+# Gebruik:
+#   python benchmarks/bench_memory.py [--events N]   (default 1_000_000)
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synth import gen_events  # noqa: E402
+
+from PXstats.columnar import ColumnarEvents  # noqa: E402
+from PXstats.pokedex import species_names  # noqa: E402
+from PXstats.utils import TZ  # noqa: E402
+
+
+def measure(build):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    dt = time.perf_counter() - t0
+    cur, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, cur, peak, dt
+
+
+def main(n: int):
+    species_names()   # pokédex-tabel niet meetellen
+
+    def as_dicts():
+        return list(gen_events(n))
+
+    def as_columns():
+        c = ColumnarEvents(tz=TZ)
+        c.extend(gen_events(n))
+        return c
+
+    rows = []
+    for label, build in (("dict-list", as_dicts), ("columnar", as_columns)):
+        obj, cur, peak, dt = measure(build)
+        rows.append((label, cur, peak, dt))
+        del obj
+
+    print(f"events: {n:,}")
+    print(f"{'layout':<10} {'resident MB':>12} {'B/event':>8} {'peak MB':>9} {'build s':>8}")
+    for label, cur, peak, dt in rows:
+        print(f"{label:<10} {cur / 2**20:>12.1f} {cur / n:>8.0f} {peak / 2**20:>9.1f} {dt:>8.1f}")
+    print(f"ratio: {rows[0][1] / max(rows[1][1], 1):.1f}x kleiner")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="geheugen: dict-lijst vs columnar")
+    ap.add_argument("--events", type=int, default=1_000_000, help="aantal events")
+    main(ap.parse_args().events)
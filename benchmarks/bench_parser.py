@@ -0,0 +1,112 @@
+# PXstats • benchmarks/bench_parser.py
+# Regressie + throughput voor parse_polygonx_embed.
+#
+# - data/parser_corpus.jsonl: embeds + resultaat van de oude if-chain (v4.6);
+#   namen sinds pokedex v4.9 met hoofdletterongevoelige forms (p6-mx)
+# - controleert dat de rule-table classifier exact hetzelfde teruggeeft
+# - meet embeds/s voor de volledige parser en voor classify() vs de oude chain
+#
+# Gebruik:
+#   python benchmarks/bench_parser.py [--reps N]
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import discord  # noqa: E402
+
+from PXstats.parser import _norm, classify, parse_polygonx_embed  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "parser_corpus.jsonl")
+
+
+def legacy_type(full_norm: str):
+    """De if-chain van parser v4.6, enkel voor vergelijking."""
+    if "pokemon caught successfully" in full_norm or "pokemon caught" in full_norm:
+        return "Catch"
+    if "hatched egg" in full_norm or "hatch" in full_norm:
+        return "Hatch"
+    if "quest" in full_norm:
+        return "Quest"
+    if any(x in full_norm for x in ["rocket", "invasion encounter", "invasion", "grunt", "leader", "giovanni"]):
+        return "Rocket"
+    if "raid battle encounter" in full_norm or "raid" in full_norm:
+        return "Raid"
+    if any(x in full_norm for x in ["max battle", "bread battle", "complete bread battle",
+                                    "tera raid battle", "tera battle"]):
+        return "MaxBattle"
+    if any(x in full_norm for x in ["pokemon flee", "pokemon fled", "ran away", "fleed"]):
+        return "Fled"
+    if "encounter ping" in full_norm or "encounter!" in full_norm or "encounter" in full_norm:
+        return "Encounter"
+    return None
+
+
+def legacy_classify(full_norm: str):
+    """Type + source + shiny zoals v4.6 ze bepaalde: zelfde werk als classify()."""
+    src = "wild"
+    if "incense" in full_norm:
+        src = "incense"
+    elif "lure encounter" in full_norm or "lure" in full_norm:
+        src = "lure"
+    return legacy_type(full_norm), src, "shiny" in full_norm
+
+
+def load_corpus():
+    with open(CORPUS, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _full_norm(e):
+    full = f"{e.title or ''}\n{e.description or ''}\n" + "\n".join(f"{f.name}\n{f.value}" for f in e.fields)
+    return _norm(full)
+
+
+def check(corpus, embeds) -> int:
+    bad = 0
+    for case, e in zip(corpus, embeds):
+        etype, data = parse_polygonx_embed(e)
+        data = {k: (list(v) if isinstance(v, tuple) else v) for k, v in data.items()}
+        if etype != case["type"] or data != case["data"]:
+            bad += 1
+            print(f"[MISMATCH] {case['embed']!r}\n  verwacht {case['type']} {case['data']}\n  kreeg    {etype} {data}")
+    return bad
+
+
+def rate(fn, items, reps):
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        for x in items:
+            fn(x)
+    dt = time.perf_counter() - t0
+    return reps * len(items) / dt
+
+
+def main(reps: int = 20):
+    corpus = load_corpus()
+    embeds = [discord.Embed.from_dict(c["embed"]) for c in corpus]
+
+    bad = check(corpus, embeds)
+    print(f"regressie: {len(corpus) - bad}/{len(corpus)} identiek")
+
+    norms = [_full_norm(e) for e in embeds]
+    for x in norms:
+        if classify(x) != legacy_classify(x):
+            bad += 1
+            print(f"[MISMATCH classify] {x!r}")
+
+    print(f"parse_polygonx_embed : {rate(parse_polygonx_embed, embeds, reps):>10,.0f} embeds/s")
+    print(f"classify (tabel)     : {rate(classify, norms, reps * 5):>10,.0f} embeds/s")
+    print(f"if-chain (v4.6)      : {rate(legacy_classify, norms, reps * 5):>10,.0f} embeds/s")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="parser regressie + throughput")
+    ap.add_argument("--reps", type=int, default=20, help="herhalingen per meting")
+    sys.exit(main(ap.parse_args().reps))
@@ -0,0 +1,82 @@
+# PXstats • benchmarks/bench_startup.py
+# Startup: load_events() van een JSON-snapshot vs binaire events.bin.
+#
+# Elke variant draait in een apart proces (koude start, eigen RSS):
+#   snapshot json/bin × layout dict/columnar
+# De rollups worden vooraf weggeschreven zodat enkel het snapshot-pad
+# gemeten wordt (zoals bij een gewone herstart).
+#
+# Gebruik:
+#   python benchmarks/bench_startup.py [--events N]   (default 1_000_000)
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+from synth import gen_events  # noqa: E402
+
+from PXstats import binsnap  # noqa: E402
+from PXstats.utils import TZ, encode_event  # noqa: E402
+
+# Kind-proces: één load_events(), tijd + RSS als JSON op de laatste regel
+_CHILD = """
+import json, sys, time
+from PXstats import metrics, utils
+t0 = time.perf_counter()
+utils.load_events(sys.argv[1])
+dt = time.perf_counter() - t0
+if len(sys.argv) > 2:
+    utils.save_rollups(sys.argv[1], force=True)
+print(json.dumps({"n": len(utils.EVENTS), "s": dt, "rss": metrics.rss_bytes()}))
+"""
+
+
+def _run(workdir: str, snapshot: str, layout: str, warm: bool = False) -> dict:
+    env = dict(os.environ, PX_STORAGE="journal", PX_SNAPSHOT=snapshot, PX_LAYOUT=layout,
+               PX_RETENTION_DAYS="0", PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    args = [sys.executable, "-c", _CHILD, "events.json"] + (["warm"] if warm else [])
+    out = subprocess.run(args, cwd=workdir, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(n: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        events = list(gen_events(n))
+        with open(os.path.join(tmp, "events.json"), "w", encoding="utf-8") as f:
+            json.dump([encode_event(e) for e in events], f, ensure_ascii=False)
+        binsnap.dump(os.path.join(tmp, "events.bin"), events, TZ)
+        del events
+        print(f"events: {n:,} (aangemaakt in {time.perf_counter() - t0:.1f} s)")
+        for ext in ("json", "bin"):
+            size = os.path.getsize(os.path.join(tmp, f"events.{ext}"))
+            print(f"  events.{ext:<4} {size / 2**20:>8.1f} MB")
+
+        _run(tmp, "json", "dict", warm=True)
+
+        rows = []
+        for snapshot in ("json", "bin"):
+            for layout in ("dict", "columnar"):
+                r = _run(tmp, snapshot, layout)
+                assert r["n"] == n, r
+                rows.append((snapshot, layout, r["s"], r["rss"]))
+
+    print(f"{'snapshot':<9} {'layout':<9} {'load s':>8} {'RSS MB':>8} {'speedup':>8}")
+    base = {layout: s for snapshot, layout, s, _ in rows if snapshot == "json"}
+    for snapshot, layout, s, rss in rows:
+        print(f"{snapshot:<9} {layout:<9} {s:>8.2f} {rss / 2**20:>8.1f} {base[layout] / s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="startup: JSON-snapshot vs events.bin")
+    ap.add_argument("--events", type=int, default=1_000_000, help="aantal events")
+    main(ap.parse_args().events)
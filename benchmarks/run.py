@@ -0,0 +1,231 @@
+# PXstats • benchmarks/run.py
+# Benchmark-suite voor de hot paths, op productieschaal.
+#
+# Stages (per historiekgrootte):
+#   parse    parse_polygonx_embed op synthetische embeds
+#   load     load_events() van een snapshot met N events
+#   ingest   add_event + save_events per event (oude on_message-pad)
+#   last24h  last_24h() over de volledige historiek
+#   summary  build_embed() (rolling aggregates)
+#   csv      volledige export_csv()
+#
+# Per stage: throughput, p50/p99 latency en piek-geheugen (tracemalloc,
+# aparte run zodat de timing niet vertekend wordt).
+#
+# Gebruik:
+#   python benchmarks/run.py                         10k, 100k, 1M
+#   python benchmarks/run.py --sizes 10k,5M
+#   python benchmarks/run.py --save-baseline         resultaat → baseline.json
+#   python benchmarks/run.py --fail-on-regression    exit 1 bij regressie
+#
+# baseline.json staat bewust niet in git: timings hangen af van de machine.
+# CI maakt ze eerst op dezelfde runner met --save-baseline (bvb. op main,
+# als artefact bewaard) en vergelijkt daarna met --fail-on-regression.
+# Zonder baseline faalt --fail-on-regression (exit 2) in plaats van
+# stilletjes niets te vergelijken.
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import discord  # noqa: E402
+from synth import gen_embed_dicts, gen_events  # noqa: E402
+
+from PXstats import utils  # noqa: E402
+from PXstats.export import export_csv  # noqa: E402
+from PXstats.parser import parse_polygonx_embed  # noqa: E402
+from PXstats.stats import build_embed  # noqa: E402
+
+RESULTS = os.path.join(HERE, "results", "latest.json")
+BASELINE = os.path.join(HERE, "baseline.json")
+
+
+def _size(s: str) -> int:
+    s = s.strip().lower()
+    mult = {"k": 1_000, "m": 1_000_000}.get(s[-1:], 1)
+    return int(float(s.rstrip("km")) * mult)
+
+
+def _pct(sorted_ms: List[float], p: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    i = min(len(sorted_ms) - 1, int(round(p / 100 * (len(sorted_ms) - 1))))
+    return sorted_ms[i]
+
+
+def timed(fn: Callable[[], object], reps: int, items_per_rep: int = 1) -> Dict[str, float]:
+    lat = []
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        t = time.perf_counter()
+        fn()
+        lat.append((time.perf_counter() - t) * 1000)
+    total = time.perf_counter() - t0
+    lat.sort()
+    return {
+        "ops": reps,
+        "items_per_s": round(reps * items_per_rep / total, 1) if total else 0.0,
+        "p50_ms": round(_pct(lat, 50), 4),
+        "p99_ms": round(_pct(lat, 99), 4),
+    }
+
+
+def peak_mb(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 2**20, 2)
+
+
+# ------------------------------------------------------------------
+# Stages
+# ------------------------------------------------------------------
+
+def run_size(n: int, workdir: str, memory: bool) -> List[Dict]:
+    out = []
+    snap = os.path.join(workdir, f"events_{n}.json")
+
+    def record(stage, stats, mem_fn=None):
+        row = {"stage": stage, "size": n, **stats}
+        if memory and mem_fn is not None:
+            row["peak_mb"] = peak_mb(mem_fn)
+        out.append(row)
+        print(f"  {stage:<8} {row['items_per_s']:>14,.0f}/s  p50 {row['p50_ms']:>9.3f} ms"
+              f"  p99 {row['p99_ms']:>9.3f} ms  peak {row.get('peak_mb', '-')} MB")
+
+    # --- parse ------------------------------------------------------
+    k = min(n, 20_000)
+    embeds = [discord.Embed.from_dict(d) for d in gen_embed_dicts(k)]
+    it = iter(embeds * 2)
+    record("parse", timed(lambda: parse_polygonx_embed(next(it)), k),
+           lambda: [parse_polygonx_embed(e) for e in embeds[:2000]])
+
+    # --- load -------------------------------------------------------
+    with open(snap, "w", encoding="utf-8") as f:
+        json.dump([utils.encode_event(e) for e in gen_events(n)], f)
+    jpath = os.path.join(workdir, f"events_{n}.journal.jsonl")
+    record("load", timed(lambda: utils.load_events(snap), 1, n),
+           lambda: utils.load_events(snap))
+
+    # --- ingest -----------------------------------------------------
+    # nieuwe events komen "nu" binnen, na de volledige historiek
+    fresh = list(gen_events(2_000, seed=n, days=0.01))
+    it = iter(fresh)
+
+    def ingest_one():
+        utils.add_event(next(it))
+        utils.save_events(snap)
+
+    record("ingest", timed(ingest_one, 1_000),
+           lambda: [ingest_one() for _ in range(500)])
+    utils.close_events()
+    if os.path.exists(jpath):
+        os.remove(jpath)
+
+    # --- queries ----------------------------------------------------
+    reps = 200 if n <= 100_000 else 20
+    record("last24h", timed(utils.last_24h, reps), utils.last_24h)
+    record("summary", timed(build_embed, reps), build_embed)
+
+    def csv_once():
+        for _, fh, _ in export_csv():
+            fh.close()
+
+    record("csv", timed(csv_once, 1, len(utils.EVENTS)), csv_once if n <= 1_000_000 else None)
+
+    os.remove(snap)
+    return out
+
+
+# ------------------------------------------------------------------
+# Baseline-vergelijking
+# ------------------------------------------------------------------
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> int:
+    if not os.path.exists(baseline_path):
+        print(f"\n(geen baseline op {baseline_path})")
+        return 0
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = {(r["stage"], r["size"]): r for r in json.load(f)["results"]}
+
+    print(f"\nvergelijking met baseline (tolerantie {tolerance:.0%}):")
+    regressions = 0
+    for r in results:
+        b = base.get((r["stage"], r["size"]))
+        if not b or not b["items_per_s"]:
+            continue
+        ratio = r["items_per_s"] / b["items_per_s"]
+        flag = ""
+        if ratio < 1 - tolerance:
+            flag = "  ← REGRESSIE"
+            regressions += 1
+        print(f"  {r['stage']:<8} {r['size']:>9,}  {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description="PXstats benchmark-suite")
+    ap.add_argument("--sizes", default="10k,100k,1M", help="historiekgroottes, bvb. 10k,1M,5M")
+    ap.add_argument("--no-memory", action="store_true", help="sla tracemalloc-runs over")
+    ap.add_argument("--out", default=RESULTS)
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=0.2)
+    ap.add_argument("--fail-on-regression", action="store_true")
+    args = ap.parse_args()
+
+    if args.fail_on_regression and not args.save_baseline and not os.path.exists(args.baseline):
+        print(f"[BENCH] geen baseline op {args.baseline}: eerst --save-baseline draaien")
+        return 2
+
+    sizes = [_size(s) for s in args.sizes.split(",") if s.strip()]
+    workdir = tempfile.mkdtemp(prefix="pxbench-")
+    results: List[Dict] = []
+    try:
+        for n in sizes:
+            print(f"\n== historiek {n:,} events ==")
+            results.extend(run_size(n, workdir, memory=not args.no_memory))
+    finally:
+        utils.close_events()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    doc = {
+        "meta": {
+            "when": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "storage": utils.STORAGE_MODE,
+            "layout": utils.LAYOUT,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    print(f"\nresultaten: {args.out}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.out, args.baseline)
+        print(f"baseline bijgewerkt: {args.baseline}")
+        return 0
+
+    regressions = compare(results, args.baseline, args.tolerance)
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
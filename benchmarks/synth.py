@@ -0,0 +1,100 @@
+# PXstats • benchmarks/synth.py
+# Synthetische PolygonX/Spidey-data voor de benchmarks.
+#
+# - gen_embed_dicts(): embed-dicts (Embed.from_dict) voor alle event-types,
+#   met Pokémon-namen, p###- en p###-FORM-ID's, de "p 7/9/10"-glitch,
+#   shiny-varianten en met/zonder IV
+# - gen_events(): events zoals load_events ze in geheugen zet
+
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PXstats.pokedex import species_names  # noqa: E402
+from PXstats.pokedex_table import BASE, FORMS  # noqa: E402
+from PXstats.utils import TZ  # noqa: E402
+
+TYPES = ["Encounter"] * 6 + ["Catch"] * 3 + ["Fled", "Quest", "Raid", "Rocket", "MaxBattle", "Hatch"]
+SOURCES = ["wild", "wild", "wild", "incense", "lure"]
+
+# Titels zoals de feeders ze posten, per event-type
+TITLES = {
+    "Encounter": ["Encounter Ping", "Encounter!", "Wild Encounter"],
+    "Incense": ["Incense Encounter!"],
+    "Lure": ["Lure Encounter"],
+    "Catch": ["Pokémon caught successfully!", "Pokemon caught"],
+    "Fled": ["Pokémon fled", "The Pokémon ran away"],
+    "Quest": ["Quest Encounter"],
+    "Raid": ["Raid Battle Encounter"],
+    "Rocket": ["Rocket Invasion Encounter", "Grunt battle", "Giovanni"],
+    "MaxBattle": ["Max Battle", "Complete Bread Battle", "Tera Battle"],
+    "Hatch": ["Hatched Egg"],
+    "Other": ["Pokéstop spun", "Daily bonus"],
+}
+_KINDS = (["Encounter"] * 5 + ["Incense", "Lure"] + ["Catch"] * 3
+          + ["Fled", "Quest", "Raid", "Rocket", "MaxBattle", "Hatch", "Other"])
+
+
+def _species_text(rnd: random.Random, names) -> str:
+    r = rnd.random()
+    if r < 0.55:
+        return f"Pokemon: {rnd.choice(names)}"
+    if r < 0.75:
+        return f"p{rnd.randrange(1, len(BASE))}"
+    if r < 0.9:
+        num, form = rnd.choice(list(FORMS))
+        return f"p{num}-{form}"
+    if r < 0.95:
+        return f"p {rnd.randint(0, 15)}/{rnd.randint(0, 15)}/{rnd.randint(0, 15)}"
+    return "Pokemon: ???"
+
+
+def gen_embed_dicts(n: int, seed: int = 7) -> Iterator[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    names = species_names()
+    now = datetime.now(TZ)
+    for i in range(n):
+        kind = rnd.choice(_KINDS)
+        title = rnd.choice(TITLES[kind])
+        lines = [_species_text(rnd, names)]
+        if rnd.random() < 0.85:
+            lines.append(f"IV: {rnd.randint(0, 15)}/{rnd.randint(0, 15)}/{rnd.randint(0, 15)}")
+        if rnd.random() < 0.02:
+            lines.append("IV: 15/15/15")
+        if rnd.random() < 0.01:
+            title = "✨ Shiny " + title
+        lines.append(f"Level {rnd.randint(1, 50)} • CP {rnd.randint(10, 4000)}")
+        d = {
+            "title": title,
+            "description": "\n".join(lines),
+            "timestamp": (now - timedelta(seconds=n - i)).isoformat(),
+            "fields": [],
+        }
+        if rnd.random() < 0.3:
+            d["fields"].append({"name": "Account", "value": f"acc{rnd.randint(1, 5)}", "inline": True})
+        yield d
+
+
+def gen_events(n: int, seed: int = 42, days: float = 365.0) -> Iterator[Dict[str, Any]]:
+    """Realistische events, gelijk verdeeld over de laatste `days` dagen."""
+    rnd = random.Random(seed)
+    names = species_names()
+    start = datetime.now(TZ) - timedelta(days=days)
+    step = days * 86400 / max(n, 1)
+    for i in range(n):
+        etype = rnd.choice(TYPES)
+        e = {
+            "name": rnd.choice(names),
+            "iv": (rnd.randint(0, 15), rnd.randint(0, 15), rnd.randint(0, 15)),
+            "level": None,
+            "timestamp": start + timedelta(seconds=i * step),
+            "type": etype,
+        }
+        if etype == "Encounter":
+            e["source"] = rnd.choice(SOURCES)
+        e["shiny"] = rnd.random() < 0.01
+        yield e